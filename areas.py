@@ -0,0 +1,133 @@
+"""Área entre curvas partiendo [a, b] en los puntos de corte.
+
+Entre dos cortes consecutivos el orden de las curvas no cambia, así que
+máx(f) - mín(f) es suave en cada tramo y la cuadratura adaptativa converge
+con pocas evaluaciones (|f1 - f2| tiene un pico en cada corte). Los cortes
+de polinomios con coeficientes exactos se obtienen con SymPy; los demás se
+encierran con cambios de signo sobre una malla y se refinan con Brent.
+"""
+import math
+from collections import namedtuple
+from itertools import combinations
+import numpy as np
+from scipy.optimize import brentq
+from cuadratura import integrar, TOL_ABS, TOL_REL
+from instrumentos import fase
+
+Area = namedtuple('Area', ['valor', 'error', 'evaluaciones', 'cortes'])
+
+# Intervalos de la malla donde se buscan cambios de signo
+MUESTRAS_CORTES = 256
+
+def _preparar(funcion):
+    """(expresión de SymPy o None, función vectorizada) para un texto o una función."""
+    if isinstance(funcion, str):
+        from expresiones import compilar_expresion
+        compilada = compilar_expresion(funcion)
+        return compilada.expr, compilada.funcion
+    return None, funcion
+
+def _evaluar(f, x):
+    with np.errstate(all='ignore'):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), np.shape(x))
+
+def cortes_simbolicos(expr, variable, a, b):
+    """Raíces reales de expr en (a, b) si es un polinomio con coeficientes exactos; si no, None."""
+    import sympy as sp
+    if not expr.is_polynomial(variable):
+        return None
+    try:
+        poli = sp.Poly(expr, variable)
+    except sp.PolynomialError:
+        return None
+    if poli.is_zero:
+        return []
+    if poli.domain not in (sp.ZZ, sp.QQ):
+        return None
+    raices = (float(r) for r in poli.real_roots())
+    return sorted({r for r in raices if a < r < b})
+
+def cortes_numericos(g, a, b, muestras=MUESTRAS_CORTES):
+    """Raíces de g en (a, b): cambios de signo en una malla refinados con Brent.
+
+    Devuelve (raíces, evaluaciones). Los cambios de signo en polos (g enorme
+    en el punto hallado) se descartan.
+    """
+    x = np.linspace(a, b, muestras + 1)
+    y = _evaluar(g, x)
+    evaluaciones = x.size
+    raices = list(x[1:-1][y[1:-1] == 0])
+    validos = np.isfinite(y[:-1]) & np.isfinite(y[1:])
+    for i in np.nonzero(validos & (y[:-1] * y[1:] < 0))[0]:
+        contador = [0]
+        def escalar(t):
+            contador[0] += 1
+            return float(_evaluar(g, np.array([t]))[0])
+        r = brentq(escalar, x[i], x[i + 1], xtol=1e-15, rtol=4 * np.finfo(float).eps)
+        evaluaciones += contador[0]
+        if abs(escalar(r)) <= 1e-6 * (1 + abs(y[i]) + abs(y[i + 1])):
+            raices.append(r)
+    return sorted(raices), evaluaciones
+
+def cortes(funciones, a, b, muestras=MUESTRAS_CORTES):
+    """Puntos de (a, b) donde se cruzan dos cualesquiera de las funciones; devuelve (cortes, evaluaciones)."""
+    preparadas = [_preparar(f) for f in funciones]
+    encontrados = set()
+    evaluaciones = 0
+    for (expr1, f1), (expr2, f2) in combinations(preparadas, 2):
+        raices = None
+        if expr1 is not None and expr2 is not None:
+            variables = (expr1 - expr2).free_symbols
+            if len(variables) <= 1:
+                import sympy as sp
+                variable = variables.pop() if variables else sp.Symbol('x')
+                raices = cortes_simbolicos(sp.expand(expr1 - expr2), variable, a, b)
+        if raices is None:
+            raices, n = cortes_numericos(lambda x, f1=f1, f2=f2: f1(x) - f2(x), a, b, muestras)
+            evaluaciones += n
+        encontrados.update(raices)
+    return sorted(encontrados), evaluaciones
+
+def envolventes(funciones, x):
+    """(mínimo, máximo) punto a punto de las funciones en x."""
+    valores = np.stack([_evaluar(_preparar(f)[1], x) for f in funciones])
+    return valores.min(axis=0), valores.max(axis=0)
+
+def area_entre(funciones, a, b, metodo='gauss_kronrod', tol_abs=TOL_ABS, tol_rel=TOL_REL,
+               trabajadores=1):
+    """Área de la región entre la curva más alta y la más baja en [a, b].
+
+    Con dos funciones es ∫|f1 - f2|; cada tramo entre cortes se integra por
+    separado con el método adaptativo indicado.
+    """
+    if len(funciones) < 2:
+        raise ValueError("Se necesitan al menos dos funciones.")
+    a, b = float(a), float(b)
+    if a == b:
+        return Area(0.0, 0.0, 0, [])
+    if a > b:
+        a, b = b, a
+    with fase('cortes'):
+        puntos, evaluaciones = cortes(funciones, a, b)
+    numericas = [_preparar(f)[1] for f in funciones]
+
+    def altura(x):
+        valores = np.stack([_evaluar(f, x) for f in numericas])
+        return valores.max(axis=0) - valores.min(axis=0)
+
+    if trabajadores > 1:
+        from paralelo import integrar_paralelo as integrador
+        opciones = {'trabajadores': trabajadores}
+    else:
+        integrador, opciones = integrar, {}
+    bordes = [a] + puntos + [b]
+    valores, errores = [], []
+    for izq, der in zip(bordes[:-1], bordes[1:]):
+        # La tolerancia absoluta se reparte según la longitud del tramo
+        tol = tol_abs * (der - izq) / (b - a)
+        with fase('cuadratura'):
+            valor, error, n = integrador(altura, izq, der, metodo, tol, tol_rel, **opciones)
+        valores.append(valor)
+        errores.append(error)
+        evaluaciones += n
+    return Area(math.fsum(valores), math.fsum(errores), evaluaciones, puntos)
@@ -0,0 +1,29 @@
+"""Medición del tiempo de arranque por fases (python main.py --medir-arranque)."""
+import threading
+import time
+
+_inicio = time.perf_counter()
+_marcas = []
+_candado = threading.Lock()
+
+def marcar(fase):
+    """Registra el fin de una fase de arranque."""
+    with _candado:
+        _marcas.append((fase, time.perf_counter()))
+
+def fases():
+    """Nombres de las fases registradas hasta ahora."""
+    with _candado:
+        return {fase for fase, _ in _marcas}
+
+def informe():
+    """Texto con la duración de cada fase y el tiempo acumulado, en ms."""
+    with _candado:
+        marcas = sorted(_marcas, key=lambda m: m[1])
+    lineas = []
+    anterior = _inicio
+    for fase, instante in marcas:
+        lineas.append(f"{fase:<40} {1000 * (instante - anterior):8.1f} ms  "
+                      f"(total {1000 * (instante - _inicio):8.1f} ms)")
+        anterior = instante
+    return "\n".join(lineas)
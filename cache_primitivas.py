@@ -0,0 +1,191 @@
+import ast
+import os
+import sqlite3
+import threading
+import time
+import sympy as sp
+
+# Ubicación por defecto de la caché (se puede cambiar con CALCUINTEGRALES_CACHE)
+RUTA_CACHE = os.environ.get(
+    'CALCUINTEGRALES_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'calcuintegrales', 'primitivas.sqlite'))
+# Tamaño máximo en bytes de las primitivas guardadas
+MAX_BYTES = 64 * 1024 * 1024
+# Las entradas de otra versión de SymPy (o de otro formato) se descartan
+VERSION = f"1:{sp.__version__}"
+
+def _nombres_sympy():
+    """Clases y constantes de SymPy que pueden aparecer en un srepr."""
+    from sympy.functions.elementary.piecewise import ExprCondPair
+    nombres = {'ExprCondPair': ExprCondPair}
+    for nombre, objeto in vars(sp).items():
+        if isinstance(objeto, sp.Basic) or (isinstance(objeto, type) and issubclass(objeto, sp.Basic)):
+            nombres[nombre] = objeto
+    return nombres
+
+_NOMBRES = _nombres_sympy()
+
+# Clases cuyo srepr lleva textos (nombres o dígitos); el resto convertiría un
+# texto con sympify, es decir, con eval
+_CON_TEXTO = (sp.Symbol, sp.Dummy, sp.Wild, sp.Function, sp.Float)
+
+def _construir(nodo, texto=False):
+    if isinstance(nodo, ast.Constant) and isinstance(nodo.value, (int, float, bool, type(None))):
+        return nodo.value
+    if isinstance(nodo, ast.Constant) and isinstance(nodo.value, str) and texto:
+        return nodo.value
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub) and isinstance(nodo.operand, ast.Constant):
+        return -_construir(nodo.operand)
+    if isinstance(nodo, ast.Name) and nodo.id in _NOMBRES:
+        return _NOMBRES[nodo.id]
+    if isinstance(nodo, (ast.Tuple, ast.List)):
+        return tuple(_construir(elemento) for elemento in nodo.elts)
+    if isinstance(nodo, ast.Call):
+        # Solo constructores de SymPy (incluidas funciones indefinidas como Function('f'))
+        clase = _construir(nodo.func)
+        if isinstance(clase, type) and issubclass(clase, sp.Basic):
+            texto = clase in _CON_TEXTO
+            return clase(*[_construir(arg, texto) for arg in nodo.args],
+                         **{k.arg: _construir(k.value, texto) for k in nodo.keywords if k.arg})
+    raise ValueError(f"Elemento no permitido en la caché: {ast.dump(nodo)[:80]}")
+
+def leer_srepr(texto):
+    """Expresión de SymPy a partir de su srepr, sin eval (el archivo de caché no es de confianza)."""
+    return _construir(ast.parse(texto, mode='eval').body)
+
+class CachePrimitivas:
+    """Caché persistente de primitivas indefinidas, clave sp.srepr del integrando.
+
+    Usa SQLite en modo WAL, de modo que varios procesos pueden leer y escribir
+    a la vez; cada hilo tiene su propia conexión.
+    """
+
+    def __init__(self, ruta=RUTA_CACHE, max_bytes=MAX_BYTES):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        with self._conexion() as con:
+            con.execute("""CREATE TABLE IF NOT EXISTS primitivas (
+                               clave TEXT PRIMARY KEY,
+                               version TEXT NOT NULL,
+                               primitiva TEXT NOT NULL,
+                               tamano INTEGER NOT NULL,
+                               ultimo_uso REAL NOT NULL)""")
+            con.execute("CREATE INDEX IF NOT EXISTS uso ON primitivas (ultimo_uso)")
+            con.execute("DELETE FROM primitivas WHERE version != ?", (VERSION,))
+
+    def _conexion(self):
+        con = getattr(self._local, 'conexion', None)
+        if con is None:
+            con = sqlite3.connect(self.ruta, timeout=30, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexion = con
+        return _Transaccion(con)
+
+    @staticmethod
+    def clave(expr, variable):
+        return f"{sp.srepr(variable)}|{sp.srepr(expr)}"
+
+    def obtener(self, expr, variable):
+        """Primitiva guardada de expr respecto a variable, o None."""
+        clave = self.clave(expr, variable)
+        with self._conexion() as con:
+            fila = con.execute("SELECT primitiva FROM primitivas WHERE clave = ? AND version = ?",
+                               (clave, VERSION)).fetchone()
+            if fila is None:
+                return None
+            con.execute("UPDATE primitivas SET ultimo_uso = ? WHERE clave = ?", (time.time(), clave))
+        try:
+            return leer_srepr(fila[0])
+        except (ValueError, TypeError, SyntaxError, RecursionError):
+            # Entrada dañada o ajena: se recalcula y se sobrescribe
+            return None
+
+    def guardar(self, expr, variable, primitiva):
+        texto = sp.srepr(primitiva)
+        with self._conexion() as con:
+            con.execute("INSERT OR REPLACE INTO primitivas VALUES (?, ?, ?, ?, ?)",
+                        (self.clave(expr, variable), VERSION, texto, len(texto), time.time()))
+            self._desalojar(con)
+
+    def _desalojar(self, con):
+        """Borra las entradas menos usadas hasta quedar por debajo de max_bytes."""
+        total = con.execute("SELECT COALESCE(SUM(tamano), 0) FROM primitivas").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        exceso = total - self.max_bytes
+        liberado = 0
+        claves = []
+        for clave, tamano in con.execute("SELECT clave, tamano FROM primitivas ORDER BY ultimo_uso"):
+            claves.append((clave,))
+            liberado += tamano
+            if liberado >= exceso:
+                break
+        con.executemany("DELETE FROM primitivas WHERE clave = ?", claves)
+
+    def limpiar(self):
+        with self._conexion() as con:
+            con.execute("DELETE FROM primitivas")
+
+    def primitiva(self, expr, variable):
+        """Primitiva indefinida de expr, desde la caché o calculada y guardada."""
+        resultado = self.obtener(expr, variable)
+        if resultado is None:
+            resultado = sp.integrate(expr, variable)
+            self.guardar(expr, variable, resultado)
+        return resultado
+
+    def integral_definida(self, expr, variable, a, b):
+        """∫_a^b expr por la regla de Barrow con la primitiva en caché.
+
+        Devuelve None cuando no es aplicable (primitiva sin forma cerrada o
+        integrando discontinuo en [a, b]); en ese caso hay que usar sp.integrate.
+        """
+        a, b = sp.sympify(a), sp.sympify(b)
+        if not (a.is_finite and b.is_finite):
+            return None
+        # Primero la continuidad: si falla no vale la pena calcular la primitiva
+        intervalo = sp.Interval(sp.Min(a, b), sp.Max(a, b))
+        try:
+            dominio = sp.calculus.util.continuous_domain(expr, variable, intervalo)
+        except Exception:
+            return None
+        if dominio != intervalo:
+            return None
+        F = self.primitiva(expr, variable)
+        if F.has(sp.Integral, sp.Piecewise):
+            return None
+        return self._evaluar(F, variable, b) - self._evaluar(F, variable, a)
+
+    @staticmethod
+    def _evaluar(F, variable, punto):
+        valor = F.subs(variable, punto)
+        if valor.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+            valor = sp.limit(F, variable, punto)
+        return valor
+
+class _Transaccion:
+    """Transacción inmediata: serializa las escrituras entre procesos."""
+
+    def __init__(self, con):
+        self.con = con
+
+    def __enter__(self):
+        self.con.execute("BEGIN IMMEDIATE")
+        return self.con
+
+    def __exit__(self, tipo, valor, traza):
+        self.con.execute("COMMIT" if tipo is None else "ROLLBACK")
+
+_cache = None
+
+def cache_compartida():
+    """Instancia de la caché por proceso, creada al primer uso."""
+    global _cache
+    if _cache is None:
+        _cache = CachePrimitivas(RUTA_CACHE)
+    return _cache
@@ -4,6 +4,10 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 import sympy as sp
 import numpy as np
+from expresiones import compilar_expresion
+from muestreo import muestrear
+from nucleo import integral_simbolica
+from precision import integral_precisa, limite_numerico, texto
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -21,6 +25,9 @@ class MainWindow(QMainWindow):
         self.label_lim_sup = QLabel("Límite superior:")
         self.entrada_lim_sup = QLineEdit("1")
         
+        self.label_dps = QLabel("Dígitos (0 = precisión doble):")
+        self.entrada_dps = QLineEdit("0")
+        
         self.boton_calcular = QPushButton("Calcular Integral")
         self.boton_calcular.clicked.connect(self.calcular_y_graficar)
         
@@ -34,6 +41,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.entrada_lim_inf)
         layout.addWidget(self.label_lim_sup)
         layout.addWidget(self.entrada_lim_sup)
+        layout.addWidget(self.label_dps)
+        layout.addWidget(self.entrada_dps)
         layout.addWidget(self.boton_calcular)
         layout.addWidget(self.label_resultado)
         
@@ -48,25 +57,31 @@ class MainWindow(QMainWindow):
     
     def calcular_y_graficar(self):
         funcion = self.entrada_funcion.text()
-        lim_inf = float(self.entrada_lim_inf.text())
-        lim_sup = float(self.entrada_lim_sup.text())
         
         x = sp.symbols('x')
         try:
-            f = sp.sympify(funcion)
-            integral = sp.integrate(f, (x, lim_inf, lim_sup))
+            # Límites tal como se escribieron ('1/3', 'pi'); float solo para el gráfico
+            texto_inf, texto_sup = self.entrada_lim_inf.text(), self.entrada_lim_sup.text()
+            lim_inf, lim_sup = limite_numerico(texto_inf), limite_numerico(texto_sup)
+            dps = int(self.entrada_dps.text() or 0)
+            f_numeric = compilar_expresion(funcion, x).funcion
+            if dps > 0:
+                # Alta precisión: límites tal como se escribieron (sin pasar por float)
+                integral = integral_precisa(funcion, texto_inf, texto_sup, dps)
+                resultado = texto(integral.valor, dps)
+            else:
+                integral = integral_simbolica(funcion, texto_inf, texto_sup)
+                resultado = f"{integral.valor:.6f}"
             
             # Limpiar gráfico anterior
             self.ax.clear()
             
             # Generar datos
-            x_vals = np.linspace(lim_inf, lim_sup, 400)
-            f_numeric = sp.lambdify(x, f, 'numpy')
-            y_vals = f_numeric(x_vals)
+            x_vals, y_vals = muestrear(f_numeric, lim_inf, lim_sup, self.canvas.width())
             
             # Dibujar
             self.ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'$f(x) = {funcion}$')
-            self.ax.fill_between(x_vals, y_vals, color='skyblue', alpha=0.4, label=f'Área ≈ {integral.evalf():.4f}')
+            self.ax.fill_between(x_vals, y_vals, color='skyblue', alpha=0.4, label=f'Área ≈ {float(integral.valor):.4f}')
             self.ax.set_xlabel('x')
             self.ax.set_ylabel('f(x)')
             self.ax.legend()
@@ -74,7 +89,7 @@ class MainWindow(QMainWindow):
             self.ax.set_title(f'Integral de ${funcion}$ entre ${lim_inf}$ y ${lim_sup}$')
             
             self.canvas.draw()
-            self.label_resultado.setText(f"Resultado: {integral.evalf():.6f}")
+            self.label_resultado.setText(f"Resultado: {resultado} ({integral.metodo})")
         except Exception as e:
             self.label_resultado.setText(f"Error: {str(e)}")
 
@@ -0,0 +1,81 @@
+"""Generador de carga para servidor.py: mide peticiones por segundo y latencias.
+
+Ejemplo: python carga.py --peticiones 20000 --concurrencia 64 --ruta /simpson
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+EXPRESIONES = ['sin(x)', 'x**2 + 3*x', 'exp(-x**2)', 'cos(3*x)*exp(x)', 'log(1 + x)', 'sqrt(x)']
+
+async def _peticion(lector, escritor, host, ruta, cuerpo):
+    datos = json.dumps(cuerpo).encode('utf-8')
+    escritor.write(f"POST {ruta} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {len(datos)}\r\n\r\n".encode('latin-1') + datos)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    largo = 0
+    while True:
+        linea = await lector.readline()
+        if linea in (b'\r\n', b''):
+            break
+        nombre, _, valor = linea.decode('latin-1').partition(':')
+        if nombre.lower() == 'content-length':
+            largo = int(valor)
+    await lector.readexactly(largo)
+    return estado
+
+async def _cliente(host, puerto, ruta, cola, latencias, estados, n, plazo_ms):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        while True:
+            try:
+                cola.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            a = random.uniform(0, 1)
+            cuerpo = {'expresion': random.choice(EXPRESIONES), 'a': a, 'b': a + random.uniform(0.5, 3),
+                      'n': n, 'plazo_ms': plazo_ms}
+            inicio = time.perf_counter()
+            estado = await _peticion(lector, escritor, host, ruta, cuerpo)
+            latencias.append(time.perf_counter() - inicio)
+            estados[estado] = estados.get(estado, 0) + 1
+    finally:
+        escritor.close()
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+async def medir(host, puerto, ruta, peticiones, concurrencia, n, plazo_ms):
+    cola = asyncio.Queue()
+    for _ in range(peticiones):
+        cola.put_nowait(None)
+    latencias, estados = [], {}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_cliente(host, puerto, ruta, cola, latencias, estados, n, plazo_ms)
+                           for _ in range(concurrencia)))
+    total = time.perf_counter() - inicio
+    return {'peticiones': len(latencias), 'segundos': total,
+            'por_segundo': len(latencias) / total,
+            'p50_ms': 1000 * _percentil(latencias, 50), 'p99_ms': 1000 * _percentil(latencias, 99),
+            'max_ms': 1000 * max(latencias), 'estados': estados}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide rendimiento y latencia p99 del servicio local.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--ruta', default='/simpson', choices=['/simpson', '/integral'])
+    parser.add_argument('--peticiones', type=int, default=10000)
+    parser.add_argument('--concurrencia', type=int, default=64)
+    parser.add_argument('--n', type=int, default=1000, help="particiones de Simpson")
+    parser.add_argument('--plazo-ms', type=float, default=10000)
+    args = parser.parse_args(argv)
+    resultado = asyncio.run(medir(args.host, args.puerto, args.ruta, args.peticiones,
+                                  args.concurrencia, args.n, args.plazo_ms))
+    print(json.dumps(resultado, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+from collections import namedtuple
+import numpy as np
+import reglas
+
+ResultadoIntegral = namedtuple('ResultadoIntegral', ['valor', 'error', 'evaluaciones'])
+
+# Tolerancias por defecto
+TOL_ABS = 1e-10
+TOL_REL = 1e-10
+# Límite de evaluaciones de la función por integral
+MAX_EVALUACIONES = 200000
+# Nodos por bloque en simpson_por_bloques (memoria constante para cualquier n)
+BLOQUE_SIMPSON = 1 << 20
+# Puntos por panel de gauss_legendre y nodos iniciales de clenshaw_curtis
+PUNTOS_GAUSS = 20
+NODOS_CLENSHAW_CURTIS = 16
+
+# Regla de Gauss–Kronrod 7–15 (QUADPACK qk15): nodos positivos y pesos
+_XGK = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0])
+_WGK = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+_WG = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+# Nodos y pesos completos en [-1, 1]
+_NODOS_K15 = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+_PESOS_K15 = np.concatenate([_WGK[:-1], _WGK[::-1]])
+_PESOS_G7 = np.zeros(15)
+_PESOS_G7[[1, 3, 5, 7, 9, 11, 13]] = np.concatenate([_WG[:-1], _WG[::-1]])
+
+def _evaluar(f, x):
+    """Evalúa f en el arreglo x y devuelve floats con la misma forma."""
+    with np.errstate(all='ignore'):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), np.shape(x))
+
+def _tolerancia(valor, tol_abs, tol_rel):
+    return max(tol_abs, tol_rel * abs(valor))
+
+def _regla_simpson(y, h):
+    suma_impares = np.sum(y[1:-1:2])
+    suma_pares = np.sum(y[2:-1:2])
+    return (h / 3) * (y[0] + 4 * suma_impares + 2 * suma_pares + y[-1])
+
+def simpson(f, a, b, n):
+    """Simpson 1/3 compuesto con n particiones (par); devuelve (integral, x, y)."""
+    h = (b - a) / n
+    x = np.linspace(a, b, n + 1)
+    y = _evaluar(f, x)
+    return _regla_simpson(y, h), x, y
+
+def error_simpson(y, a, b):
+    """Error estimado (Richardson) comparando con la mitad de particiones; NaN si n no es múltiplo de 4."""
+    n = y.size - 1
+    if n % 4 != 0:
+        return float('nan')
+    h = (b - a) / n
+    return abs(_regla_simpson(y, h) - _regla_simpson(y[::2], 2 * h)) / 15
+
+class _SumaCompensada:
+    """Acumulador de Kahan–Neumaier: el error de redondeo no crece con el número de sumandos."""
+
+    def __init__(self):
+        self.suma = 0.0
+        self.compensacion = 0.0
+
+    def sumar(self, valor):
+        t = self.suma + valor
+        if not np.isfinite(t):
+            # inf o NaN: la compensación ya no tiene sentido
+            self.suma = t
+            return
+        if abs(self.suma) >= abs(valor):
+            self.compensacion += (self.suma - t) + valor
+        else:
+            self.compensacion += (valor - t) + self.suma
+        self.suma = t
+
+    @property
+    def total(self):
+        return self.suma + self.compensacion
+
+def simpson_por_bloques(f, a, b, n, bloque=BLOQUE_SIMPSON):
+    """Simpson 1/3 compuesto con n particiones (par) evaluado por bloques de nodos.
+
+    La memoria no depende de n. Cada bloque se suma por pares (np.sum) y los
+    totales de los bloques con suma compensada. Si n es múltiplo de 4 también
+    se acumula la regla con n/2 particiones para el error de Richardson.
+    """
+    if n % 2 != 0:
+        raise ValueError("El número de particiones debe ser par.")
+    h = (b - a) / n
+    suma = _SumaCompensada()
+    # Σ (w_n - 2 w_{n/2}) y: diferencia entre las dos reglas sin cancelación
+    diferencia = _SumaCompensada()
+    for inicio in range(0, n + 1, bloque):
+        i = np.arange(inicio, min(inicio + bloque, n + 1))
+        x = a + i * h
+        x[i == n] = b
+        y = _evaluar(f, x)
+        impar = i % 2 == 1
+        w = np.where(impar, 4.0, 2.0)
+        w_mitad = np.where(impar, 0.0, np.where((i // 2) % 2 == 1, 4.0, 2.0))
+        extremo = (i == 0) | (i == n)
+        w[extremo] = 1.0
+        w_mitad[extremo] = 1.0
+        suma.sumar(np.sum(w * y))
+        diferencia.sumar(np.sum((w - 2 * w_mitad) * y))
+    error = abs(h / 3 * diferencia.total) / 15 if n % 4 == 0 else float('nan')
+    return ResultadoIntegral(h / 3 * suma.total, error, n + 1)
+
+def simpson_adaptativo(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES):
+    """Simpson adaptativo; subdivide todos los intervalos pendientes a la vez."""
+    x = np.linspace(a, b, 3)
+    y = _evaluar(f, x)
+    # Singularidades en los extremos: se ignora el valor en el borde
+    y = np.where(np.isfinite(y), y, 0.0)
+    evaluaciones = 3
+    # Intervalos pendientes: extremos, valores en a, c, b y su regla de Simpson
+    izq, der = x[:1], x[2:]
+    fa, fc, fb = y[:1], y[1:2], y[2:]
+    entero = (der - izq) / 6 * (fa + 4 * fc + fb)
+    aceptado = 0.0
+    error = 0.0
+    estimado = entero.sum()
+    # |diferencia| del intervalo padre de cada pendiente (cota de su error)
+    previo = np.array([np.inf])
+    while izq.size:
+        cabida = (max_evaluaciones - evaluaciones) // 2
+        if cabida < izq.size:
+            # Sin presupuesto para todos: se refinan los de más error y el resto se acepta tal cual
+            orden = np.argsort(previo)[::-1]
+            resto, orden = orden[cabida:], orden[:cabida]
+            aceptado += entero[resto].sum()
+            error += previo[resto].sum() / 15
+            izq, der, fa, fc, fb, entero, previo = (v[orden] for v in (izq, der, fa, fc, fb, entero, previo))
+            if not izq.size:
+                break
+        c = 0.5 * (izq + der)
+        nuevos = _evaluar(f, np.concatenate([0.5 * (izq + c), 0.5 * (c + der)]))
+        evaluaciones += nuevos.size
+        fd, fe = nuevos[:izq.size], nuevos[izq.size:]
+        mitad_izq = (c - izq) / 6 * (fa + 4 * fd + fc)
+        mitad_der = (der - c) / 6 * (fc + 4 * fe + fb)
+        diferencia = mitad_izq + mitad_der - entero
+        estimado += diferencia.sum()
+        tol = _tolerancia(estimado, tol_abs, tol_rel) * (der - izq) / abs(b - a)
+        listo = (np.abs(diferencia) <= 15 * tol) | (der - izq <= 1e-14 * abs(b - a))
+        if evaluaciones >= max_evaluaciones:
+            listo[:] = True
+        aceptado += np.sum((mitad_izq + mitad_der + diferencia / 15)[listo])
+        error += np.sum(np.abs(diferencia[listo])) / 15
+        pendiente = ~listo
+        izq, der = np.concatenate([izq[pendiente], c[pendiente]]), np.concatenate([c[pendiente], der[pendiente]])
+        fa, fc, fb = (np.concatenate([fa[pendiente], fc[pendiente]]),
+                      np.concatenate([fd[pendiente], fe[pendiente]]),
+                      np.concatenate([fc[pendiente], fb[pendiente]]))
+        entero = np.concatenate([mitad_izq[pendiente], mitad_der[pendiente]])
+        previo = np.tile(np.abs(diferencia[pendiente]), 2)
+    return ResultadoIntegral(aceptado, error, evaluaciones)
+
+def _tabla_kronrod(gauss):
+    """(nodos, pesos de Kronrod, pesos de Gauss) del par Gauss–Kronrod de gauss puntos."""
+    if gauss == 7:
+        return _NODOS_K15, _PESOS_K15, _PESOS_G7
+    return reglas.gauss_kronrod(gauss)
+
+def _kronrod(f, izq, der, gauss=7):
+    """Aplica el par Gauss–Kronrod a cada intervalo; devuelve (valores, errores)."""
+    nodos, pesos_kronrod, pesos_gauss = _tabla_kronrod(gauss)
+    centro = 0.5 * (izq + der)
+    radio = 0.5 * (der - izq)
+    x = centro[:, None] + radio[:, None] * nodos
+    y = _evaluar(f, x)
+    kronrod = radio * (y @ pesos_kronrod)
+    gauss = radio * (y @ pesos_gauss)
+    # Estimación de error al estilo QUADPACK (NaN si la función no es finita en algún nodo)
+    with np.errstate(all='ignore'):
+        media = kronrod / (2 * radio)
+        resasc = np.abs(radio) * (np.abs(y - media[:, None]) @ pesos_kronrod)
+        diferencia = np.abs(kronrod - gauss)
+        escala = np.minimum(1.0, (200 * diferencia / resasc) ** 1.5)
+    error = np.where(resasc > 0, resasc * escala, diferencia)
+    return kronrod, error
+
+def gauss_kronrod(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES, gauss=7):
+    """Gauss–Kronrod adaptativo (por defecto 7–15); biseca a la vez los intervalos con más error."""
+    puntos = 2 * gauss + 1
+    izq, der = np.array([a], dtype=float), np.array([b], dtype=float)
+    valores, errores = _kronrod(f, izq, der, gauss)
+    evaluaciones = puntos
+    while True:
+        valor = valores.sum()
+        error = errores.sum()
+        if not (np.isfinite(valor) and np.isfinite(error)):
+            # NaN o inf en algún punto: subdividir no lo arregla
+            return ResultadoIntegral(valor, float('nan') if np.isnan(valor) else float('inf'), evaluaciones)
+        if error <= _tolerancia(valor, tol_abs, tol_rel) or evaluaciones >= max_evaluaciones:
+            break
+        # Se dividen los intervalos cuyo error supera su parte de la tolerancia
+        cuota = _tolerancia(valor, tol_abs, tol_rel) * (der - izq) / (b - a)
+        dividir = errores > cuota
+        if not dividir.any():
+            dividir = errores == errores.max()
+        # Sin pasarse del presupuesto: solo los de más error que quepan
+        cabida = (max_evaluaciones - evaluaciones) // (2 * puntos)
+        if np.count_nonzero(dividir) > cabida:
+            indices = np.flatnonzero(dividir)
+            dividir = np.zeros_like(dividir)
+            dividir[indices[np.argsort(errores[indices])[::-1][:cabida]]] = True
+        c = 0.5 * (izq[dividir] + der[dividir])
+        if not dividir.any() or np.any((c <= izq[dividir]) | (c >= der[dividir])):
+            break
+        nuevos_izq = np.concatenate([izq[dividir], c])
+        nuevos_der = np.concatenate([c, der[dividir]])
+        nuevos_valores, nuevos_errores = _kronrod(f, nuevos_izq, nuevos_der, gauss)
+        evaluaciones += puntos * nuevos_izq.size
+        mantener = ~dividir
+        izq = np.concatenate([izq[mantener], nuevos_izq])
+        der = np.concatenate([der[mantener], nuevos_der])
+        valores = np.concatenate([valores[mantener], nuevos_valores])
+        errores = np.concatenate([errores[mantener], nuevos_errores])
+    return ResultadoIntegral(valor, error, evaluaciones)
+
+def gauss_kronrod_21(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES):
+    return gauss_kronrod(f, a, b, tol_abs, tol_rel, max_evaluaciones, gauss=10)
+
+def gauss_kronrod_31(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES):
+    return gauss_kronrod(f, a, b, tol_abs, tol_rel, max_evaluaciones, gauss=15)
+
+def compuesta(f, a, b, familia='gauss_legendre', orden=PUNTOS_GAUSS, paneles=1):
+    """Regla fija de reglas.FAMILIAS aplicada en paneles subintervalos iguales.
+
+    El error se estima con la regla anidada de la tabla (Gauss en Kronrod,
+    n/2 en Clenshaw–Curtis); NaN si la familia no tiene (Gauss–Legendre).
+    """
+    nodos, pesos, pesos_anidada = reglas.regla(familia, orden)
+    bordes = np.linspace(a, b, int(paneles) + 1)
+    radio = 0.5 * np.diff(bordes)
+    x = (0.5 * (bordes[:-1] + bordes[1:]))[:, None] + radio[:, None] * nodos
+    y = _evaluar(f, x)
+    valores = radio * (y @ pesos)
+    if pesos_anidada is None:
+        error = float('nan')
+    else:
+        error = np.sum(np.abs(valores - radio * (y @ pesos_anidada)))
+    return ResultadoIntegral(np.sum(valores), error, y.size)
+
+def gauss_legendre(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES,
+                   puntos=PUNTOS_GAUSS):
+    """Gauss–Legendre compuesta; duplica los paneles hasta que dos pasos coinciden."""
+    anterior = compuesta(f, a, b, 'gauss_legendre', puntos, 1).valor
+    evaluaciones = puntos
+    paneles = 2
+    while True:
+        valor = compuesta(f, a, b, 'gauss_legendre', puntos, paneles).valor
+        evaluaciones += puntos * paneles
+        error = abs(valor - anterior)
+        if (error <= _tolerancia(valor, tol_abs, tol_rel)
+                or evaluaciones + 2 * puntos * paneles > max_evaluaciones):
+            return ResultadoIntegral(valor, error, evaluaciones)
+        anterior = valor
+        paneles *= 2
+
+def clenshaw_curtis(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES):
+    """Clenshaw–Curtis anidada: duplica los nodos reutilizando los ya evaluados.
+
+    El error es la diferencia con la regla de la mitad de nodos. Los valores
+    no finitos en los extremos (singularidades) se toman como 0.
+    """
+    centro, radio = 0.5 * (a + b), 0.5 * (b - a)
+    n = NODOS_CLENSHAW_CURTIS
+    y = _evaluar(f, centro + radio * reglas.clenshaw_curtis(n).nodos).copy()
+    y[[0, -1]] = np.where(np.isfinite(y[[0, -1]]), y[[0, -1]], 0.0)
+    evaluaciones = n + 1
+    while True:
+        _, pesos, pesos_anidada = reglas.clenshaw_curtis(n)
+        valor = radio * (y @ pesos)
+        error = abs(valor - radio * (y @ pesos_anidada))
+        if error <= _tolerancia(valor, tol_abs, tol_rel) or evaluaciones + n > max_evaluaciones:
+            return ResultadoIntegral(valor, error, evaluaciones)
+        # Los nodos de n son los de índice par de 2n
+        n *= 2
+        siguiente = np.empty(n + 1)
+        siguiente[::2] = y
+        siguiente[1::2] = _evaluar(f, centro + radio * reglas.clenshaw_curtis(n).nodos[1::2])
+        evaluaciones += n // 2
+        y = siguiente
+
+def tanh_sinh(f, a, b, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES):
+    """Cuadratura doble exponencial; no evalúa los extremos, tolera singularidades en ellos."""
+    radio = 0.5 * (b - a)
+    # t máximo: más allá la distancia al extremo no es representable
+    t_max = np.arcsinh(np.log(2 / np.finfo(float).tiny) / np.pi)
+
+    def suma(t):
+        s = 0.5 * np.pi * np.sinh(t)
+        # 1 - tanh(s) calculado sin cancelación
+        distancia = 2 / (1 + np.exp(2 * s))
+        peso = 0.5 * np.pi * np.cosh(t) / np.cosh(s) ** 2
+        x = np.concatenate([b - radio * distancia, a + radio * distancia])
+        w = np.concatenate([peso, peso])
+        validos = (x > min(a, b)) & (x < max(a, b)) & (w > 0)
+        y = _evaluar(f, x[validos])
+        y = np.where(np.isfinite(y), y, 0.0)
+        return radio * np.dot(w[validos], y), int(validos.sum())
+
+    h = 1.0
+    with np.errstate(all='ignore'):
+        # Nodo central (t = 0) y nodos t = k h con k >= 1
+        centro = radio * 0.5 * np.pi * _evaluar(f, np.array([0.5 * (a + b)]))[0]
+        total, evaluaciones = suma(np.arange(1, np.floor(t_max) + 1) * h)
+        total += centro
+        evaluaciones += 1
+        valor = h * total
+        error = abs(valor)
+        while True:
+            # Solo los nodos impares son nuevos en cada nivel
+            nuevos = np.arange(1, np.floor(2 * t_max / h) + 1, 2) * (h / 2)
+            # Sin pasarse del presupuesto: dos evaluaciones por nodo como mucho
+            if evaluaciones + 2 * nuevos.size > max_evaluaciones:
+                break
+            h /= 2
+            parcial, n = suma(nuevos)
+            evaluaciones += n
+            total += parcial
+            anterior, valor = valor, h * total
+            error = abs(valor - anterior)
+            if error <= _tolerancia(valor, tol_abs, tol_rel):
+                break
+    return ResultadoIntegral(valor, error, evaluaciones)
+
+METODOS = {
+    'simpson_adaptativo': simpson_adaptativo,
+    'gauss_kronrod': gauss_kronrod,
+    'gauss_kronrod_21': gauss_kronrod_21,
+    'gauss_kronrod_31': gauss_kronrod_31,
+    'gauss_legendre': gauss_legendre,
+    'clenshaw_curtis': clenshaw_curtis,
+    'tanh_sinh': tanh_sinh,
+}
+
+# Nombres para mostrar en las interfaces
+NOMBRES = {
+    'gauss_kronrod': 'Gauss–Kronrod 7–15 adaptativo',
+    'gauss_kronrod_21': 'Gauss–Kronrod 10–21 adaptativo',
+    'gauss_kronrod_31': 'Gauss–Kronrod 15–31 adaptativo',
+    'gauss_legendre': f'Gauss–Legendre {PUNTOS_GAUSS} puntos (compuesta)',
+    'clenshaw_curtis': 'Clenshaw–Curtis anidada',
+    'simpson_adaptativo': 'Simpson adaptativo',
+    'tanh_sinh': 'tanh-sinh',
+}
+
+def _cambio_de_variable(f, a, b):
+    """Lleva límites infinitos a un intervalo finito; devuelve (g, a, b)."""
+    def g_derecha(t):
+        # [a, ∞): x = a + t / (1 - t)
+        return f(a + t / (1 - t)) / (1 - t) ** 2
+    def g_izquierda(t):
+        # (-∞, b]: x = b - t / (1 - t)
+        return f(b - t / (1 - t)) / (1 - t) ** 2
+    def g_ambos(t):
+        # (-∞, ∞): x = t / (1 - t²)
+        return f(t / (1 - t ** 2)) * (1 + t ** 2) / (1 - t ** 2) ** 2
+    if np.isinf(a) and np.isinf(b):
+        return g_ambos, -1.0, 1.0
+    if np.isinf(b):
+        return g_derecha, 0.0, 1.0
+    return g_izquierda, 0.0, 1.0
+
+def integrar(f, a, b, metodo='gauss_kronrod', tol_abs=TOL_ABS, tol_rel=TOL_REL,
+             max_evaluaciones=MAX_EVALUACIONES):
+    """Integral de f en [a, b] (admite límites infinitos) con estimación de error."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+    a, b = float(a), float(b)
+    if a == b:
+        return ResultadoIntegral(0.0, 0.0, 0)
+    if a > b:
+        valor, error, evaluaciones = integrar(f, b, a, metodo, tol_abs, tol_rel, max_evaluaciones)
+        return ResultadoIntegral(-valor, error, evaluaciones)
+    if np.isinf(a) or np.isinf(b):
+        f, a, b = _cambio_de_variable(f, a, b)
+    return METODOS[metodo](f, a, b, tol_abs, tol_rel, max_evaluaciones)
@@ -0,0 +1,246 @@
+"""Integrales dobles y triples sobre rectángulos y regiones limitadas por curvas.
+
+La región se da con un par de límites por variable, en orden (x, y, z); los
+límites de y pueden depender de x y los de z de x e y:
+
+    ∫_a^b ∫_{g1(x)}^{g2(x)} ∫_{h1(x,y)}^{h2(x,y)} f dz dy dx
+
+Con el cambio x = a + (b - a) u, y = g1 + (g2 - g1) v, ... toda región pasa
+al cubo unidad, donde trabajan los tres métodos (todos evalúan la función
+sobre arreglos de puntos y ninguno toca el borde del cubo):
+
+  gauss_tensor  Gauss–Legendre producto con más paneles por eje hasta que dos pasos coinciden
+  adaptativa    pares Gauss–Kronrod producto; subdivide las celdas con más error
+  sobol         cuasi-Monte Carlo con secuencias de Sobol aleatorizadas (más dimensiones)
+
+Un valor no finito en un punto interior no se puede ignorar sin cambiar la
+integral, así que lanza IntegrandoNoFinito; si se agota el presupuesto sin
+llegar a la tolerancia (integral divergente, por ejemplo) se avisa en el
+registro.
+"""
+import math
+from functools import lru_cache
+import numpy as np
+import reglas
+from cuadratura import ResultadoIntegral
+from instrumentos import registro
+
+# Tolerancias por defecto (más holgadas que en una dimensión)
+TOL_ABS = 1e-8
+TOL_REL = 1e-8
+MAX_EVALUACIONES = 2_000_000
+# Puntos por eje: Gauss–Legendre en gauss_tensor, Gauss del par de adaptativa
+PUNTOS_TENSOR = 10
+PUNTOS_ADAPTATIVA = 4
+# Puntos evaluados a la vez (limita la memoria)
+BLOQUE = 1 << 18
+# Secuencias de Sobol independientes y puntos iniciales de cada una
+REPLICAS_SOBOL = 8
+PUNTOS_SOBOL = 1 << 10
+SEMILLA = 12345
+# Bits de los puntos de Sobol (con los 30 de SciPy la media se sesga en ~2^-31)
+BITS_SOBOL = 52
+
+class IntegrandoNoFinito(ValueError):
+    """El integrando vale NaN o inf en puntos de la región."""
+
+def _evaluar(F, U):
+    """F en los puntos U (d, N) del cubo unidad, por bloques; lanza IntegrandoNoFinito con NaN/inf."""
+    total = U.shape[1]
+    y = np.empty(total)
+    for inicio in range(0, total, BLOQUE):
+        fin = min(inicio + BLOQUE, total)
+        with np.errstate(all='ignore'):
+            y[inicio:fin] = np.broadcast_to(np.asarray(F(U[:, inicio:fin]), dtype=float), (fin - inicio,))
+    no_finitos = np.count_nonzero(~np.isfinite(y))
+    if no_finitos:
+        raise IntegrandoNoFinito(f"El integrando no es finito en {no_finitos} de {total} puntos "
+                                 "(singularidad o fuera del dominio).")
+    return y
+
+def _tolerancia(valor, tol_abs, tol_rel):
+    return max(tol_abs, tol_rel * abs(valor))
+
+@lru_cache(maxsize=16)
+def _producto(familia, orden, dimension):
+    """Nodos (d, m^d) en [-1, 1]^d y pesos producto (regla y anidada, si hay)."""
+    nodos, pesos, anidada = reglas.regla(familia, orden)
+    malla = np.stack([m.ravel() for m in np.meshgrid(*[nodos] * dimension, indexing='ij')])
+
+    def producto(p):
+        if p is None:
+            return None
+        total = p
+        for _ in range(dimension - 1):
+            total = np.multiply.outer(total, p)
+        return total.ravel()
+
+    return malla, producto(pesos), producto(anidada)
+
+def gauss_tensor(F, dimension, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES,
+                 puntos=PUNTOS_TENSOR):
+    """Gauss–Legendre producto compuesta; duplica los paneles por eje hasta que dos pasos coinciden."""
+    nodos, pesos, _ = _producto('gauss_legendre', puntos, dimension)
+    anterior = None
+    paneles = 1
+    evaluaciones = 0
+    while True:
+        # Esquinas de las celdas de la malla de paneles^d
+        h = 1.0 / paneles
+        esquinas = np.stack([m.ravel() for m in np.meshgrid(*[np.arange(paneles) * h] * dimension,
+                                                             indexing='ij')])
+        U = (esquinas[:, :, None] + 0.5 * h * (1 + nodos[:, None, :])).reshape(dimension, -1)
+        y = _evaluar(F, U).reshape(-1, nodos.shape[1])
+        valor = (0.5 * h) ** dimension * math.fsum(y @ pesos)
+        evaluaciones += y.size
+        if anterior is not None:
+            error = abs(valor - anterior)
+            if (error <= _tolerancia(valor, tol_abs, tol_rel)
+                    or evaluaciones + y.size * 2 ** dimension > max_evaluaciones):
+                return ResultadoIntegral(valor, error, evaluaciones)
+        elif evaluaciones * 2 ** dimension > max_evaluaciones:
+            return ResultadoIntegral(valor, float('nan'), evaluaciones)
+        anterior = valor
+        paneles *= 2
+
+def adaptativa(F, dimension, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES,
+               gauss=PUNTOS_ADAPTATIVA):
+    """Gauss–Kronrod producto adaptativa: divide en 2^d las celdas cuyo error supera su cuota.
+
+    El error de cada celda es la diferencia entre la regla de Kronrod y la de
+    Gauss producto, que usa un subconjunto de los mismos nodos.
+    """
+    nodos, pesos_kronrod, pesos_gauss = _producto('gauss_kronrod', gauss, dimension)
+    m = nodos.shape[1]
+    # Desplazamientos de los 2^d hijos de una celda, en unidades de su radio
+    hijos = np.stack([c.ravel() for c in np.meshgrid(*[[-0.5, 0.5]] * dimension, indexing='ij')])
+
+    def aplicar(centros, radios):
+        U = (centros[:, :, None] + radios[None, :, None] * nodos[:, None, :]).reshape(dimension, -1)
+        y = _evaluar(F, U).reshape(-1, m)
+        volumen = radios ** dimension
+        kronrod = volumen * (y @ pesos_kronrod)
+        return kronrod, np.abs(kronrod - volumen * (y @ pesos_gauss))
+
+    centros = np.full((dimension, 1), 0.5)
+    radios = np.array([0.5])
+    valores, errores = aplicar(centros, radios)
+    evaluaciones = m
+    while True:
+        valor = math.fsum(valores)
+        error = errores.sum()
+        tol = _tolerancia(valor, tol_abs, tol_rel)
+        if error <= tol:
+            break
+        # Cuota de cada celda según su volumen
+        dividir = errores > tol * (2 * radios) ** dimension
+        if not dividir.any():
+            dividir = errores == errores.max()
+        n_hijos = 2 ** dimension * int(dividir.sum())
+        if evaluaciones + n_hijos * m > max_evaluaciones:
+            # Sin presupuesto para todas: solo las de más error
+            cabe = (max_evaluaciones - evaluaciones) // (m * 2 ** dimension)
+            if cabe < 1:
+                break
+            orden = np.argsort(errores)[::-1][:cabe]
+            dividir = np.zeros_like(dividir)
+            dividir[orden] = True
+        radio_hijo = np.repeat(radios[dividir] / 2, 2 ** dimension)
+        centros_hijo = (centros[:, dividir, None] + radios[dividir][None, :, None] * hijos[:, None, :]
+                        ).reshape(dimension, -1)
+        nuevos_valores, nuevos_errores = aplicar(centros_hijo, radio_hijo)
+        evaluaciones += nuevos_valores.size * m
+        mantener = ~dividir
+        centros = np.concatenate([centros[:, mantener], centros_hijo], axis=1)
+        radios = np.concatenate([radios[mantener], radio_hijo])
+        valores = np.concatenate([valores[mantener], nuevos_valores])
+        errores = np.concatenate([errores[mantener], nuevos_errores])
+    return ResultadoIntegral(valor, error, evaluaciones)
+
+def sobol(F, dimension, tol_abs=TOL_ABS, tol_rel=TOL_REL, max_evaluaciones=MAX_EVALUACIONES,
+          replicas=REPLICAS_SOBOL, semilla=SEMILLA):
+    """Cuasi-Monte Carlo con replicas secuencias de Sobol aleatorizadas (scrambling).
+
+    Cada paso duplica los puntos de todas las secuencias. El valor es la media
+    de las réplicas y el error su error estándar. Con la misma semilla el
+    resultado es siempre el mismo.
+    """
+    from scipy.stats import qmc
+    generadores = [qmc.Sobol(dimension, scramble=True, bits=BITS_SOBOL, seed=semilla + k)
+                   for k in range(replicas)]
+    sumas = np.zeros(replicas)
+    n = 0
+    nuevos = PUNTOS_SOBOL
+    while True:
+        for k, generador in enumerate(generadores):
+            sumas[k] += math.fsum(_evaluar(F, generador.random(nuevos).T))
+        n += nuevos
+        medias = sumas / n
+        valor = medias.mean()
+        error = medias.std(ddof=1) / math.sqrt(replicas)
+        nuevos = n
+        if (error <= _tolerancia(valor, tol_abs, tol_rel)
+                or replicas * (n + nuevos) > max_evaluaciones):
+            return ResultadoIntegral(valor, error, replicas * n)
+
+METODOS = {
+    'adaptativa': adaptativa,
+    'gauss_tensor': gauss_tensor,
+    'sobol': sobol,
+}
+
+NOMBRES = {
+    'adaptativa': 'Gauss–Kronrod producto adaptativa',
+    'gauss_tensor': f'Gauss–Legendre producto ({PUNTOS_TENSOR} puntos por eje)',
+    'sobol': 'Cuasi-Monte Carlo (Sobol)',
+}
+
+def _limite(limite, anteriores):
+    """Función vectorizada de las variables anteriores para un número, texto o función."""
+    if isinstance(limite, str):
+        from expresiones import compilar_multivariable
+        return compilar_multivariable(limite, anteriores).funcion
+    if callable(limite):
+        return limite
+    valor = float(limite)
+    if math.isinf(valor):
+        raise ValueError("Los límites de las integrales múltiples deben ser finitos.")
+    return lambda *v: valor
+
+def _al_cubo(f, limites):
+    """Integrando en el cubo unidad: f compuesta con el cambio de variables por su jacobiano."""
+    def F(U):
+        puntos = []
+        jacobiano = np.ones(U.shape[1])
+        for k, (inferior, superior) in enumerate(limites):
+            bajo = np.broadcast_to(inferior(*puntos), jacobiano.shape)
+            alto = np.broadcast_to(superior(*puntos), jacobiano.shape)
+            puntos.append(bajo + (alto - bajo) * U[k])
+            jacobiano = jacobiano * (alto - bajo)
+        return np.asarray(f(*puntos), dtype=float) * jacobiano
+    return F
+
+def integrar_region(f, limites, metodo='adaptativa', tol_abs=TOL_ABS, tol_rel=TOL_REL,
+                    max_evaluaciones=MAX_EVALUACIONES):
+    """∫ f sobre la región dada por limites [(inferior, superior), ...], uno por variable.
+
+    f es un texto en x, y, z (tantas como límites) o una función vectorizada
+    f(x, y, ...). Cada límite es un número, un texto o una función de las
+    variables anteriores.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+    dimension = len(limites)
+    if not 1 <= dimension <= 3:
+        raise ValueError("Se admiten integrales de una a tres variables.")
+    variables = ('x', 'y', 'z')[:dimension]
+    if isinstance(f, str):
+        from expresiones import compilar_multivariable
+        f = compilar_multivariable(f, variables).funcion
+    preparados = [(_limite(inferior, variables[:k]), _limite(superior, variables[:k]))
+                  for k, (inferior, superior) in enumerate(limites)]
+    resultado = METODOS[metodo](_al_cubo(f, preparados), dimension, tol_abs, tol_rel, max_evaluaciones)
+    if not resultado.error <= _tolerancia(resultado.valor, tol_abs, tol_rel):
+        registro.warning("Integral de %d variables sin converger (%s): %.6g ± %.2g con %d evaluaciones",
+                         dimension, metodo, resultado.valor, resultado.error, resultado.evaluaciones)
+    return resultado
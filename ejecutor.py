@@ -0,0 +1,299 @@
+import os
+import sqlite3
+import threading
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from collections import namedtuple, deque
+from concurrent.futures import Future, ThreadPoolExecutor, CancelledError, TimeoutError as FuturoAgotado
+import sympy as sp
+from expresiones import compilar_expresion
+from cuadratura import integrar
+from cache_primitivas import cache_compartida
+from instrumentos import registro
+
+# Segundos que se espera al resultado simbólico antes de pasar al numérico
+TIEMPO_LIMITE = 5.0
+# Segundos de más que integrar() espera al respaldo numérico (y a la cola)
+MARGEN = 10.0
+
+ResultadoSimbolico = namedtuple('ResultadoSimbolico', ['valor', 'exacto', 'metodo', 'error'])
+
+class TiempoAgotado(Exception):
+    """La integral simbólica no terminó dentro del tiempo límite."""
+
+def _integrar_simbolico(texto, a, b):
+    x = sp.symbols('x')
+    f = compilar_expresion(texto, x).expr
+    # Primero la primitiva en caché (solo sustituir los límites)
+    try:
+        resultado = cache_compartida().integral_definida(f, x, a, b)
+    except (sqlite3.Error, OSError):
+        # Caché no disponible (base dañada, directorio sin permisos): se integra sin ella
+        resultado = None
+    if resultado is None:
+        resultado = sp.integrate(f, (x, a, b))
+    return resultado
+
+def _trabajador(conexion):
+    """Bucle de un proceso trabajador: recibe (texto, a, b) y responde (ok, resultado)."""
+    while True:
+        try:
+            trabajo = conexion.recv()
+        except EOFError:
+            return
+        if trabajo is None:
+            return
+        try:
+            conexion.send((True, _integrar_simbolico(*trabajo)))
+        except Exception as e:
+            conexion.send((False, f"{type(e).__name__}: {e}"))
+
+class _Proceso:
+    def __init__(self, contexto):
+        self.conexion, remota = contexto.Pipe()
+        self.proceso = contexto.Process(target=_trabajador, args=(remota,), daemon=True)
+        self.proceso.start()
+        remota.close()
+        self.trabajo = None
+
+    def terminar(self):
+        self.proceso.terminate()
+        self.proceso.join()
+        self.conexion.close()
+
+class _Trabajo:
+    def __init__(self, texto, a, b, tiempo_limite, futuro):
+        self.texto, self.a, self.b = texto, a, b
+        self.tiempo_limite = tiempo_limite
+        self.futuro = futuro
+        self.limite = None
+        # Desde que se encola: pasado tiempo_limite en cola se usa el respaldo numérico
+        self.limite_en_cola = time.monotonic() + tiempo_limite
+        # Se marca al salir de la cola (a un trabajador o al respaldo numérico)
+        self.asignado = threading.Event()
+
+class EjecutorSimbolico:
+    """Ejecuta sp.integrate en procesos aparte, con tiempo límite y cancelación.
+
+    Si el resultado simbólico no llega a tiempo (o no se puede obtener) se
+    calcula la integral numéricamente con cuadratura.integrar.
+    """
+
+    def __init__(self, procesos=None, tiempo_limite=TIEMPO_LIMITE, metodo_numerico='gauss_kronrod'):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tiempo_limite = tiempo_limite
+        self.metodo_numerico = metodo_numerico
+        # spawn: seguro en Windows y con hilos de Qt en el proceso principal
+        self._contexto = multiprocessing.get_context('spawn')
+        self._pendientes = deque()
+        self._cancelados = set()
+        self._candado = threading.Lock()
+        self._cerrado = False
+        self._despertar_r, self._despertar_w = multiprocessing.Pipe(duplex=False)
+        self._numerico = ThreadPoolExecutor(max_workers=max(2, self.procesos))
+        self._trabajadores = [_Proceso(self._contexto) for _ in range(self.procesos)]
+        self._supervisor = threading.Thread(target=self._supervisar, daemon=True)
+        self._supervisor.start()
+
+    def _encolar(self, texto, a, b, tiempo_limite):
+        if self._cerrado:
+            raise RuntimeError("El ejecutor está cerrado.")
+        trabajo = _Trabajo(texto, a, b, tiempo_limite or self.tiempo_limite, Future())
+        with self._candado:
+            self._pendientes.append(trabajo)
+        self._despertar()
+        return trabajo
+
+    def enviar(self, texto, a, b, tiempo_limite=None):
+        """Encola ∫_a^b texto dx; devuelve un Future con un ResultadoSimbolico."""
+        return self._encolar(texto, a, b, tiempo_limite).futuro
+
+    def integrar(self, texto, a, b, tiempo_limite=None):
+        """Versión bloqueante de enviar; lanza TiempoAgotado si tampoco llega el respaldo numérico.
+
+        La espera cuenta desde que el trabajo sale de la cola, de modo que los
+        trabajos encolados detrás de otros lentos no agotan su plazo esperando.
+        """
+        tiempo_limite = tiempo_limite or self.tiempo_limite
+        trabajo = self._encolar(texto, a, b, tiempo_limite)
+        espera = tiempo_limite + MARGEN
+        try:
+            # El supervisor saca de la cola todo trabajo con más de tiempo_limite
+            if not trabajo.asignado.wait(espera):
+                raise FuturoAgotado()
+            return trabajo.futuro.result(timeout=espera)
+        except FuturoAgotado:
+            self.cancelar(trabajo.futuro)
+            raise TiempoAgotado(f"Sin resultado tras {espera} s") from None
+
+    def cancelar(self, futuro):
+        """Cancela un trabajo; si ya estaba en curso se termina su proceso."""
+        if futuro.cancel():
+            return True
+        if futuro.done():
+            return False
+        with self._candado:
+            self._cancelados.add(futuro)
+        self._despertar()
+        return True
+
+    @property
+    def cerrado(self):
+        return self._cerrado
+
+    def cerrar(self):
+        self._cerrado = True
+        self._despertar()
+        self._supervisor.join()
+        for trabajador in self._trabajadores:
+            if trabajador.trabajo is not None and not trabajador.trabajo.futuro.done():
+                trabajador.trabajo.futuro.set_exception(CancelledError())
+            trabajador.terminar()
+        for trabajo in self._pendientes:
+            trabajo.futuro.cancel()
+            trabajo.asignado.set()
+        self._numerico.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def _despertar(self):
+        self._despertar_w.send_bytes(b'.')
+
+    def _respaldo_numerico(self, trabajo, motivo):
+        """Completa el trabajo con la integral numérica."""
+        def calcular():
+            try:
+                f = compilar_expresion(trabajo.texto).funcion
+                # Los límites pueden ser textos exactos ('1/3', 'pi')
+                a, b = float(sp.sympify(trabajo.a)), float(sp.sympify(trabajo.b))
+                valor, error, _ = integrar(f, a, b, self.metodo_numerico)
+                trabajo.futuro.set_result(ResultadoSimbolico(valor, None, 'numerico', error))
+            except Exception as e:
+                trabajo.futuro.set_exception(TiempoAgotado(f"{motivo}; el cálculo numérico también falló: {e}"))
+        self._numerico.submit(calcular)
+
+    def _reemplazar(self, trabajador):
+        trabajador.terminar()
+        indice = self._trabajadores.index(trabajador)
+        self._trabajadores[indice] = _Proceso(self._contexto)
+
+    def _asignar(self):
+        with self._candado:
+            for trabajador in self._trabajadores:
+                if trabajador.trabajo is not None:
+                    continue
+                while self._pendientes:
+                    trabajo = self._pendientes.popleft()
+                    if trabajo.futuro.set_running_or_notify_cancel():
+                        trabajo.limite = time.monotonic() + trabajo.tiempo_limite
+                        trabajador.trabajo = trabajo
+                        trabajador.conexion.send((trabajo.texto, trabajo.a, trabajo.b))
+                        trabajo.asignado.set()
+                        break
+
+    def _vencer_en_cola(self, ahora):
+        """Pasa al respaldo numérico los trabajos que llevan más de tiempo_limite en la cola."""
+        with self._candado:
+            vencidos = [t for t in self._pendientes if ahora >= t.limite_en_cola]
+            for trabajo in vencidos:
+                self._pendientes.remove(trabajo)
+        for trabajo in vencidos:
+            trabajo.asignado.set()
+            if trabajo.futuro.set_running_or_notify_cancel():
+                self._respaldo_numerico(trabajo, f"Tiempo agotado en cola ({trabajo.tiempo_limite} s)")
+
+    def _recibir(self, trabajador):
+        trabajo = trabajador.trabajo
+        trabajador.trabajo = None
+        try:
+            ok, resultado = trabajador.conexion.recv()
+        except (EOFError, OSError):
+            # Proceso muerto (tubería cerrada o reiniciada): se sustituye
+            self._reemplazar(trabajador)
+            self._respaldo_numerico(trabajo, "El proceso trabajador terminó inesperadamente")
+            return
+        if trabajo.futuro.done():
+            return
+        if not ok:
+            self._respaldo_numerico(trabajo, resultado)
+            return
+        try:
+            valor = complex(resultado.evalf()) if not resultado.has(sp.Integral) else None
+        except (TypeError, ValueError):
+            valor = None
+        if valor is None or valor.imag != 0:
+            # Integral sin forma cerrada o con valor no real: se usa el valor numérico
+            self._respaldo_numerico(trabajo, "Sin forma cerrada")
+            return
+        trabajo.futuro.set_result(ResultadoSimbolico(valor.real, resultado, 'simbolico', 0.0))
+
+    def _supervisar(self):
+        try:
+            self._bucle()
+        except Exception as e:
+            # Sin supervisor nadie completaría los futuros: se falla todo lo pendiente
+            registro.exception("El supervisor del ejecutor simbólico falló")
+            self._cerrado = True
+            with self._candado:
+                trabajos = list(self._pendientes) + [t.trabajo for t in self._trabajadores if t.trabajo]
+                self._pendientes.clear()
+            for trabajo in trabajos:
+                trabajo.asignado.set()
+                if not trabajo.futuro.done():
+                    trabajo.futuro.set_exception(RuntimeError(f"El ejecutor simbólico falló: {e}"))
+            for trabajador in self._trabajadores:
+                trabajador.trabajo = None
+                trabajador.terminar()
+
+    def _bucle(self):
+        while not self._cerrado:
+            self._asignar()
+            ocupados = [t for t in self._trabajadores if t.trabajo is not None]
+            ahora = time.monotonic()
+            self._vencer_en_cola(ahora)
+            with self._candado:
+                limites = [t.limite_en_cola for t in self._pendientes]
+            limites += [t.trabajo.limite for t in ocupados]
+            espera = min((limite - ahora for limite in limites), default=None)
+            listos = wait([self._despertar_r] + [t.conexion for t in ocupados],
+                          None if espera is None else max(espera, 0))
+            if self._despertar_r in listos:
+                while self._despertar_r.poll():
+                    self._despertar_r.recv_bytes()
+            for trabajador in ocupados:
+                if trabajador.conexion in listos:
+                    self._recibir(trabajador)
+            ahora = time.monotonic()
+            with self._candado:
+                cancelados, self._cancelados = self._cancelados, set()
+            for trabajador in list(self._trabajadores):
+                trabajo = trabajador.trabajo
+                if trabajo is None:
+                    continue
+                if trabajo.futuro in cancelados:
+                    trabajador.trabajo = None
+                    self._reemplazar(trabajador)
+                    trabajo.futuro.set_exception(CancelledError())
+                elif ahora >= trabajo.limite:
+                    trabajador.trabajo = None
+                    self._reemplazar(trabajador)
+                    self._respaldo_numerico(trabajo, f"Tiempo agotado ({trabajo.tiempo_limite} s)")
+
+_ejecutor = None
+_candado_ejecutor = threading.Lock()
+
+def integrar_con_limite(texto, a, b, tiempo_limite=TIEMPO_LIMITE):
+    """Integral definida simbólica con tiempo límite y respaldo numérico (ejecutor compartido)."""
+    global _ejecutor
+    with _candado_ejecutor:
+        # Se crea al primer uso (o de nuevo si el anterior falló)
+        if _ejecutor is None or _ejecutor.cerrado:
+            # Un proceso por núcleo: una integral lenta no detiene a las demás
+            _ejecutor = EjecutorSimbolico()
+        ejecutor = _ejecutor
+    return ejecutor.integrar(texto, a, b, tiempo_limite)
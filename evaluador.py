@@ -0,0 +1,164 @@
+"""Compilador seguro de expresiones con sintaxis de NumPy (np.sin(x), x**2, ...).
+
+El texto se analiza una sola vez con ast; solo se aceptan números, la
+variable, constantes y funciones universales de NumPy de una lista blanca y
+los operadores aritméticos. El resultado es una función de Python compilada
+que no tiene acceso a builtins.
+"""
+import ast
+import copy
+import math
+import numpy as np
+
+# Funciones permitidas: nombre en el texto -> función de NumPy
+FUNCIONES = {nombre: getattr(np, nombre) for nombre in (
+    'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'hypot',
+    'sinh', 'cosh', 'tanh', 'arcsinh', 'arccosh', 'arctanh',
+    'exp', 'exp2', 'expm1', 'log', 'log2', 'log10', 'log1p', 'sqrt', 'cbrt',
+    'abs', 'absolute', 'fabs', 'sign', 'floor', 'ceil', 'power', 'maximum', 'minimum')}
+CONSTANTES = {'pi': np.pi, 'e': np.e, 'inf': np.inf}
+OPERADORES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd)
+# Prefijos aceptados delante de una función o constante (np.sin, numpy.pi)
+MODULOS = ('np', 'numpy')
+# Tamaño de bloque por defecto para evaluar arreglos grandes
+BLOQUE = 1 << 16
+
+class ExpresionNoPermitida(ValueError):
+    """La expresión usa algo que no está en la lista blanca."""
+
+class _AFlotante(ast.NodeTransformer):
+    def visit_Constant(self, nodo):
+        return ast.copy_location(ast.Constant(float(nodo.value)), nodo)
+
+def _valor_constante(nodo):
+    """Valor en coma flotante de un subárbol ya validado sin la variable."""
+    arbol = ast.fix_missing_locations(ast.Expression(_AFlotante().visit(copy.deepcopy(nodo))))
+    with np.errstate(all='ignore'):
+        return float(eval(compile(arbol, '<constante>', 'eval'),
+                          {'__builtins__': {}, **FUNCIONES, **CONSTANTES}))
+
+class _Validador(ast.NodeTransformer):
+    def __init__(self, variable):
+        self.variable = variable
+
+    def _nombre(self, nodo):
+        """Nombre de una función o constante escrita como f o np.f."""
+        if isinstance(nodo, ast.Name):
+            return nodo.id
+        if (isinstance(nodo, ast.Attribute) and isinstance(nodo.value, ast.Name)
+                and nodo.value.id in MODULOS):
+            return nodo.attr
+        return None
+
+    def visit_Expression(self, nodo):
+        nodo.body = self.visit(nodo.body)
+        return nodo
+
+    def visit_Constant(self, nodo):
+        if type(nodo.value) not in (int, float):
+            raise ExpresionNoPermitida(f"Constante no permitida: {nodo.value!r}")
+        return nodo
+
+    def visit_Name(self, nodo):
+        if nodo.id == self.variable or nodo.id in CONSTANTES:
+            return nodo
+        raise ExpresionNoPermitida(f"Nombre no permitido: {nodo.id}")
+
+    def visit_Attribute(self, nodo):
+        nombre = self._nombre(nodo)
+        if nombre in CONSTANTES:
+            return ast.copy_location(ast.Name(id=nombre, ctx=ast.Load()), nodo)
+        raise ExpresionNoPermitida(f"Atributo no permitido: {ast.unparse(nodo)}")
+
+    def visit_BinOp(self, nodo):
+        if not isinstance(nodo.op, OPERADORES):
+            raise ExpresionNoPermitida(f"Operador no permitido: {type(nodo.op).__name__}")
+        nodo = self.generic_visit(nodo)
+        if isinstance(nodo.op, ast.Pow) and not any(
+                isinstance(n, ast.Name) and n.id == self.variable for n in ast.walk(nodo)):
+            # Potencia de constantes: con enteros (9**9**9) Python calcularía el número exacto
+            # sin límite de tamaño; se exige que quepa en un float
+            try:
+                valor = _valor_constante(nodo)
+            except (ArithmeticError, ValueError):
+                valor = math.inf
+            if not math.isfinite(valor):
+                raise ExpresionNoPermitida(f"Potencia constante fuera de rango: {ast.unparse(nodo)}")
+        return nodo
+
+    def visit_UnaryOp(self, nodo):
+        if not isinstance(nodo.op, OPERADORES):
+            raise ExpresionNoPermitida(f"Operador no permitido: {type(nodo.op).__name__}")
+        return self.generic_visit(nodo)
+
+    def visit_Call(self, nodo):
+        nombre = self._nombre(nodo.func)
+        if nombre not in FUNCIONES:
+            raise ExpresionNoPermitida(f"Función no permitida: {ast.unparse(nodo.func)}")
+        if nodo.keywords:
+            raise ExpresionNoPermitida(f"Argumentos con nombre no permitidos en {nombre}")
+        nodo.func = ast.copy_location(ast.Name(id=nombre, ctx=ast.Load()), nodo.func)
+        nodo.args = [self.visit(arg) for arg in nodo.args]
+        return nodo
+
+    def generic_visit(self, nodo):
+        if not isinstance(nodo, (ast.BinOp, ast.UnaryOp) + OPERADORES):
+            raise ExpresionNoPermitida(f"Construcción no permitida: {type(nodo).__name__}")
+        return super().generic_visit(nodo)
+
+def _analizar(texto, variable):
+    try:
+        arbol = ast.parse(texto.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ExpresionNoPermitida(f"Sintaxis inválida: {e.msg}") from None
+    return ast.fix_missing_locations(_Validador(variable).visit(arbol))
+
+def compilar(texto, variable='x'):
+    """Compila el texto a una función f(variable) vectorizada; lanza ExpresionNoPermitida."""
+    arbol = _analizar(texto, variable)
+    # Una sola función con toda la expresión: lambda x: <expresión>
+    funcion = ast.Expression(ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=variable)], kwonlyargs=[],
+                           kw_defaults=[], defaults=[]),
+        body=arbol.body))
+    codigo = compile(ast.fix_missing_locations(funcion), '<expresión>', 'eval')
+    entorno = {'__builtins__': {}, **FUNCIONES, **CONSTANTES}
+    f = eval(codigo, entorno)
+    if not any(isinstance(n, ast.Name) and n.id == variable for n in ast.walk(arbol)):
+        # Expresión constante: devolver un arreglo del tamaño de x
+        return lambda x: np.full(np.shape(x), f(x), dtype=float)
+    return f
+
+def a_sympy(texto, variable='x'):
+    """Expresión de SymPy equivalente al texto (para cálculos exactos o de alta precisión)."""
+    import sympy as sp
+    arbol = _analizar(texto, variable)
+    equivalentes = {
+        'arcsin': sp.asin, 'arccos': sp.acos, 'arctan': sp.atan, 'arctan2': sp.atan2,
+        'arcsinh': sp.asinh, 'arccosh': sp.acosh, 'arctanh': sp.atanh,
+        'hypot': lambda a, b: sp.sqrt(a ** 2 + b ** 2), 'exp2': lambda t: 2 ** t,
+        'expm1': lambda t: sp.exp(t) - 1, 'log2': lambda t: sp.log(t, 2),
+        'log10': lambda t: sp.log(t, 10), 'log1p': lambda t: sp.log(1 + t),
+        'abs': sp.Abs, 'absolute': sp.Abs, 'fabs': sp.Abs, 'sign': sp.sign,
+        'floor': sp.floor, 'ceil': sp.ceiling, 'power': sp.Pow, 'maximum': sp.Max, 'minimum': sp.Min,
+        'e': sp.E, 'inf': sp.oo, variable: sp.Symbol(variable),
+    }
+    # Los demás nombres de la lista blanca existen en SymPy con el mismo nombre
+    return sp.sympify(ast.unparse(arbol), locals=equivalentes, rational=True)
+
+def evaluar_por_bloques(f, x, bloque=BLOQUE):
+    """Evalúa f sobre x por bloques; los temporales ocupan a lo sumo un bloque."""
+    x = np.asarray(x, dtype=float)
+    if x.size <= bloque:
+        return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+    plano = x.reshape(-1)
+    salida = np.empty(plano.size)
+    for inicio in range(0, plano.size, bloque):
+        parte = plano[inicio:inicio + bloque]
+        salida[inicio:inicio + bloque] = f(parte)
+    return salida.reshape(x.shape)
+
+def compilar_por_bloques(texto, variable='x', bloque=BLOQUE):
+    """Como compilar, pero la función evalúa los arreglos grandes por bloques."""
+    f = compilar(texto, variable)
+    return lambda x: evaluar_por_bloques(f, x, bloque)
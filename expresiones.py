@@ -0,0 +1,66 @@
+from collections import namedtuple
+from functools import lru_cache
+from sympy import sympify, lambdify, latex, Symbol, symbols
+import numpy as np
+from instrumentos import fase, contar
+
+# Tamaño máximo de la caché de expresiones compiladas
+TAMANO_CACHE = 256
+
+ExpresionCompilada = namedtuple('ExpresionCompilada', ['expr', 'funcion', 'latex'])
+
+def normalizar(texto):
+    """Quita los espacios para que textos equivalentes compartan entrada en la caché."""
+    return ''.join(texto.split())
+
+def _vectorizar(expr, variable):
+    """Crea la función NumPy; las constantes se expanden al tamaño del arreglo."""
+    f = lambdify(variable, expr, 'numpy')
+    if not expr.free_symbols:
+        return lambda v: np.full(np.shape(v), f(v))
+    return f
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def _compilar(texto, variable):
+    contar('expresiones.compiladas')
+    simbolo = Symbol(variable)
+    with fase('sympify'):
+        expr = sympify(texto)
+    with fase('lambdify'):
+        funcion = _vectorizar(expr, simbolo)
+    return ExpresionCompilada(expr, funcion, latex(expr))
+
+def compilar_expresion(texto, variable='x'):
+    """Devuelve (expr, funcion, latex) para el texto dado, reutilizando la caché."""
+    return _compilar(normalizar(texto), str(variable))
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def _compilar_varias(texto, variables):
+    contar('expresiones.compiladas')
+    simbolos = symbols(variables)
+    with fase('sympify'):
+        expr = sympify(texto)
+    desconocidas = expr.free_symbols - set(simbolos)
+    if desconocidas:
+        nombres = ', '.join(sorted(str(s) for s in desconocidas))
+        raise ValueError(f"Variables desconocidas: {nombres}")
+    with fase('lambdify'):
+        f = lambdify(simbolos, expr, 'numpy')
+    if not expr.free_symbols:
+        funcion = lambda *v: np.full(np.broadcast(*v).shape, f(*v))
+    else:
+        funcion = f
+    return ExpresionCompilada(expr, funcion, latex(expr))
+
+def compilar_multivariable(texto, variables=('x', 'y')):
+    """Como compilar_expresion, para una función de varias variables f(x, y, ...)."""
+    return _compilar_varias(normalizar(texto), tuple(str(v) for v in variables))
+
+def estadisticas():
+    """Aciertos, fallos y ocupación de las cachés de expresiones (de una y de varias variables)."""
+    return {'compilar_expresion': _compilar.cache_info(),
+            'compilar_multivariable': _compilar_varias.cache_info()}
+
+def limpiar_cache():
+    _compilar.cache_clear()
+    _compilar_varias.cache_clear()
@@ -0,0 +1,137 @@
+"""Curvas implícitas F(x, y) = G(x, y).
+
+Cada ecuación se resuelve una sola vez (en caché) y se guardan todas sus
+ramas, por ejemplo las dos mitades de una circunferencia. Si no hay solución
+cerrada (o la solución solo da la rama principal de una función periódica),
+la curva se obtiene con marching squares sobre una malla de la vista.
+"""
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import sympy as sp
+from sympy.abc import x, y
+from expresiones import compilar_expresion, normalizar
+from muestreo import evaluar
+from teselas import muestrear_en_cache
+from instrumentos import fase
+
+# Rama y = f(x) (eje 'x') o x = f(y) (eje 'y')
+Rama = namedtuple('Rama', ['eje', 'expr', 'funcion'])
+Implicita = namedtuple('Implicita', ['funcion', 'ramas', 'latex'])
+
+# Píxeles por celda de la malla de marching squares
+PIXELES_POR_CELDA = 2
+# Con estas funciones la solución pierde ramas (solo el valor principal)
+_INVERSAS = (sp.asin, sp.acos, sp.atan, sp.acot, sp.asec, sp.acsc, sp.LambertW)
+
+def _ramas(ecuacion, despejada, libre):
+    """Todas las soluciones para despejada, o None si no sirven como ramas."""
+    try:
+        with fase('solve'):
+            soluciones = sp.solve(ecuacion, despejada)
+    except Exception:
+        return None
+    if not soluciones:
+        return None
+    for solucion in soluciones:
+        if solucion.free_symbols - {libre} or solucion.has(*_INVERSAS):
+            return None
+    eje = 'x' if despejada == y else 'y'
+    return [Rama(eje, s, compilar_expresion(str(s), libre).funcion) for s in soluciones]
+
+@lru_cache(maxsize=128)
+def _analizar(texto):
+    izquierda, derecha = texto.split('=')
+    ecuacion = sp.Eq(compilar_expresion(izquierda).expr, compilar_expresion(derecha).expr)
+    diferencia = ecuacion.lhs - ecuacion.rhs
+    ramas = _ramas(ecuacion, y, x) or _ramas(ecuacion, x, y) or []
+    return Implicita(sp.lambdify((x, y), diferencia, 'numpy'), ramas, sp.latex(ecuacion))
+
+def analizar(texto):
+    """Implicita(funcion F(x, y) = izquierda - derecha, ramas, latex) del texto 'izquierda=derecha'."""
+    return _analizar(normalizar(texto))
+
+def _unir(partes):
+    """Une poligonales (x, y) separándolas con NaN."""
+    xs, ys = [], []
+    for px, py in partes:
+        xs += [px, [np.nan]]
+        ys += [py, [np.nan]]
+    if not xs:
+        return np.array([]), np.array([])
+    return np.concatenate(xs[:-1]), np.concatenate(ys[:-1])
+
+def marching_squares(F, xlim, ylim, columnas, filas):
+    """Segmentos de F(x, y) = 0 en la vista, como arreglos x, y separados por NaN."""
+    gx = np.linspace(xlim[0], xlim[1], columnas + 1)
+    gy = np.linspace(ylim[0], ylim[1], filas + 1)
+    X, Y = np.meshgrid(gx, gy)
+    V = evaluar(lambda _: F(X, Y), X)
+    # Esquinas de cada celda: abajo-izq, abajo-der, arriba-der, arriba-izq
+    v00, v10, v11, v01 = V[:-1, :-1], V[:-1, 1:], V[1:, 1:], V[1:, :-1]
+    x0, x1 = X[:-1, :-1], X[:-1, 1:]
+    y0, y1 = Y[:-1, :-1], Y[1:, :-1]
+
+    def corte(va, vb, xa, ya, xb, yb):
+        with np.errstate(all='ignore'):
+            t = va / (va - vb)
+            valido = (np.sign(va) != np.sign(vb)) & np.isfinite(t)
+            return np.where(valido, xa + t * (xb - xa), np.nan), np.where(valido, ya + t * (yb - ya), np.nan)
+
+    # Bordes: abajo, derecha, arriba, izquierda
+    bordes = [corte(v00, v10, x0, y0, x1, y0), corte(v10, v11, x1, y0, x1, y1),
+              corte(v01, v11, x0, y1, x1, y1), corte(v00, v01, x0, y0, x0, y1)]
+    bx = np.stack([b[0] for b in bordes])
+    by = np.stack([b[1] for b in bordes])
+    hay = np.isfinite(bx)
+    cuenta = hay.sum(axis=0)
+    segmentos = []
+    # Celdas con dos cortes: un segmento entre ellos
+    dos = cuenta == 2
+    orden = np.argsort(~hay[:, dos], axis=0, kind='stable')
+    sub_x, sub_y = bx[:, dos], by[:, dos]
+    columnas_dos = np.arange(orden.shape[1])
+    segmentos.append((sub_x[orden[0], columnas_dos], sub_y[orden[0], columnas_dos],
+                      sub_x[orden[1], columnas_dos], sub_y[orden[1], columnas_dos]))
+    # Puntos de silla: se emparejan según el signo del centro
+    cuatro = cuenta == 4
+    if cuatro.any():
+        centro = 0.25 * (v00 + v10 + v11 + v01)[cuatro]
+        igual = np.sign(centro) == np.sign(v00[cuatro])
+        pares = [(np.zeros_like(centro, dtype=int), np.where(igual, 1, 3)),
+                 (np.where(igual, 2, 1), np.where(igual, 3, 2))]
+        sub_x, sub_y = bx[:, cuatro], by[:, cuatro]
+        columnas_cuatro = np.arange(sub_x.shape[1])
+        for a, b in pares:
+            segmentos.append((sub_x[a, columnas_cuatro], sub_y[a, columnas_cuatro],
+                              sub_x[b, columnas_cuatro], sub_y[b, columnas_cuatro]))
+    xa, ya, xb, yb = (np.concatenate(c) for c in zip(*segmentos))
+    # Cambios de signo en polos: F sigue siendo grande a mitad del segmento
+    xm, ym = 0.5 * (xa + xb), 0.5 * (ya + yb)
+    medio = np.abs(evaluar(lambda _: F(xm, ym), xm))
+    escala = np.nanpercentile(np.abs(V), 50) if np.isfinite(V).any() else 1.0
+    reales = medio <= escala
+    xa, ya, xb, yb = xa[reales], ya[reales], xb[reales], yb[reales]
+    vacio = np.full(xa.size, np.nan)
+    return np.column_stack([xa, xb, vacio]).ravel(), np.column_stack([ya, yb, vacio]).ravel()
+
+def trazar(texto, xlim, ylim, tamano_px=(800, 600)):
+    """(x, y, latex) de la curva implícita en la vista."""
+    implicita = analizar(texto)
+    if implicita.ramas:
+        partes = []
+        for rama in implicita.ramas:
+            if rama.eje == 'x':
+                partes.append(muestrear_en_cache(('x', rama.expr), rama.funcion, xlim[0], xlim[1],
+                                                 tamano_px[0], ylim, tamano_px[1]))
+            else:
+                ry, rx = muestrear_en_cache(('y', rama.expr), rama.funcion, ylim[0], ylim[1],
+                                            tamano_px[1], xlim, tamano_px[0])
+                partes.append((rx, ry))
+        x_vals, y_vals = _unir(partes)
+    else:
+        columnas = max(int(tamano_px[0]) // PIXELES_POR_CELDA, 8)
+        filas = max(int(tamano_px[1]) // PIXELES_POR_CELDA, 8)
+        with fase('marching_squares'):
+            x_vals, y_vals = marching_squares(implicita.funcion, xlim, ylim, columnas, filas)
+    return x_vals, y_vals, implicita.latex
@@ -0,0 +1,132 @@
+"""Temporizadores por fase, contadores y captura opcional de perfiles.
+
+    with instrumentos.fase('sympify'):
+        ...
+
+Cada fase acumula número de llamadas y tiempo total, y además se suma al
+cuadro actual (lo ocurrido desde el último nuevo_cuadro(), por ejemplo un
+ciclo de actualizar_grafico), cuyo desglose muestra la ventana. Funciona desde
+cualquier hilo.
+
+Con CALCUINTEGRALES_PERFIL=1 (o activar_perfil(True)) las capturas
+(captura('nombre')) guardan un perfil de cProfile y las líneas que más
+memoria reservaron según tracemalloc, y lo escriben en el registro.
+El nivel del registro se elige con CALCUINTEGRALES_REGISTRO (por defecto
+WARNING; DEBUG muestra el desglose de cada cuadro).
+"""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+registro = logging.getLogger('calcuintegrales')
+
+# Líneas de perfil y de memoria que se escriben en cada captura
+LINEAS_PERFIL = 25
+LINEAS_MEMORIA = 10
+
+_candado = threading.Lock()
+_fases = {}
+_contadores = {}
+_cuadro = {}
+_ultimo_cuadro = {}
+_perfil_activo = os.environ.get('CALCUINTEGRALES_PERFIL', '') not in ('', '0')
+
+def configurar_registro(nivel=None):
+    """Configura el registro de los scripts (los módulos solo escriben en él)."""
+    nivel = nivel or os.environ.get('CALCUINTEGRALES_REGISTRO', 'WARNING')
+    logging.basicConfig(level=nivel.upper(), format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+@contextmanager
+def fase(nombre):
+    """Mide el bloque y lo suma a la fase nombre (total y cuadro actual)."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        duracion = time.perf_counter() - inicio
+        with _candado:
+            llamadas, total = _fases.get(nombre, (0, 0.0))
+            _fases[nombre] = (llamadas + 1, total + duracion)
+            llamadas, total = _cuadro.get(nombre, (0, 0.0))
+            _cuadro[nombre] = (llamadas + 1, total + duracion)
+
+def contar(nombre, cantidad=1):
+    with _candado:
+        _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+def nuevo_cuadro():
+    """Cierra el cuadro actual (pasa a ser el último) y empieza otro."""
+    global _cuadro, _ultimo_cuadro
+    with _candado:
+        if _cuadro:
+            _ultimo_cuadro = _cuadro
+        _cuadro = {}
+
+def ultimo_cuadro():
+    """{fase: (llamadas, segundos)} del último cuadro cerrado, o del actual si aún no hay."""
+    with _candado:
+        return dict(_ultimo_cuadro or _cuadro)
+
+def cuadro_actual():
+    with _candado:
+        return dict(_cuadro)
+
+def resumen_cuadro(cuadro=None):
+    """Texto corto con el desglose, de la fase más lenta a la más rápida."""
+    cuadro = cuadro_actual() if cuadro is None else cuadro
+    partes = sorted(cuadro.items(), key=lambda item: -item[1][1])
+    return "  ".join(f"{nombre} {1000 * total:.1f} ms ({llamadas})" for nombre, (llamadas, total) in partes)
+
+def estadisticas():
+    """(fases {nombre: (llamadas, segundos)}, contadores) acumulados desde el inicio."""
+    with _candado:
+        return dict(_fases), dict(_contadores)
+
+def reiniciar():
+    global _cuadro, _ultimo_cuadro
+    with _candado:
+        _fases.clear()
+        _contadores.clear()
+        _cuadro, _ultimo_cuadro = {}, {}
+
+def activar_perfil(activo=True):
+    global _perfil_activo
+    _perfil_activo = activo
+
+def perfil_activo():
+    return _perfil_activo
+
+@contextmanager
+def captura(nombre):
+    """Fase nombre; con el perfil activo registra también cProfile y tracemalloc."""
+    if not _perfil_activo:
+        with fase(nombre):
+            yield
+        return
+    detener_memoria = not tracemalloc.is_tracing()
+    if detener_memoria:
+        tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    perfil = cProfile.Profile()
+    try:
+        with fase(nombre):
+            perfil.enable()
+            try:
+                yield
+            finally:
+                perfil.disable()
+    finally:
+        despues = tracemalloc.take_snapshot()
+        if detener_memoria:
+            tracemalloc.stop()
+        texto = io.StringIO()
+        pstats.Stats(perfil, stream=texto).sort_stats('cumulative').print_stats(LINEAS_PERFIL)
+        memoria = "\n".join(str(linea) for linea in
+                            despues.compare_to(antes, 'lineno')[:LINEAS_MEMORIA])
+        registro.info("Perfil de %s:\n%s\nMemoria reservada:\n%s", nombre, texto.getvalue(), memoria)
@@ -0,0 +1,120 @@
+import time
+from PyQt5.QtCore import Qt, QTimer
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from instrumentos import captura
+
+# Cuadros por segundo máximos al desplazar o ampliar
+FPS = 60
+
+class ZoomableFigureCanvas(FigureCanvas):
+    """Lienzo con zoom de rueda (centrado en el cursor) y desplazamiento con arrastre.
+
+    Los eventos solo acumulan los límites de destino; un temporizador los
+    aplica y pide el redibujado como mucho una vez por cuadro.
+    """
+
+    def __init__(self, fig, parent=None, fps=FPS):
+        super().__init__(fig)
+        self.setParent(parent)
+        self._zoom = 1.0
+        self._base_xlim = None
+        self._base_ylim = None
+        self._panning = False
+        self._pan_start = None
+        # Límites pendientes de aplicar (None si no hay cambios)
+        self._xlim_destino = None
+        self._ylim_destino = None
+        self._ultimo_cuadro = 0.0
+        self._temporizador = QTimer(self)
+        self._temporizador.setSingleShot(True)
+        self._temporizador.timeout.connect(self._aplicar)
+        self.set_fps(fps)
+        self.setFocusPolicy(Qt.ClickFocus)
+        self.setFocus()
+
+    def set_fps(self, fps):
+        self.fps = max(1, int(fps))
+        self._intervalo = 1.0 / self.fps
+
+    def draw(self):
+        with captura('draw'):
+            super().draw()
+        if hasattr(self.window(), "mostrar_tiempos"):
+            self.window().mostrar_tiempos()
+
+    def _limites(self):
+        """Límites de destino si hay cambios pendientes, si no los de los ejes."""
+        ax = self.figure.axes[0]
+        if self._xlim_destino is None:
+            return ax.get_xlim(), ax.get_ylim()
+        return self._xlim_destino, self._ylim_destino
+
+    def _programar(self, xlim, ylim):
+        self._xlim_destino, self._ylim_destino = xlim, ylim
+        if self._temporizador.isActive():
+            return
+        espera = self._intervalo - (time.monotonic() - self._ultimo_cuadro)
+        self._temporizador.start(max(0, int(espera * 1000)))
+
+    def _aplicar(self):
+        """Aplica los cambios acumulados y redibuja una sola vez."""
+        if self._xlim_destino is None or not self.figure.axes:
+            return
+        ax = self.figure.axes[0]
+        ax.set_xlim(*self._xlim_destino)
+        ax.set_ylim(*self._ylim_destino)
+        self._xlim_destino = self._ylim_destino = None
+        self._ultimo_cuadro = time.monotonic()
+        self.draw_idle()
+        if hasattr(self.window(), "actualizar_grafico"):
+            self.window().actualizar_grafico()
+
+    def wheelEvent(self, event):
+        if not self.figure.axes:
+            return
+        ax = self.figure.axes[0]
+        if self._base_xlim is None or self._base_ylim is None:
+            self._base_xlim = ax.get_xlim()
+            self._base_ylim = ax.get_ylim()
+        angle = event.angleDelta().y()
+        if angle == 0:
+            return
+        # 0.9 por cada paso de la rueda (120); admite pasos parciales de touchpads
+        factor = 0.9 ** (angle / 120)
+        xlim, ylim = self._limites()
+        # El punto bajo el cursor queda fijo
+        caja = ax.bbox
+        px, py = self.mouseEventCoords(event)
+        fx = min(max((px - caja.x0) / caja.width, 0.0), 1.0)
+        fy = min(max((py - caja.y0) / caja.height, 0.0), 1.0)
+        xc = xlim[0] + fx * (xlim[1] - xlim[0])
+        yc = ylim[0] + fy * (ylim[1] - ylim[0])
+        self._programar((xc + (xlim[0] - xc) * factor, xc + (xlim[1] - xc) * factor),
+                        (yc + (ylim[0] - yc) * factor, yc + (ylim[1] - yc) * factor))
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._panning = True
+            self._pan_start = self.mouseEventCoords(event)
+
+    def mouseMoveEvent(self, event):
+        if self._panning and self._pan_start is not None and self.figure.axes:
+            actual = self.mouseEventCoords(event)
+            dx = actual[0] - self._pan_start[0]
+            dy = actual[1] - self._pan_start[1]
+            caja = self.figure.axes[0].bbox
+            xlim, ylim = self._limites()
+            dx_data = -dx * (xlim[1] - xlim[0]) / caja.width
+            dy_data = -dy * (ylim[1] - ylim[0]) / caja.height
+            self._pan_start = actual
+            self._programar((xlim[0] + dx_data, xlim[1] + dx_data),
+                            (ylim[0] + dy_data, ylim[1] + dy_data))
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._panning = False
+            self._pan_start = None
+            # Lo pendiente se aplica ya, sin esperar al próximo cuadro
+            if self._temporizador.isActive():
+                self._temporizador.stop()
+                self._aplicar()
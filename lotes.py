@@ -0,0 +1,74 @@
+import numpy as np
+from sympy import lambdify, Symbol
+from cuadratura import ResultadoIntegral
+from expresiones import compilar_expresion
+
+# Elementos máximos por bloque de la malla (filas x nodos)
+MAX_ELEMENTOS = 4_000_000
+
+def pesos_simpson(n):
+    """Pesos de Simpson 1/3 compuesto en [0, 1] con n particiones (par, al menos 2)."""
+    if n < 2 or n % 2 != 0:
+        raise ValueError("El número de particiones debe ser par y al menos 2.")
+    pesos = np.ones(n + 1)
+    pesos[1:-1:2] = 4
+    pesos[2:-1:2] = 2
+    return pesos / (3 * n)
+
+def _funcion_conjunta(expresiones, variable='x'):
+    """Una sola función NumPy que evalúa todas las expresiones; devuelve (k, ...)."""
+    exprs = [compilar_expresion(e, variable).expr for e in expresiones]
+    f = lambdify(Symbol(variable), exprs, 'numpy')
+    return lambda X: np.stack(np.broadcast_arrays(*f(X), X)[:-1])
+
+def integrar_lote(funciones, a, b, n=1000, max_elementos=MAX_ELEMENTOS):
+    """Simpson compuesto de una o varias funciones sobre muchos intervalos a la vez.
+
+    funciones es una función vectorizada, una expresión o una lista de
+    expresiones; a y b son arreglos de límites (se difunden entre sí). Devuelve
+    valores y errores de forma (len(a),) o (k, len(a)) para k expresiones.
+    """
+    a, b = np.broadcast_arrays(np.atleast_1d(np.asarray(a, dtype=float)),
+                               np.atleast_1d(np.asarray(b, dtype=float)))
+    varias = isinstance(funciones, (list, tuple))
+    if varias:
+        f = _funcion_conjunta(funciones)
+    elif isinstance(funciones, str):
+        f = compilar_expresion(funciones).funcion
+    else:
+        f = funciones
+    t = np.linspace(0.0, 1.0, n + 1)
+    pesos = pesos_simpson(n)
+    # Regla con la mitad de particiones para el error de Richardson
+    pesos_mitad = pesos_simpson(n // 2) if n % 4 == 0 else None
+    filas = max(1, max_elementos // (n + 1))
+    valores, errores = [], []
+    for inicio in range(0, a.size, filas):
+        ai, bi = a[inicio:inicio + filas], b[inicio:inicio + filas]
+        ancho = bi - ai
+        X = ai[:, None] + ancho[:, None] * t
+        with np.errstate(all='ignore'):
+            Y = np.broadcast_to(np.asarray(f(X), dtype=float), ((len(funciones),) if varias else ()) + X.shape)
+        valor = (Y @ pesos) * ancho
+        valores.append(valor)
+        if pesos_mitad is not None:
+            errores.append(np.abs(valor - (Y[..., ::2] @ pesos_mitad) * ancho) / 15)
+        else:
+            errores.append(np.full(valor.shape, np.nan))
+    return ResultadoIntegral(np.concatenate(valores, axis=-1), np.concatenate(errores, axis=-1),
+                             (n + 1) * a.size * (len(funciones) if varias else 1))
+
+def integrar_trabajos(expresiones, a, b, n=1000, max_elementos=MAX_ELEMENTOS):
+    """Integra trabajos (expresión, a, b) agrupando los que comparten expresión."""
+    expresiones = np.asarray(expresiones, dtype=object)
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    valores = np.full(expresiones.size, np.nan)
+    errores = np.full(expresiones.size, np.nan)
+    unicas, indices = np.unique(expresiones.astype(str), return_inverse=True)
+    for k, expresion in enumerate(unicas):
+        filas = indices == k
+        resultado = integrar_lote(expresion, a[filas], b[filas], n, max_elementos)
+        valores[filas] = resultado.valor
+        errores[filas] = resultado.error
+    return ResultadoIntegral(valores, errores, (n + 1) * expresiones.size)
@@ -1,9 +1,35 @@
+import arranque
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
 import sys
+import instrumentos
 from ui_main import GeoGebraApp
+arranque.marcar("importar módulos")
+
+# Tiempo máximo de espera para medir el arranque completo
+ESPERA_MEDICION_MS = 10000
+
+def medir_arranque(app, ventana):
+    """Espera a que terminen las cargas diferidas, imprime el informe y sale."""
+    fases = ("ventana en pantalla", "crear figura", "importar sympy (en segundo plano)")
+    espera = QTimer()
+    def comprobar():
+        if arranque.fases().issuperset(fases):
+            espera.stop()
+            print(arranque.informe())
+            app.quit()
+    espera.timeout.connect(comprobar)
+    espera.start(20)
+    QTimer.singleShot(ESPERA_MEDICION_MS, app.quit)
+    return espera
 
 if __name__ == "__main__":
+    instrumentos.configurar_registro()
     app = QApplication(sys.argv)
+    arranque.marcar("crear QApplication")
     ventana = GeoGebraApp()
+    arranque.marcar("construir ventana")
     ventana.show()
+    if "--medir-arranque" in sys.argv:
+        temporizador = medir_arranque(app, ventana)
     sys.exit(app.exec_())
@@ -1,8 +1,28 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
-                             QLabel, QLineEdit, QPushButton)
+                             QLabel, QLineEdit, QPushButton, QComboBox)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from nucleo import integral_simpson, integral_numerica, integral_compuesta
+from cuadratura import NOMBRES
+from muestreo import muestrear
+from evaluador import compilar_por_bloques, a_sympy
+from precision import integral_mpmath, limite_numerico, texto, DPS
+from paralelo import TRABAJADORES
+import instrumentos
+from instrumentos import registro
+
+# Métodos disponibles: texto en pantalla -> nombre en cuadratura (None = Simpson con n fijo,
+# (familia, orden) = regla fija de reglas aplicada en n paneles, ('mpmath', método) = alta precisión)
+METODOS = {
+    "Simpson (n fijo)": None,
+    "Gauss–Legendre 20 puntos (n paneles)": ('gauss_legendre', 20),
+    "Gauss–Kronrod 10–21 (n paneles)": ('gauss_kronrod', 10),
+    "Clenshaw–Curtis 32 (n paneles)": ('clenshaw_curtis', 32),
+    "tanh-sinh (mpmath, alta precisión)": ('mpmath', 'tanh_sinh'),
+    "Gauss–Legendre (mpmath, alta precisión)": ('mpmath', 'gauss_legendre'),
+    **{texto: nombre for nombre, texto in NOMBRES.items()},
+}
 
 class IntegralCalculator(QMainWindow):
     def __init__(self):
@@ -23,6 +43,19 @@ class IntegralCalculator(QMainWindow):
         self.label_particiones = QLabel("Número de particiones (par):")
         self.entrada_particiones = QLineEdit("100")
         
+        self.label_metodo = QLabel("Método:")
+        self.combo_metodo = QComboBox()
+        self.combo_metodo.addItems(METODOS.keys())
+        
+        self.label_tolerancia = QLabel("Tolerancia (métodos adaptativos):")
+        self.entrada_tolerancia = QLineEdit("1e-10")
+        
+        self.label_trabajadores = QLabel("Hilos de cálculo:")
+        self.entrada_trabajadores = QLineEdit(str(TRABAJADORES))
+        
+        self.label_dps = QLabel("Dígitos (métodos de alta precisión):")
+        self.entrada_dps = QLineEdit(str(DPS))
+        
         self.boton_calcular = QPushButton("Calcular Integral")
         self.boton_calcular.clicked.connect(self.calcular_integral)
         
@@ -42,6 +75,14 @@ class IntegralCalculator(QMainWindow):
         layout.addWidget(self.entrada_lim_sup)
         layout.addWidget(self.label_particiones)
         layout.addWidget(self.entrada_particiones)
+        layout.addWidget(self.label_metodo)
+        layout.addWidget(self.combo_metodo)
+        layout.addWidget(self.label_tolerancia)
+        layout.addWidget(self.entrada_tolerancia)
+        layout.addWidget(self.label_trabajadores)
+        layout.addWidget(self.entrada_trabajadores)
+        layout.addWidget(self.label_dps)
+        layout.addWidget(self.entrada_dps)
         layout.addWidget(self.boton_calcular)
         layout.addWidget(self.label_resultado)
         layout.addWidget(self.canvas)
@@ -53,31 +94,49 @@ class IntegralCalculator(QMainWindow):
     def calcular_integral(self):
         # Obtener datos de la interfaz
         funcion_str = self.entrada_funcion.text().strip()
-        a = float(self.entrada_lim_inf.text())
-        b = float(self.entrada_lim_sup.text())
-        n = int(self.entrada_particiones.text())
-        
-        # Validar que n sea par
-        if n % 2 != 0:
-            self.label_resultado.setText("Error: El número de particiones debe ser par.")
-            return
-        
-        # Método de Simpson 1/3
-        def simpson(f, a, b, n):
-            h = (b - a) / n
-            x = np.linspace(a, b, n+1)
-            y = f(x)
-            suma_impares = np.sum(y[1:-1:2])
-            suma_pares = np.sum(y[2:-1:2])
-            integral = (h / 3) * (y[0] + 4 * suma_impares + 2 * suma_pares + y[-1])
-            return integral, x, y
+        metodo = METODOS[self.combo_metodo.currentText()]
+        alta_precision = isinstance(metodo, tuple) and metodo[0] == 'mpmath'
         
+        instrumentos.nuevo_cuadro()
         try:
-            # Crear función dinámicamente
-            f = lambda x: eval(funcion_str, {'np': np, 'x': x})
+            # Límites tal como se escribieron ('1/3', 'pi'); float para los métodos de doble precisión
+            texto_inf, texto_sup = self.entrada_lim_inf.text(), self.entrada_lim_sup.text()
+            a, b = limite_numerico(texto_inf), limite_numerico(texto_sup)
+            n = int(self.entrada_particiones.text())
+            trabajadores = max(1, int(self.entrada_trabajadores.text()))
+            
+            # Validar que n sea par
+            if metodo is None and n % 2 != 0:
+                self.label_resultado.setText("Error: El número de particiones debe ser par.")
+                return
+            if isinstance(metodo, tuple) and not alta_precision and n < 1:
+                self.label_resultado.setText("Error: Se necesita al menos un panel.")
+                return
+            
+            # Compilar la función una sola vez (solo NumPy y operadores permitidos)
+            with instrumentos.fase('compilar'):
+                f = compilar_por_bloques(funcion_str)
             
             # Calcular integral
-            integral, x_vals, y_vals = simpson(f, a, b, n)
+            with instrumentos.captura('integral'):
+                if alta_precision:
+                    dps = int(self.entrada_dps.text())
+                    preciso = integral_mpmath(a_sympy(funcion_str), texto_inf, texto_sup, dps, metodo[1])
+                    integral, error, evaluaciones = float(preciso.valor), float(preciso.error), None
+                    titulo = f'Integral por {self.combo_metodo.currentText()} ({dps} dígitos)'
+                elif metodo is None:
+                    # Método de Simpson 1/3 con n fijo
+                    integral, error, evaluaciones = integral_simpson(f, a, b, n, trabajadores)
+                    titulo = f'Integral aproximada por Simpson (n={n})'
+                elif isinstance(metodo, tuple):
+                    familia, orden = metodo
+                    integral, error, evaluaciones = integral_compuesta(f, a, b, familia, orden, n)
+                    titulo = f'Integral por {self.combo_metodo.currentText().replace("n paneles", f"n={n}")}'
+                else:
+                    tolerancia = float(self.entrada_tolerancia.text())
+                    integral, error, evaluaciones = integral_numerica(f, a, b, metodo, tolerancia, tolerancia, trabajadores)
+                    titulo = f'Integral por {self.combo_metodo.currentText()} ({evaluaciones} evaluaciones)'
+            x_vals, y_vals = muestrear(f, a, b, self.canvas.width())
             
             # Graficar
             self.ax.clear()
@@ -87,14 +146,22 @@ class IntegralCalculator(QMainWindow):
             self.ax.set_ylabel('f(x)')
             self.ax.legend()
             self.ax.grid(True)
-            self.ax.set_title(f'Integral aproximada por Simpson (n={n})')
-            self.canvas.draw()
+            self.ax.set_title(titulo)
+            with instrumentos.fase('draw'):
+                self.canvas.draw()
+            registro.info("Tiempos: %s", instrumentos.resumen_cuadro())
             
-            self.label_resultado.setText(f"Resultado: {integral:.6f}")
+            if alta_precision:
+                self.label_resultado.setText(
+                    f"Resultado: {texto(preciso.valor, dps)}  (error ≈ {error:.1e})")
+            else:
+                self.label_resultado.setText(
+                    f"Resultado: {integral:.6f}  (error ≈ {error:.1e}, {evaluaciones} evaluaciones)")
         except Exception as e:
             self.label_resultado.setText(f"Error: {str(e)}")
 
 if __name__ == "__main__":
+    instrumentos.configurar_registro()
     app = QApplication([])
     window = IntegralCalculator()
     window.show()
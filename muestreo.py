@@ -0,0 +1,77 @@
+import numpy as np
+from instrumentos import fase, contar
+
+# Límite de puntos por píxel de ancho
+PUNTOS_POR_PIXEL = 4
+# Niveles máximos de subdivisión
+NIVELES = 12
+
+def evaluar(f, x):
+    """Evalúa f en x; los valores complejos, infinitos o inválidos pasan a NaN."""
+    contar('evaluaciones', np.size(x))
+    with fase('numpy'), np.errstate(all='ignore'):
+        y = np.asarray(f(x))
+        if np.iscomplexobj(y):
+            y = np.where(np.abs(y.imag) <= 1e-12 * (1 + np.abs(y.real)), y.real, np.nan)
+        y = np.broadcast_to(y, np.shape(x)).astype(float)
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+def _escala(y, ylim):
+    """Altura de referencia en unidades de datos (vista o rango típico de y)."""
+    if ylim is not None:
+        return abs(ylim[1] - ylim[0])
+    finitos = y[np.isfinite(y)]
+    if finitos.size == 0:
+        return 1.0
+    bajo, alto = np.percentile(finitos, [5, 95])
+    return (alto - bajo) or 1.0
+
+def muestrear(f, a, b, ancho_px=800, ylim=None, alto_px=600):
+    """Muestreo adaptativo de f en [a, b] para dibujar.
+
+    Refina donde la curva se aleja de la recta entre muestras más de medio
+    píxel y en los bordes del dominio; corta la poligonal (NaN) en polos y
+    valores no finitos. El número de puntos se limita según el ancho en píxeles.
+    """
+    ancho_px = max(int(ancho_px), 16)
+    max_puntos = PUNTOS_POR_PIXEL * ancho_px
+    x = np.linspace(a, b, max(ancho_px // 4, 32) + 1)
+    y = evaluar(f, x)
+    escala = _escala(y, ylim)
+    tolerancia = 0.5 * escala / alto_px
+    dx_minimo = abs(b - a) / max_puntos
+
+    activos = np.ones(x.size - 1, dtype=bool)
+    for _ in range(NIVELES):
+        idx = np.flatnonzero(activos)
+        idx = idx[:max_puntos - x.size]
+        if idx.size == 0:
+            break
+        xm = 0.5 * (x[idx] + x[idx + 1])
+        ym = evaluar(f, xm)
+        y0, y1 = y[idx], y[idx + 1]
+        finitos = np.isfinite(y0) & np.isfinite(y1) & np.isfinite(ym)
+        with np.errstate(invalid='ignore'):
+            curvo = finitos & (np.abs(ym - 0.5 * (y0 + y1)) > tolerancia)
+        # Borde entre una región definida y otra indefinida
+        borde = ~finitos & (np.isfinite(y0) | np.isfinite(y1) | np.isfinite(ym))
+        refinar = (curvo | borde) & (x[idx + 1] - x[idx] > 2 * dx_minimo)
+        sel = idx[refinar]
+        if sel.size == 0:
+            break
+        marcas = np.zeros(activos.size, dtype=bool)
+        marcas[sel] = True
+        x = np.insert(x, sel + 1, xm[refinar])
+        y = np.insert(y, sel + 1, ym[refinar])
+        activos = np.insert(marcas, sel + 1, True)
+
+    # Polos: saltos mayores que la altura visible en segmentos ya mínimos
+    dy = np.abs(np.diff(y))
+    estrechos = np.diff(x) <= 4 * dx_minimo
+    with np.errstate(invalid='ignore'):
+        cortes = np.flatnonzero(estrechos & (dy > escala))
+    if cortes.size:
+        x = np.insert(x, cortes + 1, 0.5 * (x[cortes] + x[cortes + 1]))
+        y = np.insert(y, cortes + 1, np.nan)
+    return x, y
@@ -0,0 +1,107 @@
+"""Núcleo de cálculo de integrales sin interfaz gráfica.
+
+Las ventanas (calcuinte, p2, msimpson, ui_main) y el script p1 llaman a estas
+funciones; no importan PyQt5 ni matplotlib, así que sirven para trabajos por
+lotes o servidores. SymPy se carga solo cuando hace falta.
+"""
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
+import numpy as np
+from cuadratura import ResultadoIntegral, integrar, simpson_por_bloques, compuesta, TOL_ABS, TOL_REL
+from instrumentos import fase
+
+if TYPE_CHECKING:
+    from ejecutor import ResultadoSimbolico
+    from areas import Area
+
+# Una función es un texto (expresión en x) o una función vectorizada de NumPy
+Funcion = Union[str, Callable[[np.ndarray], np.ndarray]]
+# Límite de una integral múltiple: número, texto o función de las variables anteriores
+Limite = Union[float, str, Callable[..., np.ndarray]]
+
+def funcion_numerica(funcion: Funcion) -> Callable[[np.ndarray], np.ndarray]:
+    """Función vectorizada para un texto (compilado y en caché) o la función tal cual."""
+    if isinstance(funcion, str):
+        from expresiones import compilar_expresion
+        return compilar_expresion(funcion).funcion
+    return funcion
+
+def integral_simbolica(expresion: str, a: Union[float, str], b: Union[float, str],
+                       tiempo_limite: Optional[float] = None) -> 'ResultadoSimbolico':
+    """∫_a^b expresion dx con SymPy en un proceso aparte; pasa a numérica si no termina a tiempo.
+
+    Los límites pueden ser textos exactos ('1/3', 'pi').
+    """
+    from ejecutor import integrar_con_limite, TIEMPO_LIMITE
+    with fase('integrate'):
+        return integrar_con_limite(expresion, a, b, tiempo_limite or TIEMPO_LIMITE)
+
+def integral_numerica(funcion: Funcion, a: float, b: float, metodo: str = 'gauss_kronrod',
+                      tol_abs: float = TOL_ABS, tol_rel: float = TOL_REL,
+                      trabajadores: int = 1) -> ResultadoIntegral:
+    """∫_a^b f dx con un método adaptativo de cuadratura (ver cuadratura.METODOS).
+
+    Con trabajadores > 1 el intervalo se reparte entre hilos (ver paralelo).
+    """
+    if trabajadores > 1:
+        from paralelo import integrar_paralelo
+        with fase('cuadratura'):
+            return integrar_paralelo(funcion, a, b, metodo, tol_abs, tol_rel, trabajadores=trabajadores)
+    f = funcion_numerica(funcion)
+    with fase('cuadratura'):
+        return integrar(f, a, b, metodo, tol_abs, tol_rel)
+
+def integral_simpson(funcion: Funcion, a: float, b: float, n: int,
+                     trabajadores: int = 1) -> ResultadoIntegral:
+    """Simpson 1/3 compuesto con n particiones (par) y error estimado por Richardson.
+
+    Se evalúa por bloques, así que n puede ser muy grande sin agotar la memoria.
+    """
+    if trabajadores > 1:
+        from paralelo import simpson_paralelo
+        with fase('simpson'):
+            return simpson_paralelo(funcion, a, b, n, trabajadores)
+    f = funcion_numerica(funcion)
+    with fase('simpson'):
+        return simpson_por_bloques(f, a, b, n)
+
+def integral_compuesta(funcion: Funcion, a: float, b: float, familia: str = 'gauss_legendre',
+                       orden: int = 20, paneles: int = 1) -> ResultadoIntegral:
+    """Regla fija de alto orden (ver reglas.FAMILIAS) en paneles subintervalos iguales."""
+    f = funcion_numerica(funcion)
+    with fase('cuadratura'):
+        return compuesta(f, a, b, familia, orden, paneles)
+
+def integral_doble(funcion: Union[str, Callable[..., np.ndarray]], a: float, b: float,
+                   y_inferior: Limite, y_superior: Limite, metodo: str = 'adaptativa',
+                   tol_abs: Optional[float] = None, tol_rel: Optional[float] = None) -> ResultadoIntegral:
+    """∫_a^b ∫_{y_inferior(x)}^{y_superior(x)} f(x, y) dy dx (ver cubatura.METODOS)."""
+    from cubatura import integrar_region, TOL_ABS as TOL_ABS_CUBATURA, TOL_REL as TOL_REL_CUBATURA
+    with fase('cubatura'):
+        return integrar_region(funcion, [(a, b), (y_inferior, y_superior)], metodo,
+                               TOL_ABS_CUBATURA if tol_abs is None else tol_abs,
+                               TOL_REL_CUBATURA if tol_rel is None else tol_rel)
+
+def integral_triple(funcion: Union[str, Callable[..., np.ndarray]], a: float, b: float,
+                    y_inferior: Limite, y_superior: Limite, z_inferior: Limite, z_superior: Limite,
+                    metodo: str = 'adaptativa', tol_abs: Optional[float] = None,
+                    tol_rel: Optional[float] = None) -> ResultadoIntegral:
+    """∫_a^b ∫_{y_inferior(x)}^{y_superior(x)} ∫_{z_inferior(x, y)}^{z_superior(x, y)} f dz dy dx."""
+    from cubatura import integrar_region, TOL_ABS as TOL_ABS_CUBATURA, TOL_REL as TOL_REL_CUBATURA
+    with fase('cubatura'):
+        return integrar_region(funcion, [(a, b), (y_inferior, y_superior), (z_inferior, z_superior)],
+                               metodo, TOL_ABS_CUBATURA if tol_abs is None else tol_abs,
+                               TOL_REL_CUBATURA if tol_rel is None else tol_rel)
+
+def area_entre_curvas(f1: Funcion, f2: Optional[Funcion], a: float, b: float,
+                      metodo: str = 'gauss_kronrod', trabajadores: int = 1) -> ResultadoIntegral:
+    """Área entre f1 y f2 en [a, b]; sin f2, integral de f1 respecto al eje x."""
+    if f2 is None:
+        return integral_numerica(f1, a, b, metodo, trabajadores=trabajadores)
+    valor, error, evaluaciones, _ = area_entre_funciones([f1, f2], a, b, metodo, trabajadores)
+    return ResultadoIntegral(valor, error, evaluaciones)
+
+def area_entre_funciones(funciones: Sequence[Funcion], a: float, b: float,
+                         metodo: str = 'gauss_kronrod', trabajadores: int = 1) -> 'Area':
+    """Área entre la más alta y la más baja de dos o más funciones, tramo a tramo entre sus cortes."""
+    from areas import area_entre
+    return area_entre(funciones, a, b, metodo, trabajadores=trabajadores)
@@ -1,33 +1,104 @@
-import sympy as sp
-import numpy as np
-import matplotlib.pyplot as plt
+import os
+from muestreo import muestrear
+from nucleo import integral_simbolica, funcion_numerica
+import instrumentos
+from instrumentos import registro
 
-def calcular_integral(func_str, a, b):
-    x = sp.symbols('x')
-    f = sp.sympify(func_str)  # Convierte el string en una expresión simbólica
-    integral = sp.integrate(f, (x, a, b))  # Calcula la integral definida
+def calcular_integral(func_str, a, b, graficar=True, dps=None):
+    """Valor de la integral: float, o mpf con dps dígitos si se pide alta precisión."""
+    instrumentos.nuevo_cuadro()
+    if dps:
+        # Valor exacto evaluado con dps dígitos, o cuadratura de mpmath a esa precisión
+        from precision import integral_precisa
+        integral = integral_precisa(func_str, a, b, dps)
+    else:
+        integral = integral_simbolica(func_str, a, b)  # Integral definida, con tiempo límite
     
-    # Graficar la función y el área bajo la curva
-    f_numeric = sp.lambdify(x, f, 'numpy')  # Convierte la función a una forma evaluable
-    x_vals = np.linspace(float(a), float(b), 1000)
-    y_vals = f_numeric(x_vals)
+    if graficar:
+        # matplotlib solo se carga si hay que graficar
+        import matplotlib.pyplot as plt
+        
+        # Graficar la función y el área bajo la curva
+        f_numeric = funcion_numerica(func_str)  # Función evaluable (en caché)
+        x_vals, y_vals = muestrear(f_numeric, _limite(a), _limite(b))
+        
+        plt.figure(figsize=(8, 5))
+        plt.plot(x_vals, y_vals, label=f'f(x) = {func_str}')
+        plt.fill_between(x_vals, y_vals, alpha=0.3, label=f'Área = {float(integral.valor):.4f}')
+        plt.xlabel('x')
+        plt.ylabel('f(x)')
+        plt.legend()
+        plt.grid(True)
+        plt.title(f'Integral de {func_str} entre {a} y {b}')
+        registro.info("Tiempos: %s", instrumentos.resumen_cuadro())
+        plt.show()
+    else:
+        registro.info("Tiempos: %s", instrumentos.resumen_cuadro())
     
-    plt.figure(figsize=(8, 5))
-    plt.plot(x_vals, y_vals, label=f'f(x) = {func_str}')
-    plt.fill_between(x_vals, y_vals, alpha=0.3, label=f'Área = {integral.evalf():.4f}')
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.legend()
-    plt.grid(True)
-    plt.title(f'Integral de {func_str} entre {a} y {b}')
-    plt.show()
-    
-    return integral.evalf()
+    return integral.valor
+
+def _limite(valor):
+    """Límite como float; admite textos exactos como '1/3' o 'pi'."""
+    try:
+        return float(valor)
+    except ValueError:
+        import sympy as sp
+        return float(sp.sympify(valor))
+
+def main(argv=None):
+    """Modo por lotes: python p1.py trabajos.csv [más archivos] [opciones]."""
+    import argparse
+    import itertools
+    import sys
+    import time
+    from trabajos import leer, ejecutar, Escritor
+
+    parser = argparse.ArgumentParser(
+        description="Integra por lotes trabajos (expresion, a, b, metodo, tolerancia) de archivos CSV o JSONL.")
+    parser.add_argument('archivos', nargs='+', help="archivos .csv o .jsonl ('-' = entrada estándar)")
+    parser.add_argument('--formato', choices=['csv', 'jsonl'], help="formato de entrada (por defecto, según la extensión)")
+    parser.add_argument('--salida', default='-', help="archivo de resultados (por defecto, salida estándar)")
+    parser.add_argument('--formato-salida', choices=['csv', 'jsonl'], default='jsonl')
+    parser.add_argument('--procesos', type=int, default=None, help="procesos de cálculo (por defecto, uno por núcleo)")
+    parser.add_argument('--graficos', metavar='CARPETA', help="guarda un gráfico PNG por trabajo en CARPETA")
+    args = parser.parse_args(argv)
+
+    instrumentos.configurar_registro()
+    if args.graficos:
+        os.makedirs(args.graficos, exist_ok=True)
+    filas = itertools.chain.from_iterable(leer(archivo, args.formato) for archivo in args.archivos)
+    salida = sys.stdout if args.salida == '-' else open(args.salida, 'w', newline='', encoding='utf-8')
+    escritor = Escritor(salida, args.formato_salida)
+    inicio = time.perf_counter()
+    total = fallos = 0
+    try:
+        for resultado in ejecutar(filas, args.procesos, args.graficos):
+            escritor.escribir(resultado)
+            total += 1
+            fallos += 'fallo' in resultado
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (por ejemplo, con | head)
+        return 0
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    print(f"{total} trabajos, {fallos} con fallo, {time.perf_counter() - inicio:.2f} s", file=sys.stderr)
+    return 1 if fallos else 0
 
 # Ejemplo de uso
-funcion = input("Ingresa la función (ej: x**2 + 3*x + 2): ")
-lim_inf = float(input("Límite inferior: "))
-lim_sup = float(input("Límite superior: "))
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    instrumentos.configurar_registro()
+    funcion = input("Ingresa la función (ej: x**2 + 3*x + 2): ")
+    lim_inf = input("Límite inferior: ")
+    lim_sup = input("Límite superior: ")
+    dps = int(input("Dígitos de precisión (Enter = precisión doble): ") or 0)
 
-resultado = calcular_integral(funcion, lim_inf, lim_sup)
-print(f"El resultado de la integral es: {resultado}")
\ No newline at end of file
+    resultado = calcular_integral(funcion, lim_inf if dps else _limite(lim_inf),
+                                  lim_sup if dps else _limite(lim_sup), dps=dps)
+    if dps:
+        from precision import texto
+        resultado = texto(resultado, dps)
+    print(f"El resultado de la integral es: {resultado}")
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""Integración numérica en paralelo repartiendo [a, b] en fragmentos.
+
+Cada fragmento se integra en un hilo (las ufuncs de NumPy liberan el GIL) o
+en un proceso (integrandos con mucho código Python; la función debe ser un
+texto o una función de módulo que se pueda serializar). Los resultados se
+combinan en el orden de los fragmentos, así que con los mismos parámetros el
+resultado es siempre el mismo.
+"""
+import math
+import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from cuadratura import (ResultadoIntegral, METODOS, TOL_ABS, TOL_REL, MAX_EVALUACIONES,
+                        BLOQUE_SIMPSON, integrar, simpson_por_bloques)
+
+# Trabajadores por defecto (se puede cambiar con CALCUINTEGRALES_TRABAJADORES)
+TRABAJADORES = int(os.environ.get('CALCUINTEGRALES_TRABAJADORES', 0)) or os.cpu_count() or 1
+# Fragmentos por trabajador en los métodos adaptativos (reparte mejor la carga)
+FRAGMENTOS_POR_TRABAJADOR = 4
+TIPOS = ('hilos', 'procesos')
+
+_ejecutores = {}
+
+def _ejecutor(tipo, trabajadores):
+    """Pool compartido para (tipo, trabajadores), creado al primer uso."""
+    clave = (tipo, trabajadores)
+    if clave not in _ejecutores:
+        if tipo == 'hilos':
+            _ejecutores[clave] = ThreadPoolExecutor(max_workers=trabajadores)
+        elif tipo == 'procesos':
+            _ejecutores[clave] = ProcessPoolExecutor(
+                max_workers=trabajadores, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            raise ValueError(f"Tipo de paralelismo desconocido: {tipo}")
+    return _ejecutores[clave]
+
+def cerrar():
+    """Detiene los pools creados."""
+    for ejecutor in _ejecutores.values():
+        ejecutor.shutdown(wait=True)
+    _ejecutores.clear()
+
+def _funcion(funcion):
+    if isinstance(funcion, str):
+        from expresiones import compilar_expresion
+        return compilar_expresion(funcion).funcion
+    return funcion
+
+def _integrar_fragmento(funcion, a, b, metodo, tol_abs, tol_rel, max_evaluaciones):
+    return integrar(_funcion(funcion), a, b, metodo, tol_abs, tol_rel, max_evaluaciones)
+
+def _simpson_fragmento(funcion, a, b, n, bloque):
+    return simpson_por_bloques(_funcion(funcion), a, b, n, bloque)
+
+def _combinar(futuros):
+    """Suma los resultados en el orden de los fragmentos."""
+    resultados = [futuro.result() for futuro in futuros]
+    return ResultadoIntegral(math.fsum(r.valor for r in resultados),
+                             math.fsum(r.error for r in resultados),
+                             sum(r.evaluaciones for r in resultados))
+
+def integrar_paralelo(funcion, a, b, metodo='gauss_kronrod', tol_abs=TOL_ABS, tol_rel=TOL_REL,
+                      max_evaluaciones=MAX_EVALUACIONES, trabajadores=None, tipo='hilos'):
+    """Como cuadratura.integrar, con [a, b] repartido entre varios trabajadores.
+
+    La tolerancia absoluta y el límite de evaluaciones se reparten entre los
+    fragmentos. Con límites infinitos se integra sin dividir.
+    """
+    trabajadores = trabajadores or TRABAJADORES
+    a, b = float(a), float(b)
+    if trabajadores == 1 or a == b or math.isinf(a) or math.isinf(b):
+        return integrar(_funcion(funcion), a, b, metodo, tol_abs, tol_rel, max_evaluaciones)
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+    if a > b:
+        valor, error, evaluaciones = integrar_paralelo(funcion, b, a, metodo, tol_abs, tol_rel,
+                                                       max_evaluaciones, trabajadores, tipo)
+        return ResultadoIntegral(-valor, error, evaluaciones)
+    fragmentos = trabajadores * FRAGMENTOS_POR_TRABAJADOR
+    bordes = [a + (b - a) * k / fragmentos for k in range(fragmentos)] + [b]
+    ejecutor = _ejecutor(tipo, trabajadores)
+    futuros = [ejecutor.submit(_integrar_fragmento, funcion, bordes[k], bordes[k + 1], metodo,
+                               tol_abs / fragmentos, tol_rel, max(max_evaluaciones // fragmentos, 15))
+               for k in range(fragmentos)]
+    return _combinar(futuros)
+
+def simpson_paralelo(funcion, a, b, n, trabajadores=None, tipo='hilos', bloque=BLOQUE_SIMPSON):
+    """Simpson 1/3 con n particiones repartidas entre los trabajadores.
+
+    Cada fragmento recibe un número par de particiones (múltiplo de 4 si n lo
+    es, para conservar el error de Richardson), de modo que la regla es la
+    misma que con un solo trabajador.
+    """
+    if n % 2 != 0:
+        raise ValueError("El número de particiones debe ser par.")
+    trabajadores = trabajadores or TRABAJADORES
+    paso = 4 if n % 4 == 0 else 2
+    unidades = n // paso
+    fragmentos = min(trabajadores, unidades)
+    if fragmentos <= 1:
+        return simpson_por_bloques(_funcion(funcion), a, b, n, bloque)
+    # Índices de nodo donde empieza cada fragmento
+    cortes = [paso * (unidades * k // fragmentos) for k in range(fragmentos)] + [n]
+    h = (b - a) / n
+    ejecutor = _ejecutor(tipo, trabajadores)
+    futuros = [ejecutor.submit(_simpson_fragmento, funcion,
+                               a + cortes[k] * h, b if cortes[k + 1] == n else a + cortes[k + 1] * h,
+                               cortes[k + 1] - cortes[k], bloque)
+               for k in range(fragmentos)]
+    valor, error, _ = _combinar(futuros)
+    # Los nodos compartidos entre fragmentos se cuentan una sola vez
+    return ResultadoIntegral(valor, error, n + 1)
@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import arranque
+
+class PlanificadorGrafico(QObject):
+    """Agrupa ráfagas de cambios y calcula los trazos fuera del hilo de la interfaz."""
+    # (generación, resultados); se entrega en el hilo de la interfaz
+    trazos_listos = pyqtSignal(int, object)
+
+    def __init__(self, dibujar, retraso_ms=60, espera_maxima_ms=200, parent=None):
+        super().__init__(parent)
+        self.dibujar = dibujar
+        self.retraso_ms = retraso_ms
+        self.espera_maxima_ms = espera_maxima_ms
+        self.generacion = 0
+        self._pendiente = None
+        self._inicio_rafaga = None
+        self._ejecutor = ThreadPoolExecutor(max_workers=1)
+        self._temporizador = QTimer(self)
+        self._temporizador.setSingleShot(True)
+        self._temporizador.timeout.connect(self._lanzar)
+        self.trazos_listos.connect(self._entregar)
+
+    def solicitar(self, entradas, xlim, ylim, tamano_px=(800, 600)):
+        """Registra el estado más reciente; solo se calcula el último de cada ráfaga."""
+        self._pendiente = (list(entradas), tuple(xlim), tuple(ylim), tuple(tamano_px))
+        ahora = time.monotonic()
+        if self._inicio_rafaga is None:
+            self._inicio_rafaga = ahora
+        transcurrido_ms = (ahora - self._inicio_rafaga) * 1000
+        # Durante arrastres largos se calcula al menos cada espera_maxima_ms
+        retraso = max(0, min(self.retraso_ms, self.espera_maxima_ms - transcurrido_ms))
+        self._temporizador.start(int(retraso))
+
+    def lanzar_ya(self):
+        """Calcula ya lo pendiente, sin esperar al temporizador; devuelve su generación (o None)."""
+        self._temporizador.stop()
+        if self._pendiente is None:
+            return None
+        self._lanzar()
+        return self.generacion
+
+    def _lanzar(self):
+        if self._pendiente is None:
+            return
+        self.generacion += 1
+        generacion = self.generacion
+        self._ejecutor.submit(self._calcular, generacion, *self._pendiente)
+        self._pendiente = None
+        self._inicio_rafaga = None
+
+    def _calcular(self, generacion, entradas, xlim, ylim, tamano_px):
+        # Si ya llegó una entrada más nueva, este trabajo quedó obsoleto
+        if generacion != self.generacion:
+            return
+        from trazado import calcular_trazos
+        resultados = calcular_trazos(entradas, xlim, ylim, tamano_px)
+        self.trazos_listos.emit(generacion, resultados)
+
+    def precargar(self):
+        """Importa SymPy y el módulo de trazado en el hilo de cálculo."""
+        def importar():
+            import trazado
+            arranque.marcar("importar sympy (en segundo plano)")
+        self._ejecutor.submit(importar)
+
+    def _entregar(self, generacion, resultados):
+        if generacion != self.generacion:
+            return
+        self.dibujar(resultados)
+
+    def detener(self):
+        self._temporizador.stop()
+        self._ejecutor.shutdown(wait=False, cancel_futures=True)
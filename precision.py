@@ -0,0 +1,143 @@
+"""Integrales con precisión arbitraria (mpmath) para valores de referencia.
+
+Primero se intenta la integral simbólica (con tiempo límite) y el resultado
+exacto se evalúa con los dígitos pedidos; si no hay forma cerrada se integra
+con mpmath (tanh-sinh o Gauss–Legendre) a esa precisión. Cada precisión
+tiene su propio contexto de mpmath, y como mpmath guarda en el contexto los
+nodos de cada grado, los nodos de una precisión se calculan una sola vez y
+no se mezclan con los de otra (ni con el contexto global mpmath.mp).
+"""
+import threading
+from collections import namedtuple
+from functools import lru_cache
+import mpmath
+import sympy as sp
+
+# Dígitos significativos por defecto
+DPS = 50
+# Precisiones con contexto (y nodos) en caché
+TAMANO_CACHE = 8
+# Dígitos de más con que se trabaja internamente
+GUARDA = 10
+METODOS = {
+    'tanh_sinh': 'tanh-sinh',
+    'gauss_legendre': 'gauss-legendre',
+}
+
+ResultadoPreciso = namedtuple('ResultadoPreciso', ['valor', 'error', 'metodo', 'dps'])
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def contexto(dps):
+    """(contexto de mpmath, candado) para dps dígitos; los nodos de cuadratura quedan en él."""
+    ctx = mpmath.MPContext()
+    ctx.dps = dps + GUARDA
+    return ctx, threading.Lock()
+
+def _expresion(funcion, variable):
+    if isinstance(funcion, sp.Basic):
+        return funcion
+    from expresiones import compilar_expresion
+    return compilar_expresion(funcion, variable).expr
+
+def _exacto(valor):
+    """Límite exacto: los decimales pasan a racionales (0.1 -> 1/10)."""
+    return sp.sympify(str(valor), rational=True)
+
+def limite_numerico(valor):
+    """float de un límite escrito como número o como texto exacto ('1/3', 'pi', 'oo')."""
+    return float(_exacto(valor))
+
+def _numero(valor, ctx, dps):
+    """Límite como número de ctx; los textos ('1/3', 'pi', 'oo') se evalúan sin redondeo previo."""
+    exacto = _exacto(valor)
+    if exacto in (sp.oo, -sp.oo):
+        return ctx.inf if exacto > 0 else -ctx.inf
+    return ctx.mpf(str(sp.N(exacto, dps + GUARDA)))
+
+def _real(valor, error, ctx, dps):
+    """Parte real de valor; ValueError si la imaginaria no es despreciable."""
+    if isinstance(valor, ctx.mpc):
+        if abs(valor.imag) > max(error, abs(valor) * ctx.mpf(10) ** -dps):
+            raise ValueError("La integral no es real.")
+        valor = valor.real
+    return valor
+
+def integral_mpmath(funcion, a, b, dps=DPS, metodo='tanh_sinh', variable='x'):
+    """∫_a^b funcion con mpmath a dps dígitos; devuelve ResultadoPreciso."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+    ctx, candado = contexto(dps)
+    x = sp.Symbol(variable)
+    expr = _expresion(funcion, x)
+    # Funciones y constantes del contexto, para que todo se calcule a su precisión
+    espacio = {nombre: getattr(ctx, nombre) for nombre in dir(ctx) if not nombre.startswith('_')}
+    f = sp.lambdify(x, expr, [espacio, 'mpmath'])
+    with candado:
+        limites = [_numero(a, ctx, dps), _numero(b, ctx, dps)]
+        valor, error = ctx.quad(f, limites, method=METODOS[metodo], error=True)
+    return ResultadoPreciso(_real(valor, error, ctx, dps), error, metodo, dps)
+
+def integral_precisa(funcion, a, b, dps=DPS, metodo='tanh_sinh', simbolica=True, tiempo_limite=None):
+    """∫_a^b funcion con dps dígitos: valor exacto evaluado a esa precisión o cuadratura de mpmath.
+
+    funcion es un texto en x (sintaxis de SymPy) o una expresión de SymPy;
+    a y b pueden ser textos exactos como '1/3' o 'pi'.
+    """
+    if simbolica:
+        from nucleo import integral_simbolica
+        try:
+            resultado = integral_simbolica(str(funcion), str(_exacto(a)), str(_exacto(b)), tiempo_limite)
+        except Exception:
+            resultado = None
+        if resultado is not None and resultado.exacto is not None:
+            ctx, _ = contexto(dps)
+            real, imaginaria = sp.N(resultado.exacto, dps + GUARDA).as_real_imag()
+            valor = ctx.mpc(str(real), str(imaginaria)) if imaginaria else ctx.mpf(str(real))
+            return ResultadoPreciso(_real(valor, ctx.zero, ctx, dps), ctx.zero, 'simbolico', dps)
+
+    return integral_mpmath(funcion, a, b, dps, metodo)
+
+def texto(valor, dps=DPS):
+    """valor con dps dígitos significativos."""
+    return mpmath.nstr(valor, dps)
+
+def area_precisa(funciones, a, b, dps=DPS, metodo='tanh_sinh'):
+    """Área entre la más alta y la más baja de los textos en [a, b] con dps dígitos.
+
+    Con un solo texto es la integral con signo (como nucleo.area_entre_curvas
+    con g = None) y los cortes son los del eje x. Los cortes se buscan en doble precisión (areas.cortes) y se refinan con
+    findroot a la precisión pedida; en cada tramo se integra la diferencia
+    entre la curva de arriba y la de abajo. Devuelve (ResultadoPreciso, cortes).
+    """
+    from areas import cortes
+    ctx, candado = contexto(dps)
+    x = sp.Symbol('x')
+    expresiones = [_expresion(f, x) for f in funciones]
+    if len(expresiones) == 1:
+        # Área con signo respecto al eje x
+        puntos, _ = cortes([str(expresiones[0]), '0'], float(_exacto(a)), float(_exacto(b)))
+        return integral_mpmath(expresiones[0], a, b, dps, metodo), puntos
+    espacio = {nombre: getattr(ctx, nombre) for nombre in dir(ctx) if not nombre.startswith('_')}
+    numericas = [sp.lambdify(x, e, [espacio, 'mpmath']) for e in expresiones]
+    puntos, _ = cortes([str(e) for e in expresiones], float(_exacto(a)), float(_exacto(b)))
+    with candado:
+        bordes = [_numero(a, ctx, dps)]
+        for p in puntos:
+            # El par que se cruza es el de valores más próximos en el corte
+            valores = [f(ctx.mpf(p)) for f in numericas]
+            i, j = min(((i, j) for i in range(len(valores)) for j in range(i + 1, len(valores))),
+                       key=lambda par: abs(valores[par[0]] - valores[par[1]]))
+            try:
+                bordes.append(ctx.findroot(lambda t: numericas[i](t) - numericas[j](t), ctx.mpf(p)))
+            except (ValueError, ZeroDivisionError):
+                bordes.append(ctx.mpf(p))
+        bordes.append(_numero(b, ctx, dps))
+        valor = error = ctx.zero
+        for izq, der in zip(bordes[:-1], bordes[1:]):
+            medio = [float(f((izq + der) / 2)) for f in numericas]
+            arriba, abajo = numericas[medio.index(max(medio))], numericas[medio.index(min(medio))]
+            parcial, error_parcial = ctx.quad(lambda t: arriba(t) - abajo(t), [izq, der],
+                                              method=METODOS[metodo], error=True)
+            valor += parcial
+            error += error_parcial
+    return ResultadoPreciso(valor, error, metodo, dps), [float(p) for p in bordes[1:-1]]
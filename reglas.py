@@ -0,0 +1,130 @@
+"""Nodos y pesos de reglas de cuadratura en [-1, 1], calculados una vez por orden.
+
+Cada tabla es una Regla(nodos, pesos, pesos_anidada): pesos_anidada son los
+pesos de una regla de menor orden sobre los mismos nodos (cero donde no
+participa), que sirve para estimar el error sin evaluar más la función, o
+None si la familia no tiene regla anidada. Los arreglos son de solo lectura
+porque se comparten entre llamadas.
+"""
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+
+Regla = namedtuple('Regla', ['nodos', 'pesos', 'pesos_anidada'])
+
+# Tablas guardadas por familia
+TAMANO_CACHE = 64
+
+def _congelar(*arreglos):
+    for arreglo in arreglos:
+        if arreglo is not None:
+            arreglo.setflags(write=False)
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def gauss_legendre(n):
+    """Gauss–Legendre de n puntos (exacta para polinomios de grado 2n - 1)."""
+    if n < 1:
+        raise ValueError("La regla necesita al menos un punto.")
+    nodos, pesos = np.polynomial.legendre.leggauss(n)
+    _congelar(nodos, pesos)
+    return Regla(nodos, pesos, None)
+
+def _kronrod_jacobi(n, a0, b0):
+    """Coeficientes de recurrencia de la matriz de Jacobi de Kronrod (algoritmo de Laurie)."""
+    a = np.zeros(2 * n + 1)
+    b = np.zeros(2 * n + 1)
+    a[:3 * n // 2 + 1] = a0[:3 * n // 2 + 1]
+    b[:(3 * n + 1) // 2 + 1] = b0[:(3 * n + 1) // 2 + 1]
+    s = np.zeros(n // 2 + 3)
+    t = np.zeros(n // 2 + 3)
+    t[1] = b[n + 1]
+    for m in range(n - 1):
+        k = np.arange((m + 1) // 2, -1, -1)
+        l = m - k
+        s[k + 1] = np.cumsum((a[k + n + 1] - a[l]) * t[k + 1] + b[k + n + 1] * s[k] - b[l] * s[k + 1])
+        s, t = t, s
+    s[1:n // 2 + 3] = s[0:n // 2 + 2].copy()
+    for m in range(n - 1, 2 * n - 2):
+        k = np.arange(m + 1 - n, (m - 1) // 2 + 1)
+        l = m - k
+        j = n - 1 - l
+        s[j + 1] = np.cumsum(-(a[k + n + 1] - a[l]) * t[j + 1] - b[k + n + 1] * s[j + 1] + b[l] * s[j + 2])
+        j = j[-1]
+        k = (m + 1) // 2
+        if m % 2 == 0:
+            a[k + n + 1] = a[k] + (s[j + 1] - b[k + n + 1] * s[j + 2]) / t[j + 1]
+        else:
+            b[k + n + 1] = s[j + 1] / s[j + 2]
+        s, t = t, s
+    a[2 * n] = a[n - 1] - b[2 * n] * s[1] / t[1]
+    return a, b
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def gauss_kronrod(n):
+    """Par Gauss n – Kronrod 2n + 1; pesos_anidada son los de Gauss en sus nodos."""
+    if n < 1:
+        raise ValueError("La regla necesita al menos un punto.")
+    # Recurrencia de Legendre: a_k = 0, b_0 = 2, b_k = k² / (4k² - 1)
+    k = np.arange(1, 2 * n + 2, dtype=float)
+    a0 = np.zeros(2 * n + 2)
+    b0 = np.concatenate([[2.0], k ** 2 / (4 * k ** 2 - 1)])
+    a, b = _kronrod_jacobi(n, a0, b0)
+    fuera = np.sqrt(b[1:])
+    valores, vectores = np.linalg.eigh(np.diag(a) + np.diag(fuera, 1) + np.diag(fuera, -1))
+    # Simetría exacta alrededor de 0
+    nodos = 0.5 * (valores - valores[::-1])
+    pesos = b[0] * vectores[0] ** 2
+    pesos = 0.5 * (pesos + pesos[::-1])
+    # Los nodos de Gauss son los de índice impar de la regla de Kronrod
+    pesos_gauss = np.zeros(2 * n + 1)
+    pesos_gauss[1::2] = gauss_legendre(n).pesos
+    _congelar(nodos, pesos, pesos_gauss)
+    return Regla(nodos, pesos, pesos_gauss)
+
+def _pesos_clenshaw_curtis(n):
+    """Pesos de Clenshaw–Curtis con n + 1 nodos por FFT (Waldvogel, 2006)."""
+    if n == 1:
+        return np.array([1.0, 1.0])
+    impares = np.arange(1, n, 2)
+    l = impares.size
+    m = n - l
+    v0 = np.concatenate([2 / impares / (impares - 2), [1 / impares[-1]], np.zeros(m)])
+    v2 = -v0[:-1] - v0[:0:-1]
+    g0 = -np.ones(n)
+    g0[l] += n
+    g0[m] += n
+    g = g0 / (n ** 2 - 1 + n % 2)
+    pesos = np.fft.ifft(v2 + g).real
+    return np.concatenate([pesos, pesos[:1]])
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def clenshaw_curtis(n):
+    """Clenshaw–Curtis con nodos cos(kπ/n), k = 0..n; con n par anida la regla de n/2."""
+    if n < 1:
+        raise ValueError("La regla necesita al menos un intervalo.")
+    nodos = np.cos(np.pi * np.arange(n + 1) / n)
+    # Simetría exacta y el centro en 0
+    nodos = 0.5 * (nodos - nodos[::-1])
+    pesos = _pesos_clenshaw_curtis(n)
+    pesos_anidada = None
+    if n % 2 == 0 and n >= 2:
+        pesos_anidada = np.zeros(n + 1)
+        pesos_anidada[::2] = clenshaw_curtis(n // 2).pesos
+    _congelar(nodos, pesos, pesos_anidada)
+    return Regla(nodos, pesos, pesos_anidada)
+
+FAMILIAS = {
+    'gauss_legendre': gauss_legendre,
+    'gauss_kronrod': gauss_kronrod,
+    'clenshaw_curtis': clenshaw_curtis,
+}
+
+def regla(familia, orden):
+    """Regla de la familia ('gauss_legendre', 'gauss_kronrod' o 'clenshaw_curtis') y orden dados."""
+    if familia not in FAMILIAS:
+        raise ValueError(f"Regla desconocida: {familia}")
+    return FAMILIAS[familia](int(orden))
+
+def limpiar_cache():
+    for familia in FAMILIAS.values():
+        familia.cache_clear()
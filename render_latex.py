@@ -0,0 +1,78 @@
+"""Caché de LaTeX ya rasterizado (imágenes RGBA y QPixmap).
+
+La clave es (código, tamaño de letra, dpi, color, recuadro); las entradas
+menos usadas se descartan cuando se supera MAX_BYTES. matplotlib y Qt se
+importan solo al rasterizar.
+"""
+import io
+from collections import OrderedDict
+
+# Memoria máxima ocupada por las imágenes guardadas
+MAX_BYTES = 32 * 1024 * 1024
+
+class CacheLatex:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+
+    def obtener(self, clave, crear, tamano):
+        """Valor para clave; si falta lo crea con crear() y ocupa tamano(valor) bytes."""
+        if clave in self._entradas:
+            self.aciertos += 1
+            self._entradas.move_to_end(clave)
+            return self._entradas[clave][0]
+        self.fallos += 1
+        valor = crear()
+        ocupado = tamano(valor)
+        self._entradas[clave] = (valor, ocupado)
+        self.bytes += ocupado
+        while self.bytes > self.max_bytes and len(self._entradas) > 1:
+            _, (_, liberado) = self._entradas.popitem(last=False)
+            self.bytes -= liberado
+        return valor
+
+    def limpiar(self):
+        self._entradas.clear()
+        self.bytes = 0
+
+_cache = CacheLatex()
+
+def estadisticas():
+    """(aciertos, fallos, entradas, bytes) de la caché compartida."""
+    return _cache.aciertos, _cache.fallos, len(_cache._entradas), _cache.bytes
+
+def _png_latex(codigo, tamano, dpi, color, recuadro, margen):
+    """Rasteriza $codigo$ a PNG sin pasar por pyplot."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=(0.01, 0.01))
+    FigureCanvasAgg(fig)
+    fig.text(0, 0, f"${codigo}$", fontsize=tamano, color=color,
+             bbox=dict(recuadro) if recuadro else None)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=margen, dpi=dpi, transparent=True)
+    return buf.getvalue()
+
+def pixmap_latex(codigo, tamano=16, dpi=150):
+    """QPixmap con el código LaTeX (estilo de set_latex_label)."""
+    def crear():
+        from PyQt5.QtGui import QPixmap
+        pixmap = QPixmap()
+        pixmap.loadFromData(_png_latex(codigo, tamano, dpi, 'black', None, 0.2))
+        return pixmap
+    return _cache.obtener(('pixmap', codigo, tamano, dpi), crear,
+                          lambda p: p.width() * p.height() * 4)
+
+def imagen_latex(codigo, tamano=14, dpi=100, color='black', recuadro=None):
+    """Arreglo RGBA con el código LaTeX, listo para un OffsetImage.
+
+    recuadro es una tupla de pares (clave, valor) con el estilo del bbox de
+    matplotlib, para que forme parte de la clave.
+    """
+    def crear():
+        from matplotlib.image import imread
+        return imread(io.BytesIO(_png_latex(codigo, tamano, dpi, color, recuadro, 0.06)), format='png')
+    return _cache.obtener(('imagen', codigo, tamano, dpi, color, recuadro), crear, lambda a: a.nbytes)
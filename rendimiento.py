@@ -0,0 +1,183 @@
+"""Pruebas de rendimiento de los caminos críticos (sin ventana en pantalla).
+
+Mide: compilar expresiones (sympify + lambdify), Simpson con n de 10^2 a
+10^8, sp.integrate sobre un conjunto fijo de integrales, un ciclo completo de
+GeoGebraApp.actualizar_grafico con N funciones y calcular_area. Qt usa la
+plataforma offscreen.
+
+    python rendimiento.py --salida actual.json
+    python rendimiento.py --guardar-base base.json
+    python rendimiento.py --base base.json      # sale con código 1 si algo empeora
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+VERSION = 1
+# Empeoramiento relativo de la mediana que se considera regresión
+TOLERANCIA = 0.30
+# Segundos máximos de un ciclo de graficado antes de dar la prueba por fallida
+LIMITE_CICLO_S = 60
+EXPRESIONES = ['sin(x)', 'x**2 + 3*x + 2', 'exp(-x**2)', 'cos(3*x)*exp(x)', 'log(1 + x**2)',
+               'sqrt(1 + x**4)', 'x*sin(1/x)', 'tan(x)', 'abs(x - 1)', 'atan(x)/(1 + x)']
+INTEGRALES = ['x**2*sin(x)', 'exp(x)*cos(x)', '1/(1 + x**2)', 'x*log(x + 1)', 'x**3/(x**2 + 1)',
+              'sin(x)**2*cos(x)']
+FUNCIONES_GRAFICO = ['sin(x)', 'x**2/4', 'exp(-x**2)*3', 'cos(2*x) + x/3', 'x**2 + y**2 = 9',
+                     'tan(x)', 'sqrt(abs(x))', 'log(x**2 + 1)']
+
+def _medir(funcion, repeticiones, preparar=None):
+    """Mediana y mínimo en segundos de funcion() (preparar() no se cronometra)."""
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return {'mediana_s': statistics.median(tiempos), 'minimo_s': min(tiempos), 'repeticiones': repeticiones}
+
+def medir_expresiones(repeticiones):
+    import expresiones
+    def compilar():
+        for texto in EXPRESIONES:
+            expresiones.compilar_expresion(texto)
+    return {'expresiones/compilar': _medir(compilar, repeticiones, expresiones.limpiar_cache)}
+
+def medir_simpson(exponente_maximo):
+    from nucleo import integral_simpson, funcion_numerica
+    f = funcion_numerica('sin(x)*exp(-x/10)')
+    resultados = {}
+    for k in range(2, exponente_maximo + 1):
+        n = 10 ** k
+        repeticiones = max(1, min(7, 10 ** (7 - k)))
+        resultados[f'simpson/n=1e{k}'] = _medir(lambda: integral_simpson(f, 0.0, 10.0, n), repeticiones)
+    return resultados
+
+def medir_simbolico(repeticiones):
+    import sympy as sp
+    x = sp.Symbol('x')
+    corpus = [sp.sympify(texto) for texto in INTEGRALES]
+    def integrar():
+        for expr in corpus:
+            sp.integrate(expr, (x, 0, 1))
+    # Sin la caché interna de SymPy, para medir el cálculo completo
+    return {'simbolico/integrate': _medir(integrar, repeticiones, sp.core.cache.clear_cache)}
+
+def _ventana(funciones):
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from ui_main import GeoGebraApp
+    ventana = GeoGebraApp()
+    ventana.resize(1200, 750)
+    ventana.show()
+    ventana.cargar_grafico()
+    ventana.planificador.retraso_ms = 0
+    while len(ventana.entradas) < funciones:
+        ventana.agregar_entrada()
+    for i, entrada in enumerate(ventana.entradas):
+        entrada.entrada.setText(FUNCIONES_GRAFICO[i % len(FUNCIONES_GRAFICO)])
+    return app, ventana
+
+def medir_grafico(funciones, repeticiones):
+    import teselas
+    app, ventana = _ventana(funciones)
+    listos = []
+    ventana.planificador.trazos_listos.connect(lambda generacion, _: listos.append(generacion))
+
+    def ciclo():
+        # Solicitud, cálculo en el hilo de trazado, dibujo de los artistas y render
+        listos.clear()
+        ventana.actualizar_grafico()
+        generacion = ventana.planificador.lanzar_ya()
+        if generacion is None:
+            raise RuntimeError("El ciclo de graficado no pidió ningún trazo.")
+        limite = time.monotonic() + LIMITE_CICLO_S
+        while generacion not in listos:
+            if time.monotonic() > limite:
+                raise RuntimeError(f"El ciclo de graficado no terminó en {LIMITE_CICLO_S} s.")
+            app.processEvents()
+        ventana.canvas.draw()
+
+    ciclo()  # calienta compilación y etiquetas
+    resultados = {
+        f'grafico/ciclo_{funciones}_funciones_frio': _medir(ciclo, repeticiones, teselas._cache.limpiar),
+        f'grafico/ciclo_{funciones}_funciones': _medir(ciclo, repeticiones),
+    }
+    ventana.limite_inf.setText('-2')
+    ventana.limite_sup.setText('2')
+
+    def area():
+        ventana.calcular_area()
+        ventana.canvas.draw()
+    area()
+    if not ventana.resultado.text().startswith("Error estimado"):
+        # Se mediría el camino de error, no el cálculo del área
+        raise RuntimeError(f"calcular_area falló: {ventana.resultado.text()}")
+    resultados[f'grafico/calcular_area_{funciones}_funciones'] = _medir(area, repeticiones)
+    ventana.close()
+    return resultados
+
+def medir_todo(rapido=False, funciones=4):
+    repeticiones = 3 if rapido else 7
+    resultados = {}
+    resultados.update(medir_expresiones(repeticiones))
+    resultados.update(medir_simpson(6 if rapido else 8))
+    resultados.update(medir_simbolico(1 if rapido else 3))
+    resultados.update(medir_grafico(funciones, repeticiones))
+    return {'version': VERSION, 'python': platform.python_version(), 'maquina': platform.platform(),
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'), 'resultados': resultados}
+
+def comparar(actual, base, tolerancia=TOLERANCIA):
+    """Líneas del informe y lista de pruebas que empeoraron más que la tolerancia."""
+    lineas, regresiones = [], []
+    for nombre, medida in actual['resultados'].items():
+        referencia = base['resultados'].get(nombre)
+        if referencia is None:
+            lineas.append(f"{nombre:<45} {1000 * medida['mediana_s']:10.2f} ms   (sin base)")
+            continue
+        razon = medida['mediana_s'] / referencia['mediana_s']
+        marca = ''
+        if razon > 1 + tolerancia:
+            marca = '  <-- REGRESIÓN'
+            regresiones.append(nombre)
+        lineas.append(f"{nombre:<45} {1000 * medida['mediana_s']:10.2f} ms   "
+                      f"base {1000 * referencia['mediana_s']:10.2f} ms   x{razon:5.2f}{marca}")
+    return lineas, regresiones
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento de integración y graficado.")
+    parser.add_argument('--salida', help="guarda los resultados en este JSON")
+    parser.add_argument('--base', help="JSON de referencia con el que comparar")
+    parser.add_argument('--guardar-base', metavar='ARCHIVO', help="guarda los resultados como nueva base")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help="empeoramiento relativo permitido (0.30 = 30 %%)")
+    parser.add_argument('--rapido', action='store_true', help="menos repeticiones y Simpson hasta 10^6")
+    parser.add_argument('--funciones', type=int, default=4, help="funciones en el ciclo de graficado")
+    args = parser.parse_args(argv)
+
+    actual = medir_todo(args.rapido, args.funciones)
+    for ruta in (args.salida, args.guardar_base):
+        if ruta:
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                json.dump(actual, archivo, indent=2)
+    if not args.base:
+        for nombre, medida in actual['resultados'].items():
+            print(f"{nombre:<45} {1000 * medida['mediana_s']:10.2f} ms")
+        return 0
+    with open(args.base, encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    lineas, regresiones = comparar(actual, base, args.tolerancia)
+    print("\n".join(lineas))
+    if regresiones:
+        print(f"\n{len(regresiones)} regresiones de rendimiento: {', '.join(regresiones)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
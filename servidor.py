@@ -0,0 +1,339 @@
+"""Servicio HTTP/JSON local (asyncio) para calcular integrales.
+
+Rutas:
+  POST /simpson   {"expresion", "a", "b", "n"}   Simpson compuesto (como msimpson)
+  POST /integral  {"expresion", "a", "b", "metodo", "tolerancia"}
+                  metodo 'simbolico' (como p2.calcular_integral) o uno de cuadratura.METODOS
+  GET  /estado    contadores del servicio
+
+Las peticiones de Simpson que llegan a la vez se agrupan y se evalúan juntas
+con lotes.integrar_lote (una matriz por expresión). Cada petición puede
+indicar "plazo_ms"; si vence antes del resultado se responde 504. Si hay
+demasiadas peticiones pendientes se responde 503 (con Retry-After) en lugar
+de encolarlas; los cálculos que siguen en marcha tras un 504 cuentan como
+pendientes hasta que terminan. Las integrales simbólicas (que pueden tardar
+segundos) usan sus propios hilos, así que no retrasan los lotes de Simpson.
+Solo escucha en localhost.
+
+Las expresiones pasan por la lista blanca de evaluador antes de llegar a
+SymPy (nunca se evalúa el texto recibido), los POST deben ser
+application/json y la cabecera Host debe ser localhost, para que una página
+web no pueda usar el servicio desde el navegador (CSRF, DNS rebinding).
+
+Las respuestas son JSON estricto: una integral que no es finita se responde
+con 422 y un error estimado no finito (Simpson con n no múltiplo de 4) sale
+como null.
+"""
+import argparse
+import asyncio
+import ipaddress
+import json
+import math
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+
+PUERTO = 8765
+# Espera máxima para juntar un lote de Simpson y tamaño máximo del lote
+VENTANA_MS = 2.0
+LOTE_MAXIMO = 512
+# Peticiones pendientes como máximo antes de responder 503
+MAX_PENDIENTES = 2048
+# Plazo por defecto de una petición
+PLAZO_MS = 10000
+N_SIMPSON = 1000
+N_MAXIMO = 1_000_000
+TAMANO_MAXIMO_CUERPO = 1 << 20
+# Nombres aceptados en la cabecera Host (sin el puerto)
+HOSTS = ('localhost', '127.0.0.1', '[::1]', '::1')
+
+class PlazoVencido(Exception):
+    """La petición no se resolvió antes de su plazo."""
+
+class ErrorPeticion(Exception):
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+def _procesar_simpson(lote):
+    """Resuelve [(expresion, a, b, n)] agrupando por (expresion, n); devuelve resultados o excepciones."""
+    from lotes import integrar_lote
+    resultados = [None] * len(lote)
+    grupos = defaultdict(list)
+    for i, (expresion, a, b, n) in enumerate(lote):
+        grupos[expresion, n].append(i)
+    for (expresion, n), indices in grupos.items():
+        try:
+            a = np.array([lote[i][1] for i in indices])
+            b = np.array([lote[i][2] for i in indices])
+            valores, errores, _ = integrar_lote(expresion, a, b, n)
+            for k, i in enumerate(indices):
+                resultados[i] = {'valor': float(valores[k]), 'error': float(errores[k]),
+                                 'evaluaciones': n + 1, 'lote': len(lote)}
+        except Exception as e:
+            for i in indices:
+                resultados[i] = ErrorPeticion(400, f"{type(e).__name__}: {e}")
+    return resultados
+
+def _finitos(valor):
+    """Copia de valor con los float no finitos (NaN, ±inf) como None, apta para JSON estricto."""
+    if isinstance(valor, dict):
+        return {k: _finitos(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_finitos(v) for v in valor]
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+def _validar(expresion):
+    """Texto canónico de SymPy de una expresión de la lista blanca de evaluador."""
+    from evaluador import a_sympy
+    return str(a_sympy(expresion))
+
+def _host_local(host):
+    """True si la cabecera Host (con o sin puerto) nombra a localhost."""
+    if host.startswith('['):
+        nombre = host[:host.find(']') + 1]
+    else:
+        nombre = host.rsplit(':', 1)[0] if host.count(':') == 1 else host
+    return nombre.lower() in HOSTS
+
+@lru_cache(maxsize=4096)
+def _integral_numerica(expresion, a, b, metodo, tolerancia):
+    from nucleo import integral_numerica
+    valor, error, evaluaciones = integral_numerica(expresion, a, b, metodo, tolerancia, tolerancia)
+    return {'valor': float(valor), 'error': float(error), 'evaluaciones': int(evaluaciones)}
+
+@lru_cache(maxsize=4096)
+def _integral_simbolica(expresion, a, b):
+    from nucleo import integral_simbolica
+    valor, exacto, metodo, error = integral_simbolica(expresion, a, b)
+    return {'valor': float(valor), 'error': float(error), 'metodo': metodo,
+            'exacto': None if exacto is None else str(exacto)}
+
+class Agrupador:
+    """Junta las peticiones que llegan durante la ventana y las resuelve de una vez."""
+
+    def __init__(self, procesar, hilos, ventana_ms=VENTANA_MS, maximo=LOTE_MAXIMO):
+        self.procesar = procesar
+        self.hilos = hilos
+        self.ventana = ventana_ms / 1000
+        self.maximo = maximo
+        self.lotes = 0
+        self.trabajos = 0
+        self._cola = asyncio.Queue()
+        self._tarea = asyncio.get_running_loop().create_task(self._bucle())
+
+    def enviar(self, trabajo, plazo):
+        futuro = asyncio.get_running_loop().create_future()
+        self._cola.put_nowait((trabajo, futuro, plazo))
+        return futuro
+
+    async def _bucle(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            limite = loop.time() + self.ventana
+            while len(lote) < self.maximo:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._cola.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            while len(lote) < self.maximo and not self._cola.empty():
+                lote.append(self._cola.get_nowait())
+            # Las peticiones vencidas o abandonadas no se calculan
+            ahora = time.monotonic()
+            vigentes = []
+            for trabajo, futuro, plazo in lote:
+                if futuro.done():
+                    continue
+                if ahora >= plazo:
+                    futuro.set_exception(PlazoVencido())
+                else:
+                    vigentes.append((trabajo, futuro))
+            if not vigentes:
+                continue
+            self.lotes += 1
+            self.trabajos += len(vigentes)
+            try:
+                resultados = await loop.run_in_executor(self.hilos, self.procesar, [t for t, _ in vigentes])
+            except Exception as e:
+                resultados = [e] * len(vigentes)
+            for (_, futuro), resultado in zip(vigentes, resultados):
+                if futuro.done():
+                    continue
+                if isinstance(resultado, Exception):
+                    futuro.set_exception(resultado)
+                else:
+                    futuro.set_result(resultado)
+
+class Servicio:
+    def __init__(self, ventana_ms=VENTANA_MS, max_pendientes=MAX_PENDIENTES, hilos=4):
+        self.max_pendientes = max_pendientes
+        self.pendientes = 0
+        self.atendidas = 0
+        self.rechazadas = 0
+        self.vencidas = 0
+        # Cálculos que siguen en marcha después de responder 504
+        self.abandonados = 0
+        self.hilos = ThreadPoolExecutor(max_workers=hilos)
+        self.hilos_simbolicos = ThreadPoolExecutor(max_workers=hilos)
+        self.simpson = Agrupador(_procesar_simpson, self.hilos, ventana_ms)
+
+    def _abandonar(self, calculo):
+        """Cuenta calculo como pendiente hasta que termine, aunque ya se haya respondido."""
+        loop = asyncio.get_running_loop()
+        self.abandonados += 1
+        calculo.add_done_callback(lambda _: loop.call_soon_threadsafe(self._liberar))
+
+    def _liberar(self):
+        self.abandonados -= 1
+
+    def estado(self):
+        return {'pendientes': self.pendientes, 'abandonados': self.abandonados, 'atendidas': self.atendidas,
+                'rechazadas': self.rechazadas, 'vencidas': self.vencidas,
+                'lotes_simpson': self.simpson.lotes, 'trabajos_simpson': self.simpson.trabajos,
+                'cache_numerica': _integral_numerica.cache_info()._asdict(),
+                'cache_simbolica': _integral_simbolica.cache_info()._asdict()}
+
+    async def resolver(self, metodo_http, ruta, cuerpo):
+        """(estado HTTP, dict de respuesta) de una petición."""
+        if metodo_http == 'GET' and ruta == '/estado':
+            return 200, self.estado()
+        if metodo_http != 'POST' or ruta not in ('/simpson', '/integral'):
+            return 404, {'fallo': f"Ruta desconocida: {metodo_http} {ruta}"}
+        if self.pendientes + self.abandonados >= self.max_pendientes:
+            self.rechazadas += 1
+            return 503, {'fallo': "Servicio saturado, reintenta más tarde."}
+        try:
+            datos = json.loads(cuerpo or b'{}')
+            expresion = _validar(str(datos['expresion']))
+            a, b = float(datos['a']), float(datos['b'])
+            plazo_s = float(datos.get('plazo_ms', PLAZO_MS)) / 1000
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {'fallo': f"Petición inválida: {e}"}
+        if not (math.isfinite(a) and math.isfinite(b)):
+            return 400, {'fallo': "Los límites deben ser números finitos."}
+        if not math.isfinite(plazo_s):
+            return 400, {'fallo': "plazo_ms debe ser un número finito."}
+        plazo = time.monotonic() + plazo_s
+        self.pendientes += 1
+        calculo = None
+        try:
+            if ruta == '/simpson':
+                n = int(datos.get('n', N_SIMPSON))
+                if n % 2 != 0 or not 2 <= n <= N_MAXIMO:
+                    return 400, {'fallo': f"n debe ser par y estar entre 2 y {N_MAXIMO}."}
+                futuro = self.simpson.enviar((expresion, a, b, n), plazo)
+            else:
+                metodo = datos.get('metodo', 'gauss_kronrod')
+                if metodo == 'simbolico':
+                    calculo = self.hilos_simbolicos.submit(_integral_simbolica, expresion, a, b)
+                else:
+                    tolerancia = float(datos.get('tolerancia', 1e-10))
+                    calculo = self.hilos.submit(_integral_numerica, expresion, a, b, metodo, tolerancia)
+                futuro = asyncio.wrap_future(calculo)
+            resultado = await asyncio.wait_for(futuro, max(plazo - time.monotonic(), 0))
+            if not math.isfinite(resultado['valor']):
+                return 422, {'fallo': "La integral no es finita (divergente o fuera del dominio)."}
+            self.atendidas += 1
+            return 200, resultado
+        except (asyncio.TimeoutError, PlazoVencido):
+            self.vencidas += 1
+            if calculo is not None and not calculo.done():
+                self._abandonar(calculo)
+            return 504, {'fallo': "Plazo vencido."}
+        except ErrorPeticion as e:
+            return e.estado, {'fallo': str(e)}
+        except Exception as e:
+            return 400, {'fallo': f"{type(e).__name__}: {e}"}
+        finally:
+            self.pendientes -= 1
+
+    async def atender(self, lector, escritor):
+        """Atiende una conexión HTTP/1.1 (con keep-alive)."""
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    metodo_http, ruta, version = linea.decode('latin-1').split()
+                except ValueError:
+                    break
+                cabeceras = {}
+                while True:
+                    cabecera = await lector.readline()
+                    if cabecera in (b'\r\n', b'\n', b''):
+                        break
+                    nombre, _, valor = cabecera.decode('latin-1').partition(':')
+                    cabeceras[nombre.strip().lower()] = valor.strip()
+                largo = cabeceras.get('content-length', '0')
+                largo = int(largo) if largo.isdigit() else -1
+                if largo < 0:
+                    estado, respuesta = 400, {'fallo': "Content-Length inválido."}
+                    cerrar = True
+                elif largo > TAMANO_MAXIMO_CUERPO:
+                    estado, respuesta = 413, {'fallo': "Cuerpo demasiado grande."}
+                    cerrar = True
+                else:
+                    cuerpo = await lector.readexactly(largo) if largo else b''
+                    tipo = cabeceras.get('content-type', '').split(';')[0].strip().lower()
+                    if not _host_local(cabeceras.get('host', '')):
+                        estado, respuesta = 403, {'fallo': "Solo se aceptan peticiones a localhost."}
+                    elif metodo_http == 'POST' and tipo != 'application/json':
+                        estado, respuesta = 415, {'fallo': "El cuerpo debe ser application/json."}
+                    else:
+                        estado, respuesta = await self.resolver(metodo_http, ruta, cuerpo)
+                    cerrar = (cabeceras.get('connection', '').lower() == 'close'
+                              or version == 'HTTP/1.0')
+                datos = json.dumps(_finitos(respuesta), ensure_ascii=False, allow_nan=False).encode('utf-8')
+                extra = 'Retry-After: 1\r\n' if estado == 503 else ''
+                escritor.write(
+                    f"HTTP/1.1 {estado} {_RAZONES.get(estado, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(datos)}\r\n{extra}"
+                    f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n".encode('latin-1') + datos)
+                await escritor.drain()
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+_RAZONES = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 413: 'Payload Too Large',
+            415: 'Unsupported Media Type', 422: 'Unprocessable Entity',
+            503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+async def servir(host='127.0.0.1', puerto=PUERTO, **opciones):
+    if not ipaddress.ip_address(host).is_loopback:
+        raise ValueError("El servicio solo puede escuchar en localhost.")
+    servicio = Servicio(**opciones)
+    servidor = await asyncio.start_server(servicio.atender, host, puerto)
+    print(f"Escuchando en http://{host}:{puerto}", flush=True)
+    async with servidor:
+        await servidor.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio local de integrales (HTTP/JSON).")
+    parser.add_argument('--host', default='127.0.0.1', help="dirección de loopback (127.0.0.1 o ::1)")
+    parser.add_argument('--puerto', type=int, default=PUERTO)
+    parser.add_argument('--ventana-ms', type=float, default=VENTANA_MS,
+                        help="espera máxima para agrupar peticiones de Simpson")
+    parser.add_argument('--max-pendientes', type=int, default=MAX_PENDIENTES)
+    parser.add_argument('--hilos', type=int, default=4, help="hilos de cálculo")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.puerto, ventana_ms=args.ventana_ms,
+                           max_pendientes=args.max_pendientes, hilos=args.hilos))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Caché de muestras por teselas para desplazar y ampliar la vista sin volver a muestrear.
+
+El eje se divide en teselas de ancho 2**nivel, con el nivel elegido para que
+la vista abarque entre 4 y 8 teselas. Cada tesela se muestrea con muestrear a
+una densidad (píxeles por unidad) y tolerancia vertical redondeadas a
+potencias de 2, de modo que al desplazar solo se calculan las teselas nuevas
+y al ampliar o reducir se aprovechan las de un nivel más fino ya calculadas.
+Una tesela guardada sirve para cualquier petición de igual o menor densidad y
+de igual o mayor tolerancia (la escala vertical cambia con cada zoom).
+"""
+import math
+from collections import OrderedDict
+import numpy as np
+from muestreo import muestrear
+
+# Memoria máxima ocupada por las teselas guardadas
+MAX_BYTES = 64 * 1024 * 1024
+# La vista abarca entre TESELAS_POR_VISTA y el doble de teselas
+TESELAS_POR_VISTA = 4
+
+class CacheTeselas:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        # (clave_funcion, nivel, indice) -> {(densidad, escala, alto)} guardados
+        self._variantes = {}
+
+    def _obtener(self, clave):
+        valor = self._entradas.get(clave)
+        if valor is not None:
+            self._entradas.move_to_end(clave)
+        return valor
+
+    def _guardar(self, clave, valor):
+        if clave not in self._entradas:
+            self._variantes.setdefault(clave[:3], set()).add(clave[3:])
+        else:
+            x, y = self._entradas[clave]
+            self.bytes -= x.nbytes + y.nbytes
+        self._entradas[clave] = valor
+        self.bytes += valor[0].nbytes + valor[1].nbytes
+        while self.bytes > self.max_bytes and len(self._entradas) > 1:
+            vieja, (x, y) = self._entradas.popitem(last=False)
+            self.bytes -= x.nbytes + y.nbytes
+            variantes = self._variantes[vieja[:3]]
+            variantes.discard(vieja[3:])
+            if not variantes:
+                del self._variantes[vieja[:3]]
+
+    def limpiar(self):
+        self._entradas.clear()
+        self._variantes.clear()
+        self.bytes = 0
+
+    def _compatible(self, clave_funcion, nivel, indice, densidad, escala, alto):
+        """Tesela guardada con esa densidad y una tolerancia igual o menor, o None."""
+        for d, e, h in self._variantes.get((clave_funcion, nivel, indice), ()):
+            if d != densidad:
+                continue
+            # La tolerancia es proporcional a 2**(escala - alto); sin ylim solo vale la misma
+            if (e, h) == (escala, alto) or (None not in (e, escala) and e - h <= escala - alto):
+                return self._obtener((clave_funcion, nivel, indice, d, e, h))
+        return None
+
+    def _reutilizar(self, clave_funcion, nivel, indice, densidad, escala, alto):
+        """La tesela armada con otras ya guardadas de igual o mayor resolución, o None."""
+        for d in (densidad, densidad + 1):
+            valor = self._compatible(clave_funcion, nivel, indice, d, escala, alto)
+            if valor is not None:
+                return valor
+            # Las dos mitades del nivel más fino
+            hijos = [self._compatible(clave_funcion, nivel - 1, 2 * indice + k, d, escala, alto) for k in (0, 1)]
+            if hijos[0] is not None and hijos[1] is not None:
+                return (np.concatenate([hijos[0][0], hijos[1][0][1:]]),
+                        np.concatenate([hijos[0][1], hijos[1][1][1:]]))
+        return None
+
+    def _tesela(self, clave_funcion, f, nivel, indice, densidad, escala, alto):
+        clave = (clave_funcion, nivel, indice, densidad, escala, alto)
+        valor = self._obtener(clave)
+        if valor is not None:
+            self.aciertos += 1
+            return valor
+        valor = self._reutilizar(clave_funcion, nivel, indice, densidad, escala, alto)
+        if valor is not None:
+            self.aciertos += 1
+        else:
+            self.fallos += 1
+            ancho = 2.0 ** nivel
+            inicio = indice * ancho
+            ylim = None if escala is None else (0.0, 2.0 ** escala)
+            valor = muestrear(f, inicio, inicio + ancho, 2 ** (densidad + nivel), ylim, 2 ** alto)
+        self._guardar(clave, valor)
+        return valor
+
+    def muestrear(self, clave_funcion, f, a, b, ancho_px=800, ylim=None, alto_px=600):
+        """Como muestreo.muestrear, pero armado con teselas en caché.
+
+        clave_funcion identifica a f (por ejemplo el eje y la expresión de SymPy).
+        """
+        rango = b - a
+        if not (np.isfinite(a) and np.isfinite(b) and rango > 0):
+            return muestrear(f, a, b, ancho_px, ylim, alto_px)
+        nivel = math.floor(math.log2(rango / TESELAS_POR_VISTA))
+        # Redondeos hacia el lado seguro: más densidad y menor tolerancia
+        densidad = math.ceil(math.log2(max(ancho_px, 16) / rango))
+        escala = None
+        if ylim is not None and ylim[1] != ylim[0]:
+            escala = math.floor(math.log2(abs(ylim[1] - ylim[0])))
+        alto = math.ceil(math.log2(max(alto_px, 16)))
+        ancho = 2.0 ** nivel
+        xs, ys = [], []
+        for indice in range(math.floor(a / ancho), math.ceil(b / ancho)):
+            x, y = self._tesela(clave_funcion, f, nivel, indice, densidad, escala, alto)
+            # El primer punto de cada tesela repite el último de la anterior
+            xs.append(x if not xs else x[1:])
+            ys.append(y if not ys else y[1:])
+        return np.concatenate(xs), np.concatenate(ys)
+
+_cache = CacheTeselas()
+
+def estadisticas():
+    """(aciertos, fallos, teselas, bytes) de la caché compartida."""
+    return _cache.aciertos, _cache.fallos, len(_cache._entradas), _cache.bytes
+
+def muestrear_en_cache(clave_funcion, f, a, b, ancho_px=800, ylim=None, alto_px=600):
+    return _cache.muestrear(clave_funcion, f, a, b, ancho_px, ylim, alto_px)
@@ -0,0 +1,36 @@
+import os
+import signal
+import sys
+import pytest
+
+# Los módulos están en la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(autouse=True)
+def cache_temporal(tmp_path, monkeypatch):
+    """Las primitivas van a un archivo temporal, no a la caché del usuario (también en los trabajadores)."""
+    import cache_primitivas
+    ruta = str(tmp_path / 'primitivas.sqlite')
+    monkeypatch.setenv('CALCUINTEGRALES_CACHE', ruta)
+    monkeypatch.setattr(cache_primitivas, 'RUTA_CACHE', ruta)
+    monkeypatch.setattr(cache_primitivas, '_cache', None)
+
+# Segundos máximos por prueba: un cálculo que no termina es un fallo, no un cuelgue
+LIMITE = 60
+
+@pytest.fixture(autouse=True)
+def limite_de_tiempo():
+    if not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def agotado(signum, frame):
+        raise TimeoutError(f"La prueba superó {LIMITE} s")
+
+    anterior = signal.signal(signal.SIGALRM, agotado)
+    signal.alarm(LIMITE)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, anterior)
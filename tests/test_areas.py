@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+import areas
+import nucleo
+import trazado
+
+def test_area_entre_dos_curvas():
+    # x y x² se cortan en 0 y 1; ∫_0^2 |x - x²| = 1/6 + 5/6
+    area = areas.area_entre(['x', 'x**2'], 0, 2)
+    assert area.valor == pytest.approx(1.0, abs=1e-10)
+    assert area.cortes == pytest.approx([1.0])
+
+def test_area_entre_varias_curvas():
+    area = nucleo.area_entre_funciones(['sin(x)', 'cos(x)', '0'], 0, np.pi)
+    # Entre la más alta y la más baja de las tres
+    x = np.linspace(0, np.pi, 200001)
+    valores = np.stack([np.sin(x), np.cos(x), 0 * x])
+    altura = valores.max(axis=0) - valores.min(axis=0)
+    assert area.valor == pytest.approx(np.trapezoid(altura, x), abs=1e-6)
+
+def test_limites_invertidos():
+    assert areas.area_entre(['x', 'x**2'], 2, 0).valor == pytest.approx(1.0, abs=1e-10)
+
+@pytest.mark.parametrize('a', [0.0, 1.0])
+def test_intervalo_vacio(a):
+    assert areas.area_entre(['x', 'x**2'], a, a).valor == 0.0
+    assert nucleo.area_entre_funciones(['x', 'x**2'], a, a).valor == 0.0
+
+def test_curva_con_nan_termina():
+    area = nucleo.area_entre_curvas('sqrt(x)', None, -1, 1)
+    assert np.isnan(area.valor)
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('x**2', 'x**2'), ('y = sin(x)', 'sin(x)'), ('x = y**2', None),
+    ('x**2 + y**2 = 9', None), ('  ', None),
+])
+def test_funcion_explicita(texto, esperado):
+    assert trazado.funcion_explicita(texto) == esperado
@@ -0,0 +1,44 @@
+import pytest
+import sympy as sp
+import cache_primitivas
+
+x = sp.Symbol('x')
+
+@pytest.fixture
+def cache(tmp_path):
+    return cache_primitivas.CachePrimitivas(str(tmp_path / 'primitivas.sqlite'))
+
+def test_guarda_y_recupera(cache):
+    expr = x * sp.exp(x) + 1 / (1 + x ** 2)
+    primitiva = cache.primitiva(expr, x)
+    assert cache.obtener(expr, x) == primitiva
+    assert cache.integral_definida(expr, x, 0, 1) == sp.integrate(expr, (x, 0, 1))
+
+def test_entrada_manipulada_no_se_ejecuta(cache, tmp_path):
+    marca = tmp_path / 'marca'
+    cache.guardar(x, x, x ** 2 / 2)
+    with cache._conexion() as con:
+        con.execute("UPDATE primitivas SET primitiva = ?",
+                    (f"__import__('os').system('touch {marca}')",))
+    assert cache.obtener(x, x) is None
+    assert cache.primitiva(x, x) == x ** 2 / 2
+    assert not marca.exists()
+
+def test_discontinua_no_calcula_la_primitiva(cache, monkeypatch):
+    def prohibida(*args):
+        raise AssertionError("No debería calcular la primitiva")
+    monkeypatch.setattr(cache, 'primitiva', prohibida)
+    assert cache.integral_definida(1 / x, x, -1, 1) is None
+
+@pytest.mark.parametrize('expr', [
+    sp.Piecewise((x, x > 0), (0, True)),
+    sp.Function('f')(x) + sp.Symbol('y', positive=True),
+    sp.Float('0.1', 30) * sp.erf(x) + sp.pi * sp.I,
+])
+def test_leer_srepr(expr):
+    assert cache_primitivas.leer_srepr(sp.srepr(expr)) == expr
+
+@pytest.mark.parametrize('texto', ["sin('__import__(\"os\")')", "Symbol('x').__class__", "(lambda: 1)()"])
+def test_leer_srepr_rechaza(texto):
+    with pytest.raises(ValueError):
+        cache_primitivas.leer_srepr(texto)
@@ -0,0 +1,82 @@
+import math
+import numpy as np
+import pytest
+import cuadratura
+import reglas
+
+ADAPTATIVOS = ['gauss_kronrod', 'gauss_kronrod_21', 'gauss_kronrod_31']
+
+@pytest.mark.parametrize('metodo', list(cuadratura.METODOS))
+def test_integral_conocida(metodo):
+    valor, error, _ = cuadratura.integrar(np.sin, 0, math.pi, metodo)
+    assert valor == pytest.approx(2.0, abs=1e-8)
+
+@pytest.mark.parametrize('metodo', ADAPTATIVOS)
+def test_nan_en_el_intervalo_termina(metodo):
+    valor, error, evaluaciones = cuadratura.integrar(np.sqrt, -1, 1, metodo)
+    assert math.isnan(valor) and math.isnan(error)
+    assert evaluaciones <= cuadratura.MAX_EVALUACIONES
+
+def test_infinito_en_un_nodo_termina():
+    valor, error, _ = cuadratura.integrar(lambda x: 1 / x, -1, 1)
+    assert not math.isfinite(valor) and not math.isfinite(error)
+
+@pytest.mark.parametrize('n, bloque', [(1000, 1 << 20), (1000, 64)])
+def test_simpson_por_bloques(n, bloque):
+    valor, error, evaluaciones = cuadratura.simpson_por_bloques(np.sin, 0, math.pi, n, bloque)
+    assert valor == pytest.approx(2.0, abs=1e-11)
+    assert evaluaciones == n + 1
+
+def test_simpson_infinito_en_un_nodo():
+    # Con la suma compensada, inf - inf daba NaN
+    valor, _, _ = cuadratura.simpson_por_bloques(lambda x: 1 / x ** 2, 0, 1, 100, 16)
+    assert valor == math.inf
+
+def test_suma_compensada():
+    suma = cuadratura._SumaCompensada()
+    for valor in [1e16, 1.0, -1e16] * 1000:
+        suma.sumar(valor)
+    assert suma.total == 1000.0
+
+@pytest.mark.parametrize('metodo', list(cuadratura.METODOS))
+def test_limites_invertidos(metodo):
+    valor, _, _ = cuadratura.integrar(np.sin, math.pi, 0, metodo)
+    assert valor == pytest.approx(-2.0, abs=1e-8)
+
+@pytest.mark.parametrize('a, b, esperado', [(0, np.inf, 1.0), (-np.inf, 0, 1.0), (-np.inf, np.inf, 2.0)])
+def test_limites_infinitos(a, b, esperado):
+    valor, _, _ = cuadratura.integrar(lambda x: np.exp(-np.abs(x)), a, b)
+    assert valor == pytest.approx(esperado, abs=1e-8)
+
+@pytest.mark.parametrize('metodo', ADAPTATIVOS + ['simpson_adaptativo', 'tanh_sinh'])
+def test_error_estimado_acota(metodo):
+    # Singularidad en el extremo: el error estimado no debe quedarse corto
+    valor, error, evaluaciones = cuadratura.integrar(lambda x: 1 / np.sqrt(x), 0, 1, metodo,
+                                                     tol_abs=1e-6, tol_rel=1e-6)
+    assert abs(valor - 2.0) <= max(error, 1e-6) * 10
+    assert evaluaciones <= cuadratura.MAX_EVALUACIONES
+
+@pytest.mark.parametrize('metodo', ADAPTATIVOS + ['simpson_adaptativo', 'tanh_sinh'])
+def test_respeta_max_evaluaciones(metodo):
+    _, _, evaluaciones = cuadratura.integrar(lambda x: np.sin(1 / x), 1e-6, 1, metodo,
+                                             tol_abs=0.0, tol_rel=0.0, max_evaluaciones=2000)
+    assert evaluaciones <= 2000
+
+def test_metodo_desconocido():
+    with pytest.raises(ValueError):
+        cuadratura.integrar(np.sin, 0, 1, 'trapecio')
+
+@pytest.mark.parametrize('familia, orden, grado', [('gauss_legendre', 5, 9), ('gauss_kronrod', 7, 22),
+                                                   ('clenshaw_curtis', 16, 17)])
+def test_reglas_exactas_en_polinomios(familia, orden, grado):
+    nodos, pesos, _ = reglas.regla(familia, orden)
+    for k in range(grado + 1):
+        exacto = 0.0 if k % 2 else 2 / (k + 1)
+        assert np.dot(pesos, nodos ** k) == pytest.approx(exacto, abs=1e-12)
+
+@pytest.mark.parametrize('familia, orden', [('gauss_kronrod', 7), ('clenshaw_curtis', 16)])
+def test_reglas_anidadas(familia, orden):
+    nodos, _, pesos_anidada = reglas.regla(familia, orden)
+    # La regla anidada también integra bien polinomios de grado bajo
+    assert np.dot(pesos_anidada, nodos ** 4) == pytest.approx(2 / 5, abs=1e-12)
+    assert not nodos.flags.writeable and reglas.regla(familia, orden).nodos is nodos
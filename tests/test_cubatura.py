@@ -0,0 +1,45 @@
+import logging
+import math
+import numpy as np
+import pytest
+import cubatura
+import nucleo
+
+METODOS = list(cubatura.METODOS)
+
+@pytest.mark.parametrize('metodo', METODOS)
+def test_disco(metodo):
+    # Área del disco unidad como ∬ 1 dA entre las dos semicircunferencias
+    resultado = cubatura.integrar_region('1', [(-1, 1), ('-sqrt(1 - x**2)', 'sqrt(1 - x**2)')], metodo,
+                                         tol_abs=1e-6, tol_rel=1e-6)
+    assert resultado.valor == pytest.approx(math.pi, abs=1e-4)
+
+@pytest.mark.parametrize('metodo', METODOS)
+def test_triple(metodo):
+    resultado = nucleo.integral_triple(lambda x, y, z: x * y * z, 0, 1, 0, 1, 0, 1, metodo)
+    assert resultado.valor == pytest.approx(1 / 8, abs=1e-6)
+
+@pytest.mark.parametrize('metodo', METODOS)
+def test_no_finito(metodo):
+    # sqrt(y) con y < 0: antes se tomaba como 0 y el resultado parecía válido
+    with pytest.raises(cubatura.IntegrandoNoFinito):
+        cubatura.integrar_region('sqrt(y)', [(0, 1), (-1, 1)], metodo)
+
+def test_divergente_avisa(caplog):
+    with caplog.at_level(logging.WARNING, logger='calcuintegrales'):
+        cubatura.integrar_region('1/(x**2 + y**2)', [(0, 1), (0, 1)], 'gauss_tensor', max_evaluaciones=100_000)
+    assert 'sin converger' in caplog.text
+
+def test_tolerancia_cero_explicita(monkeypatch):
+    recibidas = []
+    original = cubatura.integrar_region
+    monkeypatch.setattr(cubatura, 'integrar_region',
+                        lambda f, limites, metodo, tol_abs, tol_rel: recibidas.append((tol_abs, tol_rel))
+                        or original(f, limites, metodo, tol_abs, tol_rel, max_evaluaciones=10_000))
+    nucleo.integral_doble('x*y', 0, 1, 0, 1, 'gauss_tensor', tol_abs=0.0, tol_rel=0.0)
+    nucleo.integral_doble('x*y', 0, 1, 0, 1, 'gauss_tensor')
+    assert recibidas == [(0.0, 0.0), (cubatura.TOL_ABS, cubatura.TOL_REL)]
+
+def test_limites_infinitos_rechazados():
+    with pytest.raises(ValueError):
+        cubatura.integrar_region('x', [(0, np.inf), (0, 1)])
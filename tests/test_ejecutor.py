@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+import pytest
+import ejecutor
+
+@pytest.fixture
+def simbolico():
+    with ejecutor.EjecutorSimbolico(procesos=1) as e:
+        yield e
+
+def test_resultado_simbolico(simbolico):
+    resultado = simbolico.integrar('x**2', '0', '1')
+    assert resultado.metodo == 'simbolico'
+    assert resultado.valor == pytest.approx(1 / 3)
+
+def test_sin_respaldo_no_bloquea(simbolico, monkeypatch):
+    # Un respaldo numérico que nunca termina no debe colgar a quien espera
+    monkeypatch.setattr(ejecutor, 'MARGEN', 0.5)
+    monkeypatch.setattr(simbolico, '_respaldo_numerico', lambda trabajo, motivo: None)
+    with pytest.raises(ejecutor.TiempoAgotado):
+        simbolico.integrar('exp(-x**2)*cos(x**3)*log(1+x**4)', '0', '1', tiempo_limite=0.1)
+
+def test_fallo_del_supervisor(simbolico, monkeypatch):
+    def roto():
+        raise RuntimeError("fallo")
+    monkeypatch.setattr(simbolico, '_asignar', roto)
+    futuro = simbolico.enviar('x', '0', '1')
+    with pytest.raises(RuntimeError):
+        futuro.result(timeout=10)
+    assert simbolico.cerrado
+
+DIFICIL = 'exp(-x**2)*cos(x**3)*log(1+x**4)'
+
+def test_cola_pasa_al_numerico(simbolico, monkeypatch):
+    # Con un solo proceso, los trabajos en cola detrás de uno lento no deben agotar su plazo
+    monkeypatch.setattr(ejecutor, 'MARGEN', 2.0)
+    with ThreadPoolExecutor(max_workers=4) as hilos:
+        futuros = [hilos.submit(simbolico.integrar, DIFICIL, '0', str(k + 1), 1.0) for k in range(4)]
+        resultados = [futuro.result() for futuro in futuros]
+    assert all(r.metodo == 'numerico' for r in resultados[1:])
+    assert not simbolico.cerrado
+
+def test_conexion_reiniciada(simbolico, monkeypatch):
+    # Un trabajador que muere con ConnectionResetError se sustituye, sin cerrar el ejecutor
+    recibir = Connection.recv
+    fallos = []
+    def roto(conexion):
+        if not fallos:
+            fallos.append(conexion)
+            raise ConnectionResetError("reiniciada")
+        return recibir(conexion)
+    monkeypatch.setattr(Connection, 'recv', roto)
+    resultado = simbolico.integrar('x**2', '0', '1')
+    assert resultado.metodo == 'numerico' and resultado.valor == pytest.approx(1 / 3)
+    assert fallos and not simbolico.cerrado
+    assert simbolico.integrar('x', '0', '1').metodo == 'simbolico'
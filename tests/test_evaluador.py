@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import evaluador
+
+X = np.linspace(0.5, 2, 7)
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('np.sin(x) + x**2', np.sin(X) + X ** 2),
+    ('exp(-x) * cos(pi * x)', np.exp(-X) * np.cos(np.pi * X)),
+    ('2**10', np.full_like(X, 1024.0)),
+    ('x**(1/2)', np.sqrt(X)),
+    ('numpy.log1p(x) / 3', np.log1p(X) / 3),
+])
+def test_compilar(texto, esperado):
+    assert np.allclose(evaluador.compilar(texto)(X), esperado)
+
+@pytest.mark.parametrize('texto', [
+    "__import__('os').system('true')",
+    'x.__class__',
+    'open("f")',
+    '(lambda: 1)()',
+    '[x for x in ()]',
+    'np.linalg.inv(x)',
+    'x if x else 1',
+    "'a' * 3",
+    'sin(x, out=x)',
+])
+def test_rechaza_fuera_de_la_lista(texto):
+    with pytest.raises(evaluador.ExpresionNoPermitida):
+        evaluador.compilar(texto)
+
+@pytest.mark.parametrize('texto', ['9**9**9**9', 'x**9**9**9', '(10**300)**2', '0**-1'])
+def test_rechaza_potencias_constantes_enormes(texto):
+    with pytest.raises(evaluador.ExpresionNoPermitida):
+        evaluador.compilar(texto)
+    with pytest.raises(evaluador.ExpresionNoPermitida):
+        evaluador.a_sympy(texto)
+
+def test_a_sympy():
+    import sympy as sp
+    x = sp.Symbol('x')
+    assert evaluador.a_sympy('np.arcsin(x) + log10(x) + e') == sp.asin(x) + sp.log(x, 10) + sp.E
+    assert evaluador.a_sympy('0.1 * x') == x / 10
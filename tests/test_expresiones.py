@@ -0,0 +1,10 @@
+import expresiones
+
+def test_estadisticas_de_ambas_caches():
+    expresiones.limpiar_cache()
+    expresiones.compilar_expresion('x**2')
+    expresiones.compilar_expresion('x**2')
+    expresiones.compilar_multivariable('x*y')
+    info = expresiones.estadisticas()
+    assert (info['compilar_expresion'].hits, info['compilar_expresion'].misses) == (1, 1)
+    assert (info['compilar_multivariable'].hits, info['compilar_multivariable'].misses) == (0, 1)
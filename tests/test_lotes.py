@@ -0,0 +1,54 @@
+import math
+import numpy as np
+import pytest
+import cuadratura
+import lotes
+
+EXPRESIONES = ['x**2', 'sin(x)', 'exp(-x)*cos(3*x)', '1/(1 + x**2)']
+
+@pytest.mark.parametrize('n', [0, -2, 3])
+def test_particiones_invalidas(n):
+    with pytest.raises(ValueError):
+        lotes.pesos_simpson(n)
+
+@pytest.mark.parametrize('expresion', EXPRESIONES)
+@pytest.mark.parametrize('n', [2, 1000, 1002])
+def test_igual_que_simpson_por_bloques(expresion, n):
+    from expresiones import compilar_expresion
+    f = compilar_expresion(expresion).funcion
+    a = np.array([0.0, -1.0, 2.0, 3.0])
+    b = np.array([1.0, 1.0, -0.5, 3.0])
+    valores, errores, evaluaciones = lotes.integrar_lote(expresion, a, b, n)
+    assert evaluaciones == (n + 1) * a.size
+    for k in range(a.size):
+        esperado = cuadratura.simpson_por_bloques(f, a[k], b[k], n)
+        assert valores[k] == pytest.approx(esperado.valor, rel=1e-12, abs=1e-14)
+        if n % 4 == 0:
+            assert errores[k] == pytest.approx(esperado.error, rel=1e-6, abs=1e-14)
+        else:
+            assert math.isnan(errores[k])
+
+def test_varias_expresiones_a_la_vez():
+    a, b = np.array([0.0, 0.0]), np.array([1.0, math.pi])
+    valores, _, _ = lotes.integrar_lote(['x**2', 'sin(x)', '1'], a, b, 1000)
+    assert valores.shape == (3, 2)
+    assert valores[0] == pytest.approx([1 / 3, math.pi ** 3 / 3])
+    assert valores[1] == pytest.approx([1 - math.cos(1), 2.0])
+    assert valores[2] == pytest.approx([1.0, math.pi])
+
+def test_bloques_de_la_malla():
+    # Con pocos elementos por bloque el resultado no cambia
+    a = np.linspace(0, 1, 50)
+    completo = lotes.integrar_lote('sin(x)', a, a + 1, 100)
+    por_bloques = lotes.integrar_lote('sin(x)', a, a + 1, 100, max_elementos=250)
+    assert np.allclose(completo.valor, por_bloques.valor, rtol=0, atol=1e-15)
+    assert np.allclose(completo.valor, np.cos(a) - np.cos(a + 1), atol=1e-9)
+
+def test_integrar_trabajos():
+    expresiones = ['x**2', 'sin(x)', 'x**2', 'exp(x)']
+    a = [0, 0, 1, 0]
+    b = [1, math.pi, 2, 1]
+    valores, errores, evaluaciones = lotes.integrar_trabajos(expresiones, a, b, 1000)
+    assert valores == pytest.approx([1 / 3, 2.0, 7 / 3, math.e - 1])
+    assert np.all(errores < 1e-10)
+    assert evaluaciones == 1001 * 4
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+import cuadratura
+import paralelo
+
+def f(x):
+    return np.sin(30 * x) * np.exp(x)
+
+# ∫_0^4 sin(30x) e^x dx
+EXACTO = (np.exp(4) * (np.sin(120) - 30 * np.cos(120)) + 30) / 901
+
+@pytest.mark.parametrize('metodo', list(cuadratura.METODOS))
+@pytest.mark.parametrize('trabajadores', [1, 2, 4])
+def test_limites_invertidos(metodo, trabajadores):
+    directa = paralelo.integrar_paralelo(f, 0, 4, metodo, trabajadores=trabajadores)
+    invertida = paralelo.integrar_paralelo(f, 4, 0, metodo, trabajadores=trabajadores)
+    assert directa.valor == pytest.approx(EXACTO, abs=1e-8)
+    assert invertida.valor == pytest.approx(-EXACTO, abs=1e-8)
+
+def test_intervalo_vacio():
+    assert paralelo.integrar_paralelo(f, 1, 1, trabajadores=4).valor == 0.0
+
+@pytest.mark.parametrize('n', [2, 6, 100, 1000])
+def test_simpson_igual_que_un_trabajador(n):
+    uno = cuadratura.simpson_por_bloques(f, 0, 4, n)
+    varios = paralelo.simpson_paralelo(f, 0, 4, n, trabajadores=4)
+    assert varios.valor == pytest.approx(uno.valor, rel=1e-12, abs=1e-12)
@@ -0,0 +1,49 @@
+import mpmath
+import pytest
+import sympy as sp
+import ejecutor
+import nucleo
+import precision
+
+def test_simbolica_a_la_precision_pedida():
+    resultado = precision.integral_precisa('x**2', '1/3', 'pi', 40)
+    assert resultado.metodo == 'simbolico'
+    with mpmath.workdps(50):
+        assert precision.texto(resultado.valor, 40) == mpmath.nstr(mpmath.pi ** 3 / 3 - mpmath.mpf(1) / 81, 40)
+
+@pytest.mark.parametrize('metodo', list(precision.METODOS))
+def test_mpmath(metodo):
+    resultado = precision.integral_mpmath(sp.exp(-sp.Symbol('x') ** 2), '0', 'oo', 50, metodo)
+    with mpmath.workdps(50):
+        assert abs(resultado.valor - mpmath.sqrt(mpmath.pi) / 2) < mpmath.mpf(10) ** -40
+
+def test_no_real_en_ambos_caminos(monkeypatch):
+    with pytest.raises(ValueError, match="no es real"):
+        precision.integral_precisa('sqrt(x)', '-1', '1', 30, simbolica=False)
+    # Resultado simbólico complejo: mismo error en lugar de quedarse con la parte real
+    exacto = sp.Rational(2, 3) + 2 * sp.I / 3
+    monkeypatch.setattr(nucleo, 'integral_simbolica', lambda *args: ejecutor.ResultadoSimbolico(
+        complex(exacto), exacto, 'simbolico', 0.0))
+    with pytest.raises(ValueError, match="no es real"):
+        precision.integral_precisa('sqrt(x)', '-1', '1', 30)
+
+def test_limite_numerico():
+    assert precision.limite_numerico('1/3') == pytest.approx(1 / 3)
+    assert precision.limite_numerico('pi') == pytest.approx(3.141592653589793)
+    assert precision.limite_numerico('-oo') == float('-inf')
+
+def test_area_precisa():
+    resultado, cortes = precision.area_precisa(['x**2', 'x'], '0', '2', 40)
+    # ∫_0^1 (x - x²) + ∫_1^2 (x² - x) = 1/6 + 5/6
+    assert cortes == pytest.approx([1.0])
+    with mpmath.workdps(40):
+        assert abs(resultado.valor - 1) < mpmath.mpf(10) ** -35
+
+def test_area_precisa_una_funcion_con_signo():
+    # Como area_entre_curvas(f, None): ∫_0^2π sin = 0, no ∫|sin| = 4
+    resultado, cortes = precision.area_precisa(['sin(x)'], '0', '2*pi', 30)
+    assert cortes == pytest.approx([3.141592653589793])
+    with mpmath.workdps(30):
+        assert abs(resultado.valor) < mpmath.mpf(10) ** -25
+    valor, _, _ = nucleo.area_entre_curvas('sin(x)', None, 0, 2 * 3.141592653589793)
+    assert valor == pytest.approx(0, abs=1e-9)
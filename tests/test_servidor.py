@@ -0,0 +1,112 @@
+import asyncio
+import json
+import threading
+import pytest
+import servidor
+
+async def _peticion(cuerpo, cabeceras, ruta='/integral'):
+    servicio = servidor.Servicio(hilos=1)
+    servidor_tcp = await asyncio.start_server(servicio.atender, '127.0.0.1', 0)
+    puerto = servidor_tcp.sockets[0].getsockname()[1]
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    datos = json.dumps(cuerpo).encode()
+    lineas = ''.join(f"{k}: {v}\r\n" for k, v in cabeceras.items())
+    escritor.write(f"POST {ruta} HTTP/1.1\r\n{lineas}Content-Length: {len(datos)}\r\n"
+                   "Connection: close\r\n\r\n".encode() + datos)
+    respuesta = await lector.read()
+    escritor.close()
+    servidor_tcp.close()
+    cabecera, _, cuerpo = respuesta.partition(b'\r\n\r\n')
+    return int(cabecera.split()[1]), json.loads(cuerpo)
+
+LOCAL = {'Host': '127.0.0.1:8765', 'Content-Type': 'application/json'}
+
+def test_integral_local():
+    estado, respuesta = asyncio.run(_peticion({'expresion': 'np.sin(x)', 'a': 0, 'b': 1}, LOCAL))
+    assert estado == 200
+    assert respuesta['valor'] == pytest.approx(0.45969769413186023)
+
+def test_rechaza_codigo(tmp_path):
+    marca = tmp_path / 'marca'
+    expresion = f"__import__('os').system('touch {marca}')"
+    for metodo in ('simbolico', 'gauss_kronrod'):
+        estado, _ = asyncio.run(_peticion({'expresion': expresion, 'a': 0, 'b': 1, 'metodo': metodo}, LOCAL))
+        assert estado == 400
+    assert not marca.exists()
+
+def test_rechaza_otro_tipo_de_contenido():
+    estado, _ = asyncio.run(_peticion({'expresion': 'x', 'a': 0, 'b': 1},
+                                      {'Host': 'localhost', 'Content-Type': 'text/plain'}))
+    assert estado == 415
+
+@pytest.mark.parametrize('host', ['ejemplo.com', 'ejemplo.com:8765', ''])
+def test_rechaza_host_externo(host):
+    estado, _ = asyncio.run(_peticion({'expresion': 'x', 'a': 0, 'b': 1},
+                                      {'Host': host, 'Content-Type': 'application/json'}))
+    assert estado == 403
+
+@pytest.mark.parametrize('host', ['localhost', 'localhost:8765', '127.0.0.1', '[::1]:8765'])
+def test_host_local(host):
+    assert servidor._host_local(host)
+
+def test_simpson_sin_error_estimado_es_json_estricto():
+    # Con n no múltiplo de 4 no hay error de Richardson: null, no NaN
+    estado, respuesta = asyncio.run(_peticion({'expresion': 'x', 'a': 0, 'b': 1, 'n': 1002}, LOCAL, '/simpson'))
+    assert estado == 200
+    assert respuesta['valor'] == pytest.approx(0.5) and respuesta['error'] is None
+
+def test_integral_no_finita():
+    estado, respuesta = asyncio.run(_peticion({'expresion': '1/x', 'a': -1, 'b': 1}, LOCAL))
+    assert estado == 422 and 'fallo' in respuesta
+
+@pytest.mark.parametrize('a', ['nan', 'inf', '-inf'])
+def test_rechaza_limites_no_finitos(a):
+    estado, _ = asyncio.run(_peticion({'expresion': 'x', 'a': a, 'b': 1}, LOCAL))
+    assert estado == 400
+
+async def _crudo(largo):
+    servicio = servidor.Servicio(hilos=1)
+    servidor_tcp = await asyncio.start_server(servicio.atender, '127.0.0.1', 0)
+    puerto = servidor_tcp.sockets[0].getsockname()[1]
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    escritor.write(f"POST /integral HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {largo}\r\n\r\n{{}}".encode())
+    respuesta = await lector.read()
+    escritor.close()
+    servidor_tcp.close()
+    return respuesta
+
+@pytest.mark.parametrize('largo', ['abc', '-5', '1e3'])
+def test_content_length_invalido(largo):
+    respuesta = asyncio.run(_crudo(largo))
+    assert respuesta.startswith(b'HTTP/1.1 400')
+
+def test_simbolicas_lentas_no_bloquean_simpson(monkeypatch):
+    liberar = threading.Event()
+    def lenta(expresion, a, b):
+        liberar.wait(10)
+        return {'valor': 0.0, 'error': 0.0, 'metodo': 'simbolico', 'exacto': None}
+    monkeypatch.setattr(servidor, '_integral_simbolica', lenta)
+
+    async def escenario():
+        servicio = servidor.Servicio(hilos=2)
+        lenta_json = json.dumps({'expresion': 'x', 'a': 0, 'b': 1, 'metodo': 'simbolico', 'plazo_ms': 50})
+        estados = [(await servicio.resolver('POST', '/integral', lenta_json))[0] for _ in range(2)]
+        # Los hilos simbólicos siguen ocupados, pero Simpson tiene los suyos
+        simpson = await servicio.resolver('POST', '/simpson', json.dumps({'expresion': 'x', 'a': 0, 'b': 1,
+                                                                          'plazo_ms': 2000}))
+        abandonados = servicio.abandonados
+        # Los cálculos abandonados cuentan para el límite de pendientes
+        servicio.max_pendientes = 2
+        saturado = (await servicio.resolver('POST', '/simpson', json.dumps({'expresion': 'x', 'a': 0, 'b': 1})))[0]
+        liberar.set()
+        for _ in range(100):
+            if not servicio.abandonados:
+                break
+            await asyncio.sleep(0.01)
+        return estados, simpson, abandonados, saturado, servicio.abandonados
+
+    estados, simpson, abandonados, saturado, al_final = asyncio.run(escenario())
+    assert estados == [504, 504]
+    assert simpson[0] == 200 and simpson[1]['valor'] == pytest.approx(0.5)
+    assert abandonados == 2 and saturado == 503 and al_final == 0
@@ -0,0 +1,35 @@
+import numpy as np
+import teselas
+
+def _vista(cache, centro, ancho, alto):
+    return cache.muestrear('sin', np.sin, centro - ancho / 2, centro + ancho / 2, 800, (-alto / 2, alto / 2), 600)
+
+def test_desplazar_reutiliza():
+    cache = teselas.CacheTeselas()
+    _vista(cache, 0.0, 10, 4)
+    fallos = cache.fallos
+    _vista(cache, 1.0, 10, 4)
+    # Solo la tesela nueva del borde
+    assert cache.fallos - fallos <= 1
+
+def test_reducir_y_ampliar_reutiliza():
+    cache = teselas.CacheTeselas()
+    _vista(cache, 0.3, 10, 4)
+    fallos_inicio = cache.fallos
+    # Zoom anclado al cursor: cambian a la vez el rango de x y la escala vertical
+    x, y = _vista(cache, 0.3, 20, 8)
+    assert cache.aciertos > 0
+    assert cache.fallos - fallos_inicio < 6
+    finitos = np.isfinite(y)
+    assert np.allclose(y[finitos], np.sin(x[finitos]))
+    aciertos, fallos = cache.aciertos, cache.fallos
+    _vista(cache, 0.3, 10, 4)
+    assert cache.fallos == fallos and cache.aciertos > aciertos
+
+def test_tolerancia_mas_gruesa_no_sirve():
+    cache = teselas.CacheTeselas()
+    _vista(cache, 0.0, 10, 40)
+    fallos = cache.fallos
+    # Misma x con una escala vertical mucho menor: hace falta más detalle
+    _vista(cache, 0.0, 10, 0.5)
+    assert cache.fallos > fallos
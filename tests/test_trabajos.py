@@ -0,0 +1,54 @@
+import io
+import json
+import time
+import pytest
+import trabajos
+
+def _filas(total, pausa=0.0, leidas=None):
+    for i in range(1, total + 1):
+        if pausa:
+            time.sleep(pausa)
+        if leidas is not None:
+            leidas.append(i)
+        yield i, {'expresion': 'x**2', 'a': 0, 'b': i % 5}
+
+@pytest.mark.parametrize('procesos', [1, 2])
+def test_orden_y_valores(procesos):
+    resultados = list(trabajos.ejecutar(_filas(40), procesos=procesos))
+    assert [r['id'] for r in resultados] == list(range(1, 41))
+    for r in resultados:
+        assert r['valor'] == pytest.approx((r['id'] % 5) ** 3 / 3)
+
+def test_resultados_antes_del_final_de_la_entrada():
+    # Entrada lenta: los primeros resultados salen mientras se sigue leyendo
+    leidas = []
+    total = 60
+    resultados = trabajos.ejecutar(_filas(total, pausa=0.1, leidas=leidas), procesos=2)
+    next(resultados)
+    assert len(leidas) < total
+    assert len(list(resultados)) == total - 1
+
+def test_bloques_crecientes():
+    tamanos = [len(b) for b in trabajos._bloques(range(100), 16)]
+    assert tamanos == [1, 2, 4, 8, 16, 16, 16, 16, 16, 5]
+
+def test_jsonl_estricto():
+    flujo = io.StringIO()
+    escritor = trabajos.Escritor(flujo)
+    # n no múltiplo de 4: Simpson no tiene error estimado
+    escritor.escribir(trabajos.resolver(1, {'expresion': 'x', 'a': 0, 'b': 1, 'metodo': 'simpson', 'n': 1002}))
+    linea = flujo.getvalue()
+    assert 'NaN' not in linea
+    resultado = json.loads(linea, parse_constant=lambda c: pytest.fail(f"{c} no es JSON"))
+    assert resultado['error'] is None and resultado['valor'] == pytest.approx(0.5)
+
+def test_ids_por_archivo(tmp_path):
+    archivos = []
+    for nombre in ('a.jsonl', 'b.jsonl'):
+        ruta = tmp_path / nombre
+        ruta.write_text('{"expresion": "x", "a": 0, "b": 1}\n', encoding='utf-8')
+        archivos.append(str(ruta))
+    filas = [fila for archivo in archivos for fila in trabajos.leer(archivo)]
+    ids = [r['id'] for r in trabajos.ejecutar(filas, procesos=1)]
+    assert len(set(ids)) == 2
+    assert ids[0].endswith('a.jsonl:1') and ids[1].endswith('b.jsonl:1')
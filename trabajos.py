@@ -0,0 +1,184 @@
+"""Integración por lotes de trabajos leídos de CSV o JSONL, sin interfaz gráfica.
+
+Cada trabajo tiene expresion, a, b y opcionalmente metodo ('simbolico',
+'simpson' o uno de cuadratura.METODOS), tolerancia, n (particiones de
+Simpson) e id (por defecto 'archivo:línea'). Los trabajos se reparten en
+bloques entre procesos y los resultados salen en el mismo orden de la
+entrada, uno por línea, en cuanto están listos. La salida JSONL es JSON
+estricto: los valores no finitos (por ejemplo el error de Simpson con n no
+múltiplo de 4) salen como null.
+"""
+import csv
+import json
+import math
+import os
+import re
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+# Trabajos que se envían juntos a un proceso
+TAMANO_BLOQUE = 64
+# Bloques en vuelo o esperando turno por proceso (limita la memoria con entradas enormes)
+BLOQUES_POR_PROCESO = 4
+METODO_POR_DEFECTO = 'gauss_kronrod'
+N_SIMPSON = 1000
+CAMPOS_SALIDA = ['id', 'expresion', 'a', 'b', 'metodo', 'valor', 'error', 'evaluaciones',
+                 'segundos', 'fallo']
+
+def leer(archivo, formato=None):
+    """Genera ('archivo:línea', dict) de un archivo CSV con cabecera o JSONL ('-' = entrada estándar).
+
+    El origen sirve de id a los trabajos que no traen uno, sin repetirse
+    entre archivos.
+    """
+    if formato is None:
+        formato = 'csv' if archivo.lower().endswith('.csv') else 'jsonl'
+    flujo = sys.stdin if archivo == '-' else open(archivo, newline='', encoding='utf-8')
+    nombre = 'stdin' if archivo == '-' else archivo
+    try:
+        if formato == 'csv':
+            for numero, fila in enumerate(csv.DictReader(flujo), start=2):
+                yield f"{nombre}:{numero}", fila
+        else:
+            for numero, linea in enumerate(flujo, start=1):
+                if linea.strip():
+                    try:
+                        yield f"{nombre}:{numero}", json.loads(linea)
+                    except ValueError as e:
+                        yield f"{nombre}:{numero}", {'fallo': f"JSON inválido: {e}"}
+    finally:
+        if flujo is not sys.stdin:
+            flujo.close()
+
+def _numero(valor):
+    return float(valor) if not isinstance(valor, (int, float)) else valor
+
+def _finito(valor):
+    """valor, o None si es un float no finito (JSON estricto no admite NaN ni Infinity)."""
+    return None if isinstance(valor, float) and not math.isfinite(valor) else valor
+
+def _graficar(carpeta, identificador, expresion, a, b, valor):
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    from muestreo import muestrear
+    from nucleo import funcion_numerica
+    x_vals, y_vals = muestrear(funcion_numerica(expresion), float(a), float(b))
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    ax.plot(x_vals, y_vals, label=f'f(x) = {expresion}')
+    ax.fill_between(x_vals, y_vals, alpha=0.3, label=f'Área = {valor:.4f}')
+    ax.legend()
+    ax.grid(True)
+    ax.set_title(f'Integral de {expresion} entre {a} y {b}')
+    # El id puede traer la ruta del archivo de entrada
+    fig.savefig(os.path.join(carpeta, re.sub(r'[^\w.-]', '_', str(identificador)) + '.png'))
+
+def resolver(origen, fila, carpeta_graficos=None):
+    """Calcula un trabajo (origen es el id si la fila no trae uno); los errores van en 'fallo'."""
+    from nucleo import integral_simbolica, integral_numerica, integral_simpson
+    from cuadratura import TOL_ABS
+    fila = {k: v for k, v in fila.items() if v not in (None, '')}
+    resultado = {'id': fila.get('id', origen), 'expresion': fila.get('expresion'),
+                 'a': fila.get('a'), 'b': fila.get('b'),
+                 'metodo': fila.get('metodo', METODO_POR_DEFECTO)}
+    if 'fallo' in fila:
+        resultado['fallo'] = fila['fallo']
+        return resultado
+    inicio = time.perf_counter()
+    try:
+        expresion, metodo = fila['expresion'], resultado['metodo']
+        a, b = _numero(fila['a']), _numero(fila['b'])
+        if metodo == 'simbolico':
+            valor, _, usado, error = integral_simbolica(expresion, a, b)
+            resultado.update(valor=valor, error=error, evaluaciones=None, metodo=f'simbolico/{usado}')
+        elif metodo == 'simpson':
+            n = int(fila.get('n', N_SIMPSON))
+            valor, error, evaluaciones = integral_simpson(expresion, a, b, n)
+            resultado.update(valor=valor, error=error, evaluaciones=evaluaciones)
+        else:
+            tolerancia = _numero(fila.get('tolerancia', TOL_ABS))
+            valor, error, evaluaciones = integral_numerica(expresion, a, b, metodo, tolerancia, tolerancia)
+            resultado.update(valor=valor, error=error, evaluaciones=evaluaciones)
+        if carpeta_graficos:
+            _graficar(carpeta_graficos, resultado['id'], expresion, a, b, resultado['valor'])
+    except Exception as e:
+        resultado['fallo'] = f"{type(e).__name__}: {e}"
+    resultado['segundos'] = time.perf_counter() - inicio
+    for clave in ('valor', 'error'):
+        if clave in resultado and resultado[clave] is not None:
+            resultado[clave] = float(resultado[clave])
+    return resultado
+
+def _resolver_bloque(bloque, carpeta_graficos):
+    return [resolver(origen, fila, carpeta_graficos) for origen, fila in bloque]
+
+def _bloques(filas, tamano):
+    """Bloques de 1, 2, 4, ... hasta tamano filas: los primeros resultados salen enseguida."""
+    bloque = []
+    actual = 1
+    for fila in filas:
+        bloque.append(fila)
+        if len(bloque) == actual:
+            yield bloque
+            bloque = []
+            actual = min(2 * actual, tamano)
+    if bloque:
+        yield bloque
+
+def ejecutar(filas, procesos=None, carpeta_graficos=None, tamano_bloque=TAMANO_BLOQUE):
+    """Genera los resultados de (origen, fila) en orden, calculados en un pool de procesos."""
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        for origen, fila in filas:
+            yield resolver(origen, fila, carpeta_graficos)
+        return
+    contexto = multiprocessing.get_context('spawn')
+    ventana = procesos * BLOQUES_POR_PROCESO
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as pool:
+        en_vuelo = {}
+        # Bloques terminados que esperan a los anteriores para salir en orden
+        terminados = {}
+        siguiente = 0
+
+        def recoger(espera):
+            hechos, _ = wait(en_vuelo, timeout=espera, return_when=FIRST_COMPLETED)
+            for futuro in hechos:
+                terminados[en_vuelo.pop(futuro)] = futuro.result()
+
+        for indice, bloque in enumerate(_bloques(filas, tamano_bloque)):
+            en_vuelo[pool.submit(_resolver_bloque, bloque, carpeta_graficos)] = indice
+            recoger(0)
+            while True:
+                while siguiente in terminados:
+                    yield from terminados.pop(siguiente)
+                    siguiente += 1
+                if len(en_vuelo) + len(terminados) < ventana:
+                    break
+                recoger(None)
+        while en_vuelo:
+            recoger(None)
+            while siguiente in terminados:
+                yield from terminados.pop(siguiente)
+                siguiente += 1
+
+class Escritor:
+    """Escribe resultados como JSONL o CSV, vaciando el búfer tras cada línea."""
+
+    def __init__(self, flujo, formato='jsonl'):
+        self.flujo = flujo
+        self.formato = formato
+        self._csv = None
+        if formato == 'csv':
+            self._csv = csv.DictWriter(flujo, fieldnames=CAMPOS_SALIDA, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def escribir(self, resultado):
+        if self._csv is not None:
+            self._csv.writerow(resultado)
+        else:
+            resultado = {clave: _finito(valor) for clave, valor in resultado.items()}
+            self.flujo.write(json.dumps(resultado, ensure_ascii=False, allow_nan=False) + '\n')
+        self.flujo.flush()
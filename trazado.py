@@ -0,0 +1,59 @@
+from collections import namedtuple
+from functools import lru_cache
+from sympy import latex, Eq
+from sympy.abc import x, y
+from expresiones import compilar_expresion
+from teselas import muestrear_en_cache
+from implicitas import trazar as trazar_implicita
+
+Trazo = namedtuple('Trazo', ['x', 'y', 'latex'])
+
+@lru_cache(maxsize=256)
+def _etiqueta(variable, expr):
+    """LaTeX de variable = expr, calculado una vez por expresión."""
+    return latex(Eq(variable, expr))
+
+def _curva_en_x(expr, f, xlim, ylim, tamano_px):
+    """Trazo y = f(x) sobre el rango visible de x (teselas en caché por expresión)."""
+    x_vals, y_vals = muestrear_en_cache(('x', expr), f, xlim[0], xlim[1], tamano_px[0], ylim, tamano_px[1])
+    return Trazo(x_vals, y_vals, _etiqueta(y, expr))
+
+def _curva_en_y(expr, f, xlim, ylim, tamano_px):
+    """Trazo x = f(y) sobre el rango visible de y (teselas en caché por expresión)."""
+    y_vals, x_vals = muestrear_en_cache(('y', expr), f, ylim[0], ylim[1], tamano_px[1], xlim, tamano_px[0])
+    return Trazo(x_vals, y_vals, _etiqueta(x, expr))
+
+def calcular_trazo(texto, xlim, ylim, tamano_px=(800, 600)):
+    """Convierte el texto de una entrada en los arreglos a dibujar (None si no hay curva)."""
+    texto = texto.replace(' ', '')
+    if texto.startswith('y='):
+        expr, f, _ = compilar_expresion(texto[2:], x)
+        return _curva_en_x(expr, f, xlim, ylim, tamano_px)
+    if texto.startswith('x='):
+        expr, f, _ = compilar_expresion(texto[2:], y)
+        return _curva_en_y(expr, f, xlim, ylim, tamano_px)
+    if '=' in texto:
+        # Todas las ramas de la ecuación (resuelta una vez) o contorno en la vista
+        x_vals, y_vals, codigo = trazar_implicita(texto, xlim, ylim, tamano_px)
+        return Trazo(x_vals, y_vals, codigo)
+    expr, f, _ = compilar_expresion(texto, x)
+    return _curva_en_x(expr, f, xlim, ylim, tamano_px)
+
+def funcion_explicita(texto):
+    """Expresión en x de una entrada y = f(x) (o solo f(x)); None si es x = g(y) o implícita."""
+    texto = texto.replace(' ', '')
+    if texto.startswith('y='):
+        texto = texto[2:]
+    if not texto or '=' in texto:
+        return None
+    return texto
+
+def calcular_trazos(entradas, xlim, ylim, tamano_px=(800, 600)):
+    """Calcula los trazos de [(indice, texto), ...]; devuelve [(indice, trazo, error), ...]."""
+    resultados = []
+    for indice, texto in entradas:
+        try:
+            resultados.append((indice, calcular_trazo(texto, xlim, ylim, tamano_px), None))
+        except Exception as e:
+            resultados.append((indice, None, str(e)))
+    return resultados
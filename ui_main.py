@@ -1,28 +1,27 @@
-import io
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QScrollArea, QLabel, QSplitter, 
-                            QLineEdit, QFrame, QGridLayout)
-from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-from sympy import sympify, latex, lambdify, Eq, solve
-from sympy.abc import x, y, z
+                            QLineEdit, QFrame, QGridLayout, QShortcut, QComboBox)
+from PyQt5.QtGui import QFont, QPixmap, QKeySequence
+from PyQt5.QtCore import Qt, QTimer
 import numpy as np
+from planificador import PlanificadorGrafico
+from nucleo import area_entre_curvas, area_entre_funciones, integral_doble
+from paralelo import TRABAJADORES
+from cuadratura import NOMBRES
+from cubatura import NOMBRES as NOMBRES_CUBATURA
+import arranque
+import instrumentos
+from instrumentos import registro
+from render_latex import pixmap_latex, imagen_latex
+
+# Paleta tab10 de matplotlib, para no cargar matplotlib al arrancar
+COLORES = [tuple(int(c[i:i + 2], 16) / 255 for i in (1, 3, 5)) for c in (
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')]
 
 def set_latex_label(label, latex_code):
     """Renderiza código LaTeX como imagen y lo muestra en un QLabel."""
-    fig = plt.figure(figsize=(0.01, 0.01))
-    fig.text(0, 0, f"${latex_code}$", fontsize=16)
-    buf = io.BytesIO()
-    plt.axis('off')
-    plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.2, dpi=150, transparent=True)
-    plt.close(fig)
-    buf.seek(0)
-    pixmap = QPixmap()
-    pixmap.loadFromData(buf.getvalue())
-    label.setPixmap(pixmap)
+    label.setPixmap(pixmap_latex(latex_code, 16, 150))
 
 class EntradaFuncionWidget(QWidget):
     def __init__(self, nombre, parent=None):
@@ -69,67 +68,6 @@ class EntradaFuncionWidget(QWidget):
         if self.parent:
             self.parent.actualizar_grafico()
 
-class ZoomableFigureCanvas(FigureCanvas):
-    def __init__(self, fig, parent=None):
-        super().__init__(fig)
-        self.setParent(parent)
-        self._zoom = 1.0
-        self._base_xlim = None
-        self._base_ylim = None
-        self._panning = False
-        self._pan_start = None
-        self.setFocusPolicy(Qt.ClickFocus)
-        self.setFocus()
-
-    def wheelEvent(self, event):
-        if not self.figure.axes:
-            return
-        ax = self.figure.axes[0]
-        if self._base_xlim is None or self._base_ylim is None:
-            self._base_xlim = ax.get_xlim()
-            self._base_ylim = ax.get_ylim()
-        angle = event.angleDelta().y()
-        factor = 0.9 if angle > 0 else 1.1
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-        xmid = (xlim[0] + xlim[1]) / 2
-        ymid = (ylim[0] + ylim[1]) / 2
-        xlen = (xlim[1] - xlim[0]) * factor / 2
-        ylen = (ylim[1] - ylim[0]) * factor / 2
-        ax.set_xlim(xmid - xlen, xmid + xlen)
-        ax.set_ylim(ymid - ylen, ymid + ylen)
-        self.draw()
-        if hasattr(self.parent(), "actualizar_grafico"):
-            self.parent().actualizar_grafico()
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._panning = True
-            self._pan_start = event.pos()
-
-    def mouseMoveEvent(self, event):
-        if self._panning and self._pan_start is not None:
-            dx = event.x() - self._pan_start.x()
-            dy = event.y() - self._pan_start.y()
-            ax = self.figure.axes[0]
-            xlim = ax.get_xlim()
-            ylim = ax.get_ylim()
-            width = self.width()
-            height = self.height()
-            dx_data = -dx * (xlim[1] - xlim[0]) / width
-            dy_data = dy * (ylim[1] - ylim[0]) / height
-            ax.set_xlim(xlim[0] + dx_data, xlim[1] + dx_data)
-            ax.set_ylim(ylim[0] + dy_data, ylim[1] + dy_data)
-            self._pan_start = event.pos()
-            self.draw()
-            if hasattr(self.parent(), "actualizar_grafico"):
-                self.parent().actualizar_grafico()
-
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._panning = False
-            self._pan_start = None
-
 class GeoGebraApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -158,6 +96,15 @@ class GeoGebraApp(QMainWindow):
         self.funciones = {}
         self.entradas = []
         self.nombre_actual = ord('f')
+        # Artistas reutilizables por entrada: {indice: (línea, anotación)}
+        self.artistas = {}
+        # Código LaTeX mostrado en cada anotación: {indice: latex}
+        self.etiquetas = {}
+        # Relleno y etiqueta del último cálculo de área
+        self.artistas_area = []
+        # Cálculo de curvas agrupado y fuera del hilo de la interfaz
+        self.planificador = PlanificadorGrafico(self.dibujar_trazos, parent=self)
+        self._mostrada = False
         
         self.init_ui()
         
@@ -219,6 +166,24 @@ class GeoGebraApp(QMainWindow):
         limites_layout.addWidget(self.limite_sup)
         left_layout.addLayout(limites_layout)
 
+        # Modo: área entre las curvas o integral doble de g(x, y) sobre esa región
+        self.combo_modo = QComboBox()
+        self.combo_modo.addItems(["Área entre curvas", "Integral doble ∬ g(x, y) dA"])
+        self.combo_modo.currentIndexChanged.connect(self.cambiar_modo)
+        left_layout.addWidget(self.combo_modo)
+        self.integrando = QLineEdit()
+        self.integrando.setPlaceholderText("g(x, y) = ")
+        self.integrando.setVisible(False)
+        left_layout.addWidget(self.integrando)
+
+        # Método de cuadratura (o cubatura en modo integral doble)
+        metodo_layout = QHBoxLayout()
+        self.combo_metodo = QComboBox()
+        metodo_layout.addWidget(QLabel("Método:"))
+        metodo_layout.addWidget(self.combo_metodo)
+        left_layout.addLayout(metodo_layout)
+        self.cambiar_modo()
+
         # Botón calcular
         self.btn_calcular = QPushButton("Calcular ")
         self.btn_calcular.clicked.connect(self.calcular_area)
@@ -227,39 +192,72 @@ class GeoGebraApp(QMainWindow):
         # Resultado
         self.resultado = QLabel("Resultado: -")
         self.resultado.setStyleSheet("font-size: 16px; color: #d35400;")
+        self.resultado.setTextInteractionFlags(Qt.TextSelectableByMouse)
         left_layout.addWidget(self.resultado)
 
         # Botón teclado
         self.btn_teclado = QPushButton("🧮 Mostrar Teclado")
         self.btn_teclado.setCheckable(True)
-        self.btn_teclado.setChecked(True)
+        self.btn_teclado.setChecked(False)
         self.btn_teclado.clicked.connect(self.toggle_teclado)
         left_layout.addWidget(self.btn_teclado)
 
-        # Teclado virtual
+        # Teclado virtual (los botones se crean al mostrarlo por primera vez)
         self.teclado_widget = QWidget()
         self.teclado_layout = QHBoxLayout(self.teclado_widget)
-        self.init_teclado()
+        self.teclado_widget.setVisible(False)
         left_layout.addWidget(self.teclado_widget)
 
         # Panel izquierdo terminado
         panel_izquierdo.setLayout(left_layout)
 
-        # Gráfico
-        self.fig = Figure(figsize=(8, 6), dpi=100)
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = ZoomableFigureCanvas(self.fig)
-        self.configurar_grafico()
+        # Gráfico: se crea después de mostrar la ventana (ver cargar_grafico)
+        self.fig = None
+        self.ax = None
+        self.canvas = QLabel("Cargando gráfico…")
+        self.canvas.setAlignment(Qt.AlignCenter)
 
         # Añade ambos al splitter horizontal
         splitter_horizontal.addWidget(panel_izquierdo)
         splitter_horizontal.addWidget(self.canvas)
         splitter_horizontal.setSizes([350, 850])  # Ajusta el tamaño inicial
+        self.splitter_horizontal = splitter_horizontal
 
         main_layout.addWidget(splitter_horizontal)
 
+        # Desglose de tiempos del último cuadro, oculto (F12 lo muestra, Ctrl+F12 activa el perfil)
+        self.statusBar().hide()
+        QShortcut(QKeySequence(Qt.Key_F12), self, self.alternar_tiempos)
+        QShortcut(QKeySequence(Qt.CTRL + Qt.Key_F12), self, self.alternar_perfil)
+
         # Agregar primera entrada
         self.agregar_entrada()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._mostrada:
+            # Matplotlib y SymPy se cargan cuando la ventana ya está en pantalla
+            self._mostrada = True
+            arranque.marcar("ventana en pantalla")
+            QTimer.singleShot(0, self.cargar_grafico)
+
+    def cargar_grafico(self):
+        """Crea la figura y el lienzo de matplotlib en lugar del texto provisional."""
+        if self.ax is not None:
+            return
+        from matplotlib.figure import Figure
+        from lienzo import ZoomableFigureCanvas
+        arranque.marcar("importar matplotlib")
+        self.fig = Figure(figsize=(8, 6), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        provisional = self.canvas
+        self.canvas = ZoomableFigureCanvas(self.fig)
+        self.configurar_grafico()
+        self.splitter_horizontal.replaceWidget(1, self.canvas)
+        provisional.deleteLater()
+        arranque.marcar("crear figura")
+        self.planificador.precargar()
+        self.actualizar_grafico()
         
     def init_teclado(self):
         # Teclado numérico básico
@@ -287,6 +285,8 @@ class GeoGebraApp(QMainWindow):
         
     def toggle_teclado(self):
         visible = self.btn_teclado.isChecked()
+        if visible and self.teclado_layout.count() == 0:
+            self.init_teclado()
         self.teclado_widget.setVisible(visible)
         self.btn_teclado.setText("🧮 Ocultar Teclado" if visible else "🧮 Mostrar Teclado")
         
@@ -318,10 +318,10 @@ class GeoGebraApp(QMainWindow):
         self.fig.tight_layout()
 
     def actualizar_grafico(self):
-        self.configurar_grafico()
-        colores = plt.cm.tab10.colors
-        xlim = self.ax.get_xlim()
-        ylim = self.ax.get_ylim()
+        """Pide un nuevo cálculo de las curvas; el dibujo llega en dibujar_trazos."""
+        instrumentos.nuevo_cuadro()
+        colores = COLORES
+        pendientes = []
         for i, entrada in enumerate(self.entradas):
             color = colores[i % len(colores)]
             if entrada.visible:
@@ -337,121 +337,142 @@ class GeoGebraApp(QMainWindow):
             texto = entrada.entrada.text().replace(' ', '')
             if not texto:
                 continue
-            try:
-                x_latex = 0
-                y_latex = 1.2 * (i + 1)
-                if texto.startswith('y='):
-                    expr = sympify(texto[2:])
-                    f = lambdify(x, expr, 'numpy')
-                    x_vals = np.linspace(xlim[0], xlim[1], 400)
-                    y_vals = f(x_vals)
-                    self.ax.plot(x_vals, y_vals, color=color, linewidth=2)
-                    self.ax.annotate(
-                        f"${latex(Eq(y, expr))}$",
-                        xy=(x_latex, y_latex),
-                        xytext=(10, 0),
-                        textcoords='offset points',
-                        fontsize=14,
-                        color=color,
-                        va='bottom',
-                        bbox=dict(boxstyle="round,pad=0.2", fc="white", ec=color, lw=1, alpha=0.7)
-                    )
-                elif texto.startswith('x='):
-                    expr = sympify(texto[2:])
-                    f = lambdify(y, expr, 'numpy')
-                    y_vals = np.linspace(ylim[0], ylim[1], 400)
-                    x_vals = f(y_vals)
-                    self.ax.plot(x_vals, y_vals, color=color, linewidth=2)
-                    self.ax.annotate(
-                        f"${latex(Eq(x, expr))}$",
-                        xy=(x_latex, y_latex),
-                        xytext=(10, 0),
-                        textcoords='offset points',
-                        fontsize=14,
-                        color=color,
-                        va='bottom',
-                        bbox=dict(boxstyle="round,pad=0.2", fc="white", ec=color, lw=1, alpha=0.7)
-                    )
-                elif '=' in texto:
-                    izquierda, derecha = texto.split('=')
-                    eq = Eq(sympify(izquierda), sympify(derecha))
-                    try:
-                        solucion = solve(eq, y)
-                        if solucion:
-                            expr = solucion[0]
-                            f = lambdify(x, expr, 'numpy')
-                            x_vals = np.linspace(xlim[0], xlim[1], 400)
-                            y_vals = f(x_vals)
-                            self.ax.plot(x_vals, y_vals, color=color, linewidth=2)
-                            self.ax.annotate(
-                                f"${latex(Eq(y, expr))}$",
-                                xy=(x_latex, y_latex),
-                                xytext=(10, 0),
-                                textcoords='offset points',
-                                fontsize=14,
-                                color=color,
-                                va='bottom',
-                                bbox=dict(boxstyle="round,pad=0.2", fc="white", ec=color, lw=1, alpha=0.7)
-                            )
-                            continue
-                    except Exception:
-                        pass
-                    try:
-                        solucion = solve(eq, x)
-                        if solucion:
-                            expr = solucion[0]
-                            f = lambdify(y, expr, 'numpy')
-                            y_vals = np.linspace(ylim[0], ylim[1], 400)
-                            x_vals = f(y_vals)
-                            self.ax.plot(x_vals, y_vals, color=color, linewidth=2)
-                            self.ax.annotate(
-                                f"${latex(Eq(x, expr))}$",
-                                xy=(x_latex, y_latex),
-                                xytext=(10, 0),
-                                textcoords='offset points',
-                                fontsize=14,
-                                color=color,
-                                va='bottom',
-                                bbox=dict(boxstyle="round,pad=0.2", fc="white", ec=color, lw=1, alpha=0.7)
-                            )
-                            continue
-                    except Exception:
-                        pass
-                    continue
-                else:
-                    expr = sympify(texto)
-                    f = lambdify(x, expr, 'numpy')
-                    x_vals = np.linspace(xlim[0], xlim[1], 400)
-                    y_vals = f(x_vals)
-                    self.ax.plot(x_vals, y_vals, color=color, linewidth=2)
-                    self.ax.annotate(
-                        f"${latex(Eq(y, expr))}$",
-                        xy=(x_latex, y_latex),
-                        xytext=(10, 0),
-                        textcoords='offset points',
-                        fontsize=14,
-                        color=color,
-                        va='bottom',
-                        bbox=dict(boxstyle="round,pad=0.2", fc="white", ec=color, lw=1, alpha=0.7)
-                    )
-            except Exception as e:
-                print(f"Error graficando {entrada.nombre}: {str(e)}")
+            pendientes.append((i, texto))
+        if self.ax is None:
+            # cargar_grafico volverá a llamar cuando exista la figura
+            return
+        # Tamaño del área de ejes en píxeles, para ajustar el muestreo
+        tamano_px = (self.ax.bbox.width, self.ax.bbox.height)
+        self.planificador.solicitar(pendientes, self.ax.get_xlim(), self.ax.get_ylim(), tamano_px)
+
+    def dibujar_trazos(self, resultados):
+        """Actualiza en el hilo de la interfaz solo las curvas que cambiaron."""
+        with instrumentos.captura('artistas'):
+            self._dibujar_trazos(resultados)
+        self.canvas.draw_idle()
+
+    def _dibujar_trazos(self, resultados):
+        from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+        colores = COLORES
+        vigentes = set()
+        cambio_funciones = False
+        for i, trazo, error in resultados:
+            if error is not None:
+                registro.warning("Error graficando %s: %s", self.entradas[i].nombre, error)
                 continue
-        self.canvas.draw()
+            if trazo is None:
+                continue
+            vigentes.add(i)
+            color = colores[i % len(colores)]
+            if i in self.artistas:
+                linea, anotacion = self.artistas[i]
+                linea.set_data(trazo.x, trazo.y)
+                if self.etiquetas[i] != trazo.latex:
+                    anotacion.offsetbox.set_data(self.imagen_etiqueta(trazo.latex, color))
+                    self.etiquetas[i] = trazo.latex
+                    cambio_funciones = True
+                continue
+            x_latex = 0
+            y_latex = 1.2 * (i + 1)
+            linea, = self.ax.plot(trazo.x, trazo.y, color=color, linewidth=2)
+            # Etiqueta LaTeX ya rasterizada (caché), en vez de texto que se recompone al dibujar
+            imagen = OffsetImage(self.imagen_etiqueta(trazo.latex, color), zoom=72 / self.fig.dpi)
+            anotacion = AnnotationBbox(
+                imagen,
+                (x_latex, y_latex),
+                xybox=(10, 0),
+                boxcoords='offset points',
+                box_alignment=(0, 0),
+                frameon=False
+            )
+            self.ax.add_artist(anotacion)
+            self.artistas[i] = (linea, anotacion)
+            self.etiquetas[i] = trazo.latex
+            cambio_funciones = True
+        # Entradas ocultas, vacías o con error
+        for i in list(self.artistas):
+            if i not in vigentes:
+                for artista in self.artistas.pop(i):
+                    artista.remove()
+                del self.etiquetas[i]
+                cambio_funciones = True
+        # El área sombreada deja de ser válida si cambian las funciones
+        if cambio_funciones:
+            self.quitar_area()
+
+    def alternar_tiempos(self):
+        barra = self.statusBar()
+        barra.setVisible(not barra.isVisible())
+        self.mostrar_tiempos()
+
+    def alternar_perfil(self):
+        instrumentos.activar_perfil(not instrumentos.perfil_activo())
+        self.statusBar().showMessage(
+            "Perfil activado" if instrumentos.perfil_activo() else "Perfil desactivado", 2000)
+
+    def mostrar_tiempos(self):
+        """Muestra el desglose del cuadro en curso (lo llama el lienzo después de dibujar)."""
+        resumen = instrumentos.resumen_cuadro()
+        registro.debug("Cuadro: %s", resumen)
+        if self.statusBar().isVisible():
+            self.statusBar().showMessage(resumen)
+
+    def imagen_etiqueta(self, codigo, color):
+        """Imagen RGBA de la etiqueta de una curva, con el recuadro redondeado."""
+        recuadro = (('boxstyle', "round,pad=0.2"), ('fc', "white"), ('ec', color), ('lw', 1), ('alpha', 0.7))
+        return imagen_latex(codigo, 14, self.fig.dpi, color, recuadro)
+
+    def quitar_area(self):
+        for artista in self.artistas_area:
+            artista.remove()
+        self.artistas_area = []
+
+    def modo_doble(self):
+        return self.combo_modo.currentIndex() == 1
+
+    def cambiar_modo(self):
+        """Muestra el campo del integrando y los métodos que corresponden al modo."""
+        self.integrando.setVisible(self.modo_doble())
+        self.combo_metodo.clear()
+        for nombre, texto in (NOMBRES_CUBATURA if self.modo_doble() else NOMBRES).items():
+            self.combo_metodo.addItem(texto, nombre)
+        if not self.modo_doble():
+            # Alta precisión con mpmath: (biblioteca, método)
+            self.combo_metodo.addItem("tanh-sinh (mpmath, alta precisión)", ('mpmath', 'tanh_sinh'))
+            self.combo_metodo.addItem("Gauss–Legendre (mpmath, alta precisión)", ('mpmath', 'gauss_legendre'))
+
+    def integral_en_region(self, integrando, curvas, a, b, puntos, metodo):
+        """∬ integrando dA entre la más baja y la más alta de las curvas, tramo a tramo entre los cortes."""
+        from areas import envolventes
+        bordes = [a] + list(puntos) + [b]
+        valores, errores = [], []
+        for izq, der in zip(bordes[:-1], bordes[1:]):
+            valor, error, _ = integral_doble(integrando, izq, der,
+                                             lambda x: envolventes(curvas, x)[0],
+                                             lambda x: envolventes(curvas, x)[1], metodo)
+            valores.append(valor)
+            errores.append(error)
+        return sum(valores), sum(errores)
 
     def calcular_area(self):
-        if len(self.entradas) < 1:
-            self.resultado.setText("Ingresa al menos una función.")
+        from trazado import funcion_explicita
+        # Solo las curvas visibles de la forma y = f(x)
+        textos = [t for t in (funcion_explicita(e.entrada.text()) for e in self.entradas if e.visible) if t]
+        if len(textos) < 1:
+            self.resultado.setText("Ingresa al menos una función visible y = f(x).")
+            return
+        if self.ax is None:
+            self.resultado.setText("El gráfico todavía se está cargando.")
             return
+        from areas import cortes, envolventes
+        from precision import limite_numerico
 
+        instrumentos.nuevo_cuadro()
         try:
-            expr1 = sympify(self.entradas[0].entrada.text())
-            f1 = lambdify(x, expr1, 'numpy')
-
-            # Toma los límites de los campos de entrada
+            # Toma los límites de los campos de entrada ('1/3' o 'pi' también valen)
             try:
-                a = float(self.limite_inf.text())
-                b = float(self.limite_sup.text())
+                a = limite_numerico(self.limite_inf.text())
+                b = limite_numerico(self.limite_sup.text())
             except Exception:
                 self.resultado.setText("Límites inválidos.")
                 return
@@ -460,63 +481,76 @@ class GeoGebraApp(QMainWindow):
                 self.resultado.setText("El límite inferior debe ser menor que el superior.")
                 return
 
-            # Método de Simpson para integración numérica
-            def simpson_integration(f, a, b, n=1000):
-                if n % 2 != 0:
-                    n += 1
-                h = (b - a) / n
-                x_vals = np.linspace(a, b, n+1)
-                y_vals = f(x_vals)
-                integral = h/3 * np.sum(y_vals[0:-1:2] + 4*y_vals[1::2] + y_vals[2::2])
-                return integral
-
-            if len(self.entradas) == 1:
+            metodo = self.combo_metodo.currentData()
+            integrando = self.integrando.text().strip()
+            if self.modo_doble() and not integrando:
+                self.resultado.setText("Ingresa el integrando g(x, y).")
+                return
+            self.quitar_area()
+            etiqueta = "\\text{Área}"
+            if self.modo_doble():
+                # ∬ g dA entre la curva más alta y la más baja (o entre f y el eje x)
+                curvas = textos if len(textos) > 1 else [textos[0], '0']
+                puntos, _ = cortes(curvas, a, b)
+                with instrumentos.captura('integral_doble'):
+                    area, error = self.integral_en_region(integrando, curvas, a, b, puntos, metodo)
+                etiqueta = "\\iint g\\,dA"
+            elif isinstance(metodo, tuple):
+                # Alta precisión: límites tal como se escribieron, sin pasar por float
+                from precision import area_precisa, integral_precisa, texto, DPS
+                with instrumentos.captura('area'):
+                    if len(textos) == 1:
+                        preciso = integral_precisa(textos[0], self.limite_inf.text(), self.limite_sup.text(),
+                                                   DPS, metodo[1])
+                        curvas = [textos[0], '0']
+                        puntos, _ = cortes(curvas, a, b)
+                    else:
+                        preciso, puntos = area_precisa(textos, self.limite_inf.text(), self.limite_sup.text(),
+                                                       DPS, metodo[1])
+                        curvas = textos
+                area, error = float(preciso.valor), float(preciso.error)
+            elif len(textos) == 1:
                 # Área bajo la curva respecto al eje x
-                area = simpson_integration(f1, a, b)
-                self.resultado.setText("")
-                x_fill = np.linspace(a, b, 100)
-                self.ax.fill_between(x_fill, f1(x_fill), 0,
-                                     color='red', alpha=0.3)
-                area_latex = f"$\\text{{Área}} = {area:.6f}$"
-                self.ax.annotate(
-                    area_latex,
-                    xy=(0.98, 0.98),
-                    xycoords='axes fraction',
-                    fontsize=16,
-                    color='red',
-                    ha='right',
-                    va='top',
-                    bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="red", lw=1, alpha=0.8)
-                )
+                with instrumentos.captura('area'):
+                    area, error, _ = area_entre_curvas(textos[0], None, a, b, metodo, TRABAJADORES)
+                curvas = [textos[0], '0']
+                puntos, _ = cortes(curvas, a, b)
             else:
-                expr2 = sympify(self.entradas[1].entrada.text())
-                f2 = lambdify(x, expr2, 'numpy')
-                h = lambda x: np.abs(f1(x) - f2(x))
-                area = simpson_integration(h, a, b)
-                self.resultado.setText("")
-                x_fill = np.linspace(a, b, 100)
-                self.ax.fill_between(x_fill, f1(x_fill), f2(x_fill),
-                                     where=(f1(x_fill) > f2(x_fill)),
-                                     color='red', alpha=0.3)
-                area_latex = f"$\\text{{Área}} = {area:.6f}$"
-                self.ax.annotate(
-                    area_latex,
-                    xy=(0.98, 0.98),
-                    xycoords='axes fraction',
-                    fontsize=16,
-                    color='red',
-                    ha='right',
-                    va='top',
-                    bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="red", lw=1, alpha=0.8)
-                )
-
-            self.canvas.draw()
+                # Región entre la curva más alta y la más baja, tramo a tramo entre los cortes
+                with instrumentos.captura('area'):
+                    area, error, _, puntos = area_entre_funciones(textos, a, b, metodo, TRABAJADORES)
+                curvas = textos
+            if isinstance(metodo, tuple):
+                self.resultado.setText(f"Área = {texto(preciso.valor, DPS)}\n({preciso.metodo}, {DPS} dígitos)")
+            else:
+                self.resultado.setText(f"Error estimado: {error:.1e}")
+
+            # Sombreado con un punto por píxel más los cortes, para que cierre en cada cruce
+            x_fill = np.union1d(np.linspace(a, b, max(int(self.ax.bbox.width), 2)), puntos)
+            inferior, superior = envolventes(curvas, x_fill)
+            relleno = self.ax.fill_between(x_fill, inferior, superior, color='red', alpha=0.3)
+            area_latex = f"${etiqueta} = {area:.6f}$"
+            anotacion = self.ax.annotate(
+                area_latex,
+                xy=(0.98, 0.98),
+                xycoords='axes fraction',
+                fontsize=16,
+                color='red',
+                ha='right',
+                va='top',
+                bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="red", lw=1, alpha=0.8)
+            )
+
+            self.artistas_area = [relleno, anotacion]
+            self.canvas.draw_idle()
 
         except Exception as e:
             self.resultado.setText(f"Error: {str(e)}")
 
-        
- 
+    def closeEvent(self, event):
+        self.planificador.detener()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     import sys